@@ -0,0 +1,120 @@
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from core.models import TokenUser, User, token_version_cache_key
+
+ROLE_CLAIM = "role"
+IS_STAFF_CLAIM = "is_staff"
+TOKEN_VERSION_CLAIM = "uv"
+
+
+def add_user_claims(token, user):
+    """Embed what permission checks need so requests can skip the user lookup"""
+    token[ROLE_CLAIM] = user.role
+    token[IS_STAFF_CLAIM] = user.is_staff
+    token[TOKEN_VERSION_CLAIM] = user.token_version
+    return token
+
+
+def get_token_version(user_id):
+    """Current token version of a user, cached; None if the user is gone"""
+    key = token_version_cache_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            User.objects.filter(pk=user_id)
+            .values_list("token_version", flat=True)
+            .first()
+        )
+        if version is not None:
+            cache.set(key, version, timeout=settings.USER_TOKEN_VERSION_CACHE_TIMEOUT)
+    return version
+
+
+async def aget_token_version(user_id):
+    """Async variant of ``get_token_version``"""
+    key = token_version_cache_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = await (
+            User.objects.filter(pk=user_id)
+            .values_list("token_version", flat=True)
+            .afirst()
+        )
+        if version is not None:
+            await cache.aset(
+                key, version, timeout=settings.USER_TOKEN_VERSION_CACHE_TIMEOUT
+            )
+    return version
+
+
+def check_token_version(user_id, token_version):
+    verify_token_version(get_token_version(user_id), token_version)
+
+
+async def acheck_token_version(user_id, token_version):
+    verify_token_version(await aget_token_version(user_id), token_version)
+
+
+def verify_token_version(current, token_version):
+    if current is None:
+        raise AuthenticationFailed("User not found", code="user_not_found")
+    if current != token_version:
+        raise AuthenticationFailed(
+            "Token is stale, please log in again", code="token_stale"
+        )
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that builds the user from token claims.
+
+    Tokens carry the user's role, staff flag and token version, so the request
+    user is a ``TokenUser`` that only queries the database when a view reads
+    another column. The version is checked against a short-lived cache to
+    reject tokens issued before the user's role, staff flag or password
+    changed. Tokens without the claims fall back to the regular lookup.
+    """
+
+    def get_user(self, validated_token):
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return super().get_user(validated_token)
+
+        user_id, role, is_staff = self.get_claims(validated_token)
+        check_token_version(user_id, validated_token[TOKEN_VERSION_CLAIM])
+        return TokenUser.from_claims(user_id, role, is_staff)
+
+    async def aauthenticate(self, request):
+        """Async variant of ``authenticate`` for async views"""
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        return await self.aget_user(validated_token), validated_token
+
+    async def aget_user(self, validated_token):
+        if TOKEN_VERSION_CLAIM not in validated_token:
+            return await sync_to_async(super().get_user)(validated_token)
+
+        user_id, role, is_staff = self.get_claims(validated_token)
+        await acheck_token_version(user_id, validated_token[TOKEN_VERSION_CLAIM])
+        return TokenUser.from_claims(user_id, role, is_staff)
+
+    def get_claims(self, validated_token):
+        try:
+            return (
+                validated_token[api_settings.USER_ID_CLAIM],
+                validated_token[ROLE_CLAIM],
+                validated_token[IS_STAFF_CLAIM],
+            )
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
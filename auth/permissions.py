@@ -24,4 +24,25 @@ class IsRecruiterOrCandidateOrAdmin(BasePermission):
         if user.role == UserRole.CANDIDATE:
             return obj == user
         
-        return False
\ No newline at end of file
+        return False
+
+class AsyncPermissionMixin:
+    """Awaitable permission checks for async views, role checks only read token claims"""
+
+    async def ahas_permission(self, request, view):
+        return self.has_permission(request, view)
+
+    async def ahas_object_permission(self, request, view, obj):
+        return self.has_object_permission(request, view, obj)
+
+
+class AsyncIsRecruiter(AsyncPermissionMixin, IsRecruiter):
+    pass
+
+
+class AsyncIsCandidate(AsyncPermissionMixin, IsCandidate):
+    pass
+
+
+class AsyncIsRecruiterOrCandidateOrAdmin(AsyncPermissionMixin, IsRecruiterOrCandidateOrAdmin):
+    pass
@@ -0,0 +1,40 @@
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.serializers import (
+    TokenObtainPairSerializer,
+    TokenRefreshSerializer,
+)
+from rest_framework_simplejwt.settings import api_settings
+
+from auth.authentication import (
+    TOKEN_VERSION_CLAIM,
+    add_user_claims,
+    check_token_version,
+)
+
+
+class UserClaimsTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Issue tokens that carry role, staff flag and token version"""
+
+    @classmethod
+    def get_token(cls, user):
+        return add_user_claims(super().get_token(user), user)
+
+
+class UserClaimsTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuse to refresh tokens issued before the user's token version changed.
+
+    The new access token takes its claims from the user row rather than from
+    the refresh token, so tokens issued before the claims existed get them.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        if TOKEN_VERSION_CLAIM in refresh.payload:
+            check_token_version(user_id, refresh.payload[TOKEN_VERSION_CLAIM])
+
+        data = super().validate(attrs)
+        user = get_user_model().objects.get(**{api_settings.USER_ID_FIELD: user_id})
+        data["access"] = str(add_user_claims(refresh.access_token, user))
+        return data
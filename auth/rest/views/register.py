@@ -1,8 +1,7 @@
 import logging
 
-from django.conf import settings
 from django.contrib.auth.tokens import default_token_generator
-from django.core.mail import send_mail
+from django.db import transaction
 from django.utils.encoding import force_bytes, force_str
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from drf_yasg import openapi
@@ -18,16 +17,29 @@ from auth.rest.serializers.register import (
     ResetPasswordSerializer,
     UserRegisterSerializer,
 )
+from core.idempotency import IdempotencyMixin
 from core.models import User
+from core.outbox import queue_email
 
 logger = logging.getLogger(__name__)
 
 
-class UserRegisterView(viewsets.ModelViewSet):
+class UserRegisterView(IdempotencyMixin, viewsets.ModelViewSet):
     """User registration view"""
 
     queryset = User.objects.order_by("id")
     serializer_class = UserRegisterSerializer
+    # Worst case queries per action with a cold cache, an Idempotency-Key and
+    # session authentication, checked by shared.query_budget.QueryBudgetMiddleware.
+    # Deleting a recruiter cascades to their jobs, applications and stats
+    query_budgets = {
+        "list": 4,
+        "retrieve": 3,
+        "create": 9,
+        "update": 6,
+        "partial_update": 6,
+        "destroy": 19,
+    }
 
     def get_permissions(self):
         """Assign permission based on action"""
@@ -46,29 +58,26 @@ class UserRegisterView(viewsets.ModelViewSet):
         user = self.request.user
         qs = super().get_queryset()
         if not user.is_staff:
-            qs = qs.filter(email=user.email)
+            qs = qs.filter(pk=user.pk)
         return qs
 
     def perform_create(self, serializer):
-        """Create user and send welcome mail"""
-        try:
+        """Create user and queue the welcome mail in the same transaction"""
+        with transaction.atomic():
             user = serializer.save()
 
-            send_mail(
+            queue_email(
                 subject="Welcome to our site!",
                 message=f"Hi {user.first_name},\n\nThanks for registering",
-                from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[user.email],
-                fail_silently=False,
             )
-        except Exception as e:
-            logger.exception(f"Failed to send email during registration: {str(e)}")
 
 
-class ForgetPasswordAPIView(APIView):
+class ForgetPasswordAPIView(IdempotencyMixin, APIView):
     """Send password reset link to user's email"""
 
     permission_classes = [IsRecruiterOrCandidateOrAdmin]
+    query_budgets = {"post": 6}
 
     @swagger_auto_schema(request_body=ForgetPasswordSerializer)
     def post(self, request):
@@ -84,10 +93,9 @@ class ForgetPasswordAPIView(APIView):
 
             reset_url = f"http://127.0.0.1:8000/api/v1/auth/password/reset-password/?uid={uid}&token={token}"
 
-            send_mail(
+            queue_email(
                 subject="Reset your password",
                 message=f"Click the link to reset password => {reset_url}",
-                from_email=settings.DEFAULT_FROM_EMAIL,
                 recipient_list=[user.email],
             )
             return Response(
@@ -107,9 +115,11 @@ class ForgetPasswordAPIView(APIView):
             )
 
 
-class ResetPasswordAPIView(APIView):
+class ResetPasswordAPIView(IdempotencyMixin, APIView):
     """Reset user password using token and uid"""
 
+    query_budgets = {"post": 4}
+
     @swagger_auto_schema(
         request_body=ResetPasswordSerializer,
         manual_parameters=[
@@ -0,0 +1,128 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from auth.authentication import ROLE_CLAIM, TOKEN_VERSION_CLAIM
+from auth.rest.serializers.token import UserClaimsTokenObtainPairSerializer
+from core.choices import UserRole
+from core.models import User
+from job.tests.utils import FAST_PASSWORD_HASHERS, JOB_PREFIX, create_user
+from shared.choices import StatusChoices
+
+TOKEN_URL = "/api/v1/auth/token/"
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class TokenClaimsAuthenticationTests(TestCase):
+    """Requests are authenticated from token claims, checked against a version"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = create_user("candidate")
+        self.tokens = UserClaimsTokenObtainPairSerializer.get_token(self.user)
+
+    def get(self, access=None, url=f"{JOB_PREFIX}application/mine/"):
+        access = access or self.tokens.access_token
+        return self.client.get(url, headers={"authorization": f"Bearer {access}"})
+
+    def refresh(self, refresh=None):
+        return self.client.post(
+            f"{TOKEN_URL}/refresh",
+            {"refresh": str(refresh or self.tokens)},
+            content_type="application/json",
+        )
+
+    def change_user(self, **fields):
+        user = User.objects.get(pk=self.user.pk)
+        for name, value in fields.items():
+            setattr(user, name, value)
+        with self.captureOnCommitCallbacks(execute=True):
+            user.save()
+        return user
+
+    def get_user_queries(self, queries):
+        return [q["sql"] for q in queries if 'FROM "core_user"' in q["sql"]]
+
+    def assertStale(self, response):
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data["code"], "token_stale")
+
+    def test_views_skip_the_user_lookup(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get().status_code, 200)
+        # Only the token version is read, and only until it is cached
+        (query,) = self.get_user_queries(queries)
+        self.assertIn('SELECT "core_user"."token_version"', query)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.get().status_code, 200)
+        self.assertEqual(self.get_user_queries(queries), [])
+
+    def test_permissions_use_the_role_claim(self):
+        response = self.get(url=f"{JOB_PREFIX}application/")
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_changes_make_old_tokens_stale(self):
+        for fields in [
+            {"new_password": "N3w-passw0rd"},
+            {"role": UserRole.RECRUITER},
+            {"is_staff": True},
+            {"status": StatusChoices.INACTIVE},
+        ]:
+            with self.subTest(fields=list(fields)):
+                self.get()
+                self.change_user(**fields)
+
+                self.assertStale(self.get())
+                self.assertStale(self.refresh())
+
+                self.tokens = UserClaimsTokenObtainPairSerializer.get_token(
+                    User.objects.get(pk=self.user.pk)
+                )
+
+    def test_other_changes_keep_tokens_valid(self):
+        self.change_user(first_name="Renamed", phone="12345")
+
+        self.assertEqual(self.get().status_code, 200)
+
+    def test_deleted_user_is_rejected(self):
+        self.get()
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.filter(pk=self.user.pk).delete()
+        cache.clear()
+
+        response = self.get()
+
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.data["code"], "user_not_found")
+
+    def test_login_and_refresh_carry_the_current_claims(self):
+        self.change_user(role=UserRole.RECRUITER)
+        response = self.client.post(
+            TOKEN_URL,
+            {"email": self.user.email, "password": "Str0ng-passw0rd"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+
+        response = self.refresh(response.data["refresh"])
+
+        self.assertEqual(response.status_code, 200, response.data)
+        access = AccessToken(response.data["access"])
+        self.assertEqual(access[ROLE_CLAIM], UserRole.RECRUITER)
+        self.assertEqual(access[TOKEN_VERSION_CLAIM], 1)
+        self.assertEqual(self.get(access, f"{JOB_PREFIX}application/").status_code, 200)
+
+    def test_refresh_adds_claims_to_tokens_issued_without_them(self):
+        legacy = RefreshToken.for_user(self.user)
+        self.assertNotIn(ROLE_CLAIM, legacy.access_token)
+
+        response = self.refresh(legacy)
+
+        self.assertEqual(response.status_code, 200, response.data)
+        access = AccessToken(response.data["access"])
+        self.assertEqual(access[ROLE_CLAIM], UserRole.CANDIDATE)
+        self.assertEqual(access[TOKEN_VERSION_CLAIM], 0)
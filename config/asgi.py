@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Read by settings to turn off persistent database connections
+os.environ.setdefault('DJANGO_ASGI', 'True')
 
 application = get_asgi_application()
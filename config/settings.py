@@ -14,7 +14,7 @@ import os
 
 from pathlib import Path
 from datetime import timedelta
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -58,6 +58,7 @@ INSTALLED_APPS = DEFAULT_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 AUTH_USER_MODEL = "core.User"
 
 MIDDLEWARE = [
+    "shared.profiling.ProfilingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -65,9 +66,38 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "silk.middleware.SilkyMiddleware",
 ]
 
+# Silk records every request and query in the database, enable it only for
+# ad-hoc debugging
+SILK_ENABLED = config("SILK_ENABLED", default=False, cast=bool)
+if SILK_ENABLED:
+    MIDDLEWARE.append("silk.middleware.SilkyMiddleware")
+
+# Query budgets: count the queries of each request and check them against the
+# query_budgets of its view, logging overruns or raising when QUERY_BUDGET_RAISE
+QUERY_BUDGET_ENABLED = config("QUERY_BUDGET_ENABLED", default=False, cast=bool)
+QUERY_BUDGET_RAISE = config("QUERY_BUDGET_RAISE", default=False, cast=bool)
+if QUERY_BUDGET_ENABLED:
+    MIDDLEWARE.append("shared.query_budget.QueryBudgetMiddleware")
+
+# Request profiling: every request is timed for /metrics, a sampled share also
+# has its SQL counted, and requests slower than the threshold are kept in a
+# ring buffer of PROFILING_SLOW_REQUEST_LIMIT entries
+PROFILING_SAMPLE_RATE = config("PROFILING_SAMPLE_RATE", default=0.1, cast=float)
+PROFILING_SLOW_REQUEST_MS = config("PROFILING_SLOW_REQUEST_MS", default=500, cast=int)
+PROFILING_SLOW_REQUEST_LIMIT = config(
+    "PROFILING_SLOW_REQUEST_LIMIT", default=100, cast=int
+)
+PROFILING_LATENCY_BUCKETS = config(
+    "PROFILING_LATENCY_BUCKETS",
+    default="0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10",
+    cast=Csv(float),
+)
+# /metrics is open to staff sessions, and to "Authorization: Bearer <token>"
+# when a token is set
+PROFILING_METRICS_TOKEN = config("PROFILING_METRICS_TOKEN", default="")
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -91,13 +121,90 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# Set by config/asgi.py. Under ASGI, sync code runs in per-request executor
+# threads and a persistent connection would stay open with its thread, so
+# connections are only reused across requests under WSGI by default
+DJANGO_ASGI = config("DJANGO_ASGI", default=False, cast=bool)
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": config(
+            "DATABASE_CONN_MAX_AGE", default=0 if DJANGO_ASGI else 60, cast=int
+        ),
+        "CONN_HEALTH_CHECKS": True,
+        # On disk rather than in memory: a shared in-memory database fails
+        # concurrent writers with "table is locked" instead of waiting for
+        # the busy timeout, unlike the real database
+        "TEST": {"NAME": BASE_DIR / "test_db.sqlite3"},
+    }
+}
+
+# SQLite pragmas applied to every new connection by core.signals. WAL lets
+# readers run alongside the single writer, synchronous=NORMAL is durable
+# against application crashes in WAL mode, and the cache size is in KiB
+SQLITE_JOURNAL_MODE = config("SQLITE_JOURNAL_MODE", default="WAL")
+SQLITE_SYNCHRONOUS = config("SQLITE_SYNCHRONOUS", default="NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = config("SQLITE_BUSY_TIMEOUT_MS", default=5000, cast=int)
+SQLITE_CACHE_SIZE_KB = config("SQLITE_CACHE_SIZE_KB", default=65536, cast=int)
+SQLITE_MMAP_SIZE = config("SQLITE_MMAP_SIZE", default=268435456, cast=int)
+
+# Read replica: safe requests read jobs, applications and dashboard stats from
+# DATABASE_READ_ALIAS. A request that writes stays on the primary, and so does
+# the same user for READ_YOUR_WRITES_SECONDS, longer than the replication lag
+DATABASE_READ_ALIAS = config("DATABASE_READ_ALIAS", default="replica")
+DATABASE_REPLICA_NAME = config("DATABASE_REPLICA_NAME", default="")
+READ_YOUR_WRITES_SECONDS = config("READ_YOUR_WRITES_SECONDS", default=10, cast=int)
+if DATABASE_REPLICA_NAME:
+    DATABASES[DATABASE_READ_ALIAS] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": DATABASE_REPLICA_NAME,
+        "CONN_MAX_AGE": DATABASES["default"]["CONN_MAX_AGE"],
+        "CONN_HEALTH_CHECKS": True,
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_ROUTERS = ["shared.db_router.ReadReplicaRouter"]
+    MIDDLEWARE.insert(1, "shared.db_router.ReadReplicaMiddleware")
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="jobsite"),
     }
 }
 
+# Seconds a cached job list page is kept, entries are invalidated by version
+JOB_LIST_CACHE_TIMEOUT = config("JOB_LIST_CACHE_TIMEOUT", default=300, cast=int)
+
+# Bulk job creation: rows per INSERT and maximum jobs per request
+JOB_BULK_CREATE_BATCH_SIZE = config("JOB_BULK_CREATE_BATCH_SIZE", default=200, cast=int)
+JOB_BULK_CREATE_MAX_ITEMS = config("JOB_BULK_CREATE_MAX_ITEMS", default=1000, cast=int)
+
+# Where per-row error reports of job file imports are kept for download
+JOB_IMPORT_REPORT_DIR = config(
+    "JOB_IMPORT_REPORT_DIR", default=os.path.join(BASE_DIR, "job_imports")
+)
+# Days error reports are kept before purge_job_import_reports deletes them
+JOB_IMPORT_REPORT_RETENTION_DAYS = config(
+    "JOB_IMPORT_REPORT_RETENTION_DAYS", default=7, cast=int
+)
+# Seconds the Idempotency-Key of an import stays locked, longer than the
+# slowest import so a retry can't run it a second time
+JOB_IMPORT_IDEMPOTENCY_LOCK_TIMEOUT = config(
+    "JOB_IMPORT_IDEMPOTENCY_LOCK_TIMEOUT", default=3600, cast=int
+)
+
+# Rows fetched per database round trip when streaming application exports
+APPLICATION_EXPORT_CHUNK_SIZE = config(
+    "APPLICATION_EXPORT_CHUNK_SIZE", default=2000, cast=int
+)
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -146,7 +253,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Settings for Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "auth.authentication.ClaimsJWTAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
@@ -157,8 +264,21 @@ REST_FRAMEWORK = {
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=60),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=60),
+    "TOKEN_OBTAIN_SERIALIZER": "auth.rest.serializers.token.UserClaimsTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "auth.rest.serializers.token.UserClaimsTokenRefreshSerializer",
 }
 
+# Seconds a user's token version is cached by ClaimsJWTAuthentication, this is
+# how long a stale token may still be accepted by other processes
+USER_TOKEN_VERSION_CACHE_TIMEOUT = config(
+    "USER_TOKEN_VERSION_CACHE_TIMEOUT", default=60, cast=int
+)
+
+# Seconds a response stored for an Idempotency-Key is replayed to retries, and
+# how long a key stays locked by a request that never finished
+IDEMPOTENCY_KEY_TTL = config("IDEMPOTENCY_KEY_TTL", default=86400, cast=int)
+IDEMPOTENCY_LOCK_TIMEOUT = config("IDEMPOTENCY_LOCK_TIMEOUT", default=60, cast=int)
+
 # Swagger settings
 ENABLE_SWAGGER = True
 
@@ -190,3 +310,6 @@ EMAIL_USE_TLS = config("EMAIL_USE_TLS", cast=bool)
 EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL")
+
+# Days sent outbox emails are kept before purge_outbox_emails deletes them
+OUTBOX_SENT_RETENTION_DAYS = config("OUTBOX_SENT_RETENTION_DAYS", default=7, cast=int)
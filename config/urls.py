@@ -8,6 +8,8 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from shared.profiling import metrics_view, slow_requests_view
+
 schema_view = get_schema_view(
     openapi.Info(
         title="Junior Backend Developer Project Task",
@@ -115,10 +117,14 @@ urlpatterns = [
     # Authentication related URLs
     path("api/v1/auth/", include("auth.rest.urls")),
     path("api/v1/job-info/", include("job.rest.urls")),
+    # Request profiling
+    path("metrics", metrics_view, name="metrics"),
+    path("metrics/slow-requests", slow_requests_view, name="slow-requests"),
 ]
 
 # Add silk profiler urls
-urlpatterns += [path("silk/", include("silk.urls", namespace="silk"))]
+if settings.SILK_ENABLED:
+    urlpatterns += [path("silk/", include("silk.urls", namespace="silk"))]
 
 # Serve media files during development
 if settings.DEBUG:
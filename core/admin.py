@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from core.models import User, UserProfile
+from core.models import IdempotencyRecord, OutboxEmail, User, UserProfile
 
 from shared.base_admin import BaseModelAdmin
 
@@ -55,3 +55,41 @@ class UserProfileAdmin(BaseModelAdmin):
         "date_of_birth",
         "gender",
     ]
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    model = OutboxEmail
+    list_display = [
+        "recipient",
+        "subject",
+        "status",
+        "attempts",
+        "available_at",
+        "sent_at",
+    ]
+    list_filter = [
+        "status",
+        "created_at",
+    ]
+    search_fields = ("recipient", "subject")
+    readonly_fields = [
+        "claim_token",
+        "created_at",
+        "sent_at",
+    ]
+    show_full_result_count = False
+    ordering = ("-created_at",)
+
+
+@admin.register(IdempotencyRecord)
+class IdempotencyRecordAdmin(admin.ModelAdmin):
+    model = IdempotencyRecord
+    list_display = [
+        "key",
+        "status_code",
+        "expires_at",
+    ]
+    search_fields = ("key",)
+    show_full_result_count = False
+    ordering = ("-expires_at",)
@@ -12,3 +12,8 @@ class UserRole(models.TextChoices):
     RECRUITER = "RECRUITER", "Recruiter"
     CANDIDATE = "CANDIDATE", "Candidate"
 
+
+class EmailStatus(models.TextChoices):
+    PENDING = "PENDING", "Pending"
+    SENT = "SENT", "Sent"
+    FAILED = "FAILED", "Failed"
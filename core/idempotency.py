@@ -0,0 +1,194 @@
+import hashlib
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http.request import RawPostDataException
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.models import IdempotencyRecord
+from shared.exceptions import Conflict
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+# Set again by DRF when the replayed response is rendered
+REGENERATED_HEADERS = {"allow", "content-length", "content-type", "vary"}
+
+
+class IdempotentReplay(Exception):
+    """Raised to answer a retried request with its stored response"""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+
+
+def fingerprint(*parts):
+    return hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def claim_key(key, request_hash, lock_timeout=None):
+    """
+    Lock ``key`` for a new request for ``lock_timeout`` seconds.
+
+    Returns None when the caller now owns the key, otherwise the existing
+    record of an earlier request. Expired records are taken over in place, so
+    they never block a key until the purge command removes them.
+    """
+    now = timezone.now()
+    lock_timeout = lock_timeout or settings.IDEMPOTENCY_LOCK_TIMEOUT
+    lock_until = now + timedelta(seconds=lock_timeout)
+    try:
+        with transaction.atomic():
+            IdempotencyRecord.objects.create(
+                key=key, request_hash=request_hash, expires_at=lock_until
+            )
+        return None
+    except IntegrityError:
+        pass
+
+    taken_over = IdempotencyRecord.objects.filter(key=key, expires_at__lte=now).update(
+        request_hash=request_hash,
+        status_code=None,
+        response_body="",
+        response_headers={},
+        expires_at=lock_until,
+    )
+    if taken_over:
+        return None
+
+    record = IdempotencyRecord.objects.filter(key=key).first()
+    if record is None:
+        # Purged in between, try again
+        return claim_key(key, request_hash, lock_timeout)
+    return record
+
+
+def release_key(key):
+    """Delete the record of ``key`` so the request can be retried"""
+    IdempotencyRecord.objects.filter(key=key).delete()
+
+
+def store_response(key, response):
+    """Keep the response for retries, or release the key after a server error"""
+    if response.status_code >= 500:
+        release_key(key)
+        return
+
+    body = "" if response.data is None else json.dumps(response.data, cls=JSONEncoder)
+    headers = {
+        name: value
+        for name, value in response.items()
+        if name.lower() not in REGENERATED_HEADERS
+    }
+    IdempotencyRecord.objects.filter(key=key).update(
+        status_code=response.status_code,
+        response_body=body,
+        response_headers=headers,
+        expires_at=timezone.now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL),
+    )
+
+
+def hash_upload(upload):
+    digest = hashlib.sha256()
+    for chunk in upload.chunks():
+        digest.update(chunk)
+    upload.seek(0)
+    return digest.hexdigest()
+
+
+class IdempotencyMixin:
+    """
+    Replay the first response of POST requests retried with the same Idempotency-Key.
+
+    Keys are scoped to the user, method and path; anonymous requests have no
+    scope to keep them apart and are never deduplicated. The first request
+    locks its key while the view runs, for ``idempotency_lock_timeouts`` of the
+    action or ``IDEMPOTENCY_LOCK_TIMEOUT`` seconds. A retry gets the stored
+    response and headers without running the view again, a concurrent
+    duplicate gets ``409`` and a retry with a different body gets ``400``.
+    Server errors are not stored, so they can be retried.
+    """
+
+    idempotent_methods = ("POST",)
+    # Lock timeouts in seconds of actions that may outlast the default
+    idempotency_lock_timeouts = {}
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+
+        raw_key = request.headers.get(IDEMPOTENCY_HEADER)
+        if request.method not in self.idempotent_methods or not raw_key:
+            return
+        if not request.user.is_authenticated:
+            return
+        if len(raw_key) > MAX_KEY_LENGTH:
+            raise ValidationError(
+                {IDEMPOTENCY_HEADER: f"Must be at most {MAX_KEY_LENGTH} characters"}
+            )
+
+        key = fingerprint(request.user.pk, request.method, request.path, raw_key)
+        request_hash = fingerprint(self.get_request_body(request))
+        record = claim_key(key, request_hash, self.get_idempotency_lock_timeout())
+        if record is None:
+            self.idempotency_key = key
+            return
+
+        if record.request_hash != request_hash:
+            raise ValidationError(
+                {IDEMPOTENCY_HEADER: "Already used for a different request"}
+            )
+        if record.status_code is None:
+            raise Conflict(
+                "A request with this Idempotency-Key is still being processed"
+            )
+
+        data = json.loads(record.response_body) if record.response_body else None
+        headers = {**record.response_headers, REPLAYED_HEADER: "true"}
+        raise IdempotentReplay(
+            Response(data, status=record.status_code, headers=headers)
+        )
+
+    def get_idempotency_lock_timeout(self):
+        action = getattr(self, "action", None) or self.request.method.lower()
+        return self.idempotency_lock_timeouts.get(action)
+
+    def get_request_body(self, request):
+        if request.content_type.startswith("multipart/"):
+            # Reading the raw body would load the whole upload into memory,
+            # uploads are hashed chunk by chunk instead
+            return sorted(
+                (name, hash_upload(value) if hasattr(value, "chunks") else value)
+                for name, value in request.data.items()
+            )
+        try:
+            return request.body
+        except RawPostDataException:
+            # The stream was already parsed
+            return request.data
+
+    def handle_exception(self, exc):
+        if isinstance(exc, IdempotentReplay):
+            return exc.response
+        try:
+            return super().handle_exception(exc)
+        except Exception:
+            # Uncaught errors skip finalize_response, don't keep the key locked
+            key = getattr(self, "idempotency_key", None)
+            if key is not None:
+                self.idempotency_key = None
+                release_key(key)
+            raise
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        key = getattr(self, "idempotency_key", None)
+        if key is not None:
+            self.idempotency_key = None
+            store_response(key, response)
+        return response
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import IdempotencyRecord
+
+
+class Command(BaseCommand):
+    help = "Delete expired Idempotency-Key records, run it periodically e.g. from cron"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        deleted = 0
+        while True:
+            keys = list(
+                IdempotencyRecord.objects.filter(expires_at__lte=now).values_list(
+                    "pk", flat=True
+                )[: options["batch_size"]]
+            )
+            if not keys:
+                break
+            deleted += IdempotencyRecord.objects.filter(pk__in=keys).delete()[0]
+
+        self.stdout.write(f"Deleted {deleted} expired idempotency key(s)")
@@ -0,0 +1,28 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.outbox import purge_sent
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete outbox emails sent more than OUTBOX_SENT_RETENTION_DAYS ago, "
+        "run it periodically e.g. from cron"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.OUTBOX_SENT_RETENTION_DAYS,
+            help="Keep emails sent within this many days",
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - timedelta(days=options["days"])
+        deleted = purge_sent(older_than, batch_size=options["batch_size"])
+        self.stdout.write(f"Deleted {deleted} sent email(s)")
@@ -0,0 +1,55 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.outbox import claim_batch, send_batch
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Send queued outbox emails in batches over a reused SMTP connection"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=5,
+            help="Give up on an email after this many failed attempts",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=5.0,
+            help="Seconds to sleep when the outbox is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the outbox once and exit instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            emails = claim_batch(options["batch_size"])
+            if emails:
+                try:
+                    sent, failed = send_batch(
+                        emails, max_attempts=options["max_attempts"]
+                    )
+                except Exception as e:
+                    # e.g. the SMTP server is down, claimed emails retry after their lease
+                    logger.exception(f"Failed to send outbox batch: {str(e)}")
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+                    continue
+
+                self.stdout.write(f"Sent {sent} email(s), {failed} failed")
+                continue
+
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
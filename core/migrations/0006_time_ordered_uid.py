@@ -0,0 +1,49 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:35
+
+import shared.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Switch ``uid`` to time-ordered UUIDv7 defaults.
+
+    Only the migration state changes, the default is applied in Python.
+    Existing uids are part of the API and are kept as they are. Those random
+    v4 uids are spread over the whole key range and mostly sort after the new
+    ones, so old and new rows stay mixed in the uid indexes. New uids only
+    append at the end of the index in tables without v4 uids.
+    """
+
+    dependencies = [
+        ("core", "0005_idempotencyrecord"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="user",
+                    name="uid",
+                    field=models.UUIDField(
+                        db_index=True,
+                        default=shared.ids.uuid7,
+                        editable=False,
+                        help_text="Unique identifier for this model instance.",
+                        unique=True,
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="userprofile",
+                    name="uid",
+                    field=models.UUIDField(
+                        db_index=True,
+                        default=shared.ids.uuid7,
+                        editable=False,
+                        help_text="Unique identifier for this model instance.",
+                        unique=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
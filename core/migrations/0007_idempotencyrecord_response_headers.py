@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_time_ordered_uid"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="idempotencyrecord",
+            name="response_headers",
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
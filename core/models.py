@@ -1,13 +1,25 @@
 from django.contrib.auth.base_user import  AbstractBaseUser
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import PermissionsMixin
-from django.db import models
+from django.core.cache import cache
+from django.db import models, transaction
+from django.utils import timezone
 
-from core.choices import GenderChoices, UserRole
+from core.choices import EmailStatus, GenderChoices, UserRole
 from core.managers import UserManager
 
 from shared.base_model import BaseModel
 
+# Changing any of these invalidates the tokens issued to the user
+TOKEN_FIELDS = {"password", "role", "is_staff", "is_superuser", "status"}
+
+
+def token_version_cache_key(user_id):
+    return f"user-token-version:{user_id}"
+
+
+def forget_token_version(user_id):
+    cache.delete(token_version_cache_key(user_id))
 
 
 class User(AbstractBaseUser, PermissionsMixin, BaseModel):
@@ -21,6 +33,8 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
     is_staff = models.BooleanField(default=False)
     is_superuser = models.BooleanField(default=False)
     role = models.CharField(max_length=12, choices=UserRole.choices, default=UserRole.CANDIDATE)
+    # Bumped whenever data embedded in issued tokens changes, see auth.authentication
+    token_version = models.PositiveIntegerField(default=0)
 
     # Add user custom manager
     objects = UserManager()
@@ -42,9 +56,41 @@ class User(AbstractBaseUser, PermissionsMixin, BaseModel):
             self.password = make_password(self.new_password)
             self.new_password = ""
 
+        if not self._state.adding and TOKEN_FIELDS.intersection(self.get_dirty_fields()):
+            self.token_version += 1
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "token_version"}
+            transaction.on_commit(lambda: forget_token_version(self.pk))
+
         super().save(*args, **kwargs)
 
 
+class TokenUser(User):
+    """
+    User built from JWT claims without a database query.
+
+    Only the claimed columns are set; the remaining ones are deferred and the
+    first access to any of them loads the whole row in one query.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, role, is_staff):
+        claims = {"id": user_id, "role": role, "is_staff": is_staff}
+        # from_db expects the values in concrete field order
+        names = [f.attname for f in cls._meta.concrete_fields if f.attname in claims]
+        return cls.from_db(None, names, [claims[name] for name in names])
+
+    def refresh_from_db(self, using=None, fields=None, *args, **kwargs):
+        deferred = self.get_deferred_fields()
+        if fields is not None and deferred and set(fields) <= deferred:
+            fields = list(deferred)
+        super().refresh_from_db(using, fields, *args, **kwargs)
+
+
 class UserProfile(BaseModel):
     user = models.OneToOneField(User, on_delete=models.CASCADE, related_name="profile")
     photo = models.ImageField(upload_to="profile_pictures/", blank=True)
@@ -56,3 +102,45 @@ class UserProfile(BaseModel):
 
     def __str__(self):
         return f"Profile of {self.user.email}"
+
+
+class OutboxEmail(models.Model):
+    """Email queued in the same transaction as the change that triggered it"""
+
+    subject = models.CharField(max_length=255)
+    message = models.TextField()
+    from_email = models.CharField(max_length=255)
+    recipient = models.EmailField()
+    status = models.CharField(
+        max_length=10, choices=EmailStatus.choices, default=EmailStatus.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    claim_token = models.CharField(max_length=32, blank=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "available_at"], name="outbox_status_available_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} => {self.recipient} ({self.status})"
+
+
+class IdempotencyRecord(models.Model):
+    """Response of a POST sent with an Idempotency-Key, replayed to retries"""
+
+    # sha256 of the user, method, path and Idempotency-Key header
+    key = models.CharField(max_length=64, primary_key=True)
+    request_hash = models.CharField(max_length=64)
+    # Null while the first request is still running
+    status_code = models.PositiveSmallIntegerField(null=True)
+    response_body = models.TextField(blank=True)
+    response_headers = models.JSONField(default=dict, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.key} ({self.status_code or 'in progress'})"
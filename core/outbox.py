@@ -0,0 +1,128 @@
+import logging
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import F
+from django.utils import timezone
+
+from core.choices import EmailStatus
+from core.models import OutboxEmail
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(subject, message, recipient_list, from_email=None):
+    """Write emails to the outbox, they are sent by the send_outbox_emails worker"""
+    return OutboxEmail.objects.bulk_create(
+        [
+            OutboxEmail(
+                subject=subject,
+                message=message,
+                from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+                recipient=recipient,
+            )
+            for recipient in recipient_list
+        ]
+    )
+
+
+def claim_batch(batch_size, lease_seconds=300):
+    """
+    Reserve up to ``batch_size`` due emails for this worker.
+
+    Claimed rows are pushed ``lease_seconds`` into the future, so a worker
+    that dies mid-batch releases them automatically and concurrent workers
+    never pick the same row.
+    """
+    now = timezone.now()
+    token = uuid.uuid4().hex
+    due = OutboxEmail.objects.filter(
+        status=EmailStatus.PENDING, available_at__lte=now
+    ).order_by("available_at")
+
+    OutboxEmail.objects.filter(
+        pk__in=list(due.values_list("pk", flat=True)[:batch_size]),
+        status=EmailStatus.PENDING,
+        available_at__lte=now,
+    ).update(claim_token=token, available_at=now + timedelta(seconds=lease_seconds))
+
+    return list(OutboxEmail.objects.filter(claim_token=token).order_by("pk"))
+
+
+def retry_delay(attempts, base_seconds=30, max_seconds=3600):
+    """Exponential backoff: 30s, 60s, 120s, ... capped at an hour"""
+    return timedelta(seconds=min(base_seconds * 2 ** (attempts - 1), max_seconds))
+
+
+def send_batch(emails, max_attempts=5, connection=None):
+    """
+    Send claimed emails over one SMTP connection.
+
+    Returns ``(sent, failed)`` counts. Failed emails are rescheduled with
+    backoff, or marked FAILED once ``max_attempts`` is reached.
+    """
+    connection = connection or get_connection(fail_silently=False)
+    sent = failed = 0
+
+    connection.open()
+    try:
+        for email in emails:
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.message,
+                from_email=email.from_email,
+                to=[email.recipient],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception as e:
+                failed += 1
+                logger.exception(f"Failed to send outbox email {email.pk}: {str(e)}")
+                attempts = email.attempts + 1
+                OutboxEmail.objects.filter(pk=email.pk).update(
+                    attempts=F("attempts") + 1,
+                    last_error=str(e),
+                    claim_token="",
+                    status=(
+                        EmailStatus.FAILED
+                        if attempts >= max_attempts
+                        else EmailStatus.PENDING
+                    ),
+                    available_at=timezone.now() + retry_delay(attempts),
+                )
+                # The connection may be broken, start the next email on a fresh one.
+                # Unsent claimed emails are picked up again once their lease ends.
+                connection.close()
+                try:
+                    connection.open()
+                except Exception as e:
+                    logger.exception(f"Failed to reopen the email connection: {str(e)}")
+                    break
+            else:
+                sent += 1
+                OutboxEmail.objects.filter(pk=email.pk).update(
+                    status=EmailStatus.SENT,
+                    claim_token="",
+                    sent_at=timezone.now(),
+                )
+    finally:
+        connection.close()
+
+    return sent, failed
+
+
+def purge_sent(older_than, batch_size=1000):
+    """Delete emails sent before ``older_than`` in batches, returns the count"""
+    deleted = 0
+    while True:
+        pks = list(
+            OutboxEmail.objects.filter(
+                status=EmailStatus.SENT, sent_at__lt=older_than
+            ).values_list("pk", flat=True)[:batch_size]
+        )
+        if not pks:
+            return deleted
+        deleted += OutboxEmail.objects.filter(pk__in=pks).delete()[0]
@@ -1,7 +1,13 @@
+from django.conf import settings
+from django.db.backends.signals import connection_created
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from core.models import User, UserProfile
+from shared.db_wrappers import install_context_wrappers
+
+SQLITE_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+SQLITE_SYNCHRONOUS_LEVELS = {"OFF", "NORMAL", "FULL", "EXTRA"}
 
 
 @receiver(post_save, sender=User)
@@ -9,3 +15,35 @@ def create_user_profile(sender, instance, created, **kwargs):
     """Signal to create a UserProfile instance when a User is created."""
     if created:
         UserProfile.objects.get_or_create(user=instance)
+
+
+@receiver(connection_created)
+def install_execute_wrappers(sender, connection, **kwargs):
+    """Let request middleware wrap the queries of every connection."""
+    install_context_wrappers(connection)
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """Apply the SQLITE_* pragmas to every new SQLite connection."""
+    if connection.vendor != "sqlite":
+        return
+
+    journal_mode = settings.SQLITE_JOURNAL_MODE.upper()
+    synchronous = settings.SQLITE_SYNCHRONOUS.upper()
+    if journal_mode not in SQLITE_JOURNAL_MODES:
+        raise ValueError(f"Unknown SQLITE_JOURNAL_MODE: {journal_mode}")
+    if synchronous not in SQLITE_SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Unknown SQLITE_SYNCHRONOUS: {synchronous}")
+
+    # Run on the raw connection, so the pragmas are not counted as queries of
+    # the request that opened it
+    for pragma in [
+        # First, so switching the journal mode waits for other connections
+        f"PRAGMA busy_timeout = {int(settings.SQLITE_BUSY_TIMEOUT_MS)}",
+        f"PRAGMA journal_mode = {journal_mode}",
+        f"PRAGMA synchronous = {synchronous}",
+        f"PRAGMA cache_size = {-int(settings.SQLITE_CACHE_SIZE_KB)}",
+        f"PRAGMA mmap_size = {int(settings.SQLITE_MMAP_SIZE)}",
+    ]:
+        connection.connection.execute(pragma)
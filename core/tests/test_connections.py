@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import SimpleTestCase, TestCase, override_settings
+
+PRINT_CONN_MAX_AGE = (
+    "import {module}; from django.conf import settings; "
+    "print(settings.DATABASES['default']['CONN_MAX_AGE'])"
+)
+
+
+class SQLitePragmaTests(TestCase):
+    """Every new SQLite connection starts with the SQLITE_* pragmas"""
+
+    def open_connection(self):
+        connection = connections.create_connection(DEFAULT_DB_ALIAS)
+        self.addCleanup(connection.close)
+        connection.ensure_connection()
+        return connection
+
+    def get_pragma(self, connection, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f"PRAGMA {name}")
+            return cursor.fetchone()[0]
+
+    def setUp(self):
+        if connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            self.skipTest("Pragmas are only applied to SQLite")
+
+    def test_default_pragmas(self):
+        connection = self.open_connection()
+
+        self.assertEqual(self.get_pragma(connection, "journal_mode"), "wal")
+        self.assertEqual(
+            self.get_pragma(connection, "busy_timeout"),
+            settings.SQLITE_BUSY_TIMEOUT_MS,
+        )
+        # 1 is NORMAL
+        self.assertEqual(self.get_pragma(connection, "synchronous"), 1)
+        self.assertEqual(
+            self.get_pragma(connection, "cache_size"), -settings.SQLITE_CACHE_SIZE_KB
+        )
+
+    @override_settings(SQLITE_BUSY_TIMEOUT_MS=1234, SQLITE_SYNCHRONOUS="full")
+    def test_pragmas_follow_settings(self):
+        connection = self.open_connection()
+
+        self.assertEqual(self.get_pragma(connection, "busy_timeout"), 1234)
+        # 2 is FULL
+        self.assertEqual(self.get_pragma(connection, "synchronous"), 2)
+
+    @override_settings(SQLITE_JOURNAL_MODE="fast")
+    def test_unknown_journal_mode(self):
+        with self.assertRaisesMessage(ValueError, "Unknown SQLITE_JOURNAL_MODE"):
+            self.open_connection()
+
+
+class ConnectionLifetimeTests(SimpleTestCase):
+    """Connections persist between requests under WSGI only"""
+
+    def get_conn_max_age(self, module):
+        env = {
+            name: value
+            for name, value in os.environ.items()
+            if name not in ("DJANGO_ASGI", "DATABASE_CONN_MAX_AGE")
+        }
+        env["DJANGO_SETTINGS_MODULE"] = "config.settings"
+        result = subprocess.run(
+            [sys.executable, "-c", PRINT_CONN_MAX_AGE.format(module=module)],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return int(result.stdout.strip().splitlines()[-1])
+
+    def test_asgi_connections_are_not_persistent(self):
+        self.assertEqual(self.get_conn_max_age("config.asgi"), 0)
+
+    def test_wsgi_connections_are_persistent(self):
+        self.assertGreater(self.get_conn_max_age("config.wsgi"), 0)
@@ -0,0 +1,242 @@
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connections
+from django.test import Client, TestCase, TransactionTestCase, override_settings
+from django.test.client import MULTIPART_CONTENT
+from django.utils import timezone
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory, force_authenticate
+from rest_framework.views import APIView
+
+from core.choices import UserRole
+from core.idempotency import (
+    REPLAYED_HEADER,
+    IdempotencyMixin,
+    claim_key,
+    fingerprint,
+)
+from core.models import IdempotencyRecord
+from job.models import Job
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_user,
+    get_auth_headers,
+)
+
+JOB_URL = f"{JOB_PREFIX}job/"
+PARALLEL_REQUESTS = 8
+
+
+class CreatedView(IdempotencyMixin, APIView):
+    calls = 0
+
+    def post(self, request):
+        CreatedView.calls += 1
+        return Response(
+            {"call": CreatedView.calls},
+            status=201,
+            headers={"Location": f"/things/{CreatedView.calls}/"},
+        )
+
+
+def get_job_data(title="Data Engineer"):
+    return {
+        "title": title,
+        "description": "Own the data pipelines",
+        "location": "Berlin",
+        "salary": 80_000,
+        "deadline": (timezone.now().date() + timedelta(days=30)).isoformat(),
+    }
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class IdempotencyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.key = uuid.uuid4().hex
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.report_dir = directory.name
+
+    def post(self, data, key=None, user=None, url=JOB_URL, **kwargs):
+        headers = {"Idempotency-Key": key or self.key}
+        headers.update(get_auth_headers(user or self.recruiter))
+        kwargs.setdefault("content_type", "application/json")
+        return self.client.post(url, data, headers=headers, **kwargs)
+
+    def get_key(self, raw_key=None, user=None, path=JOB_URL):
+        user = user or self.recruiter
+        return fingerprint(user.pk, "POST", path, raw_key or self.key)
+
+    def test_retry_replays_the_first_response(self):
+        first = self.post(get_job_data())
+        retry = self.post(get_job_data())
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.json(), first.json())
+        self.assertEqual(retry[REPLAYED_HEADER], "true")
+        self.assertNotIn(REPLAYED_HEADER, first)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_replay_keeps_the_response_headers(self):
+        view = CreatedView.as_view()
+        factory = APIRequestFactory()
+
+        def post():
+            request = factory.post(
+                "/things/", {"name": "x"}, format="json", HTTP_IDEMPOTENCY_KEY=self.key
+            )
+            force_authenticate(request, self.recruiter)
+            return view(request).render()
+
+        first, retry = post(), post()
+
+        self.assertEqual(retry["Location"], first["Location"])
+        self.assertEqual(retry["Content-Type"], first["Content-Type"])
+        self.assertEqual(retry.data, first.data)
+
+    def test_errors_are_replayed_too(self):
+        first = self.post({**get_job_data(), "salary": 0})
+        retry = self.post({**get_job_data(), "salary": 0})
+
+        self.assertEqual(first.status_code, 400)
+        self.assertEqual(retry.status_code, 400)
+        self.assertEqual(retry[REPLAYED_HEADER], "true")
+
+    def test_key_reused_with_another_body_is_rejected(self):
+        self.post(get_job_data())
+
+        response = self.post(get_job_data("Other Job"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Idempotency-Key", response.json())
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_key_in_progress_is_a_conflict(self):
+        self.post(get_job_data())
+        # As if the first request were still running
+        IdempotencyRecord.objects.update(status_code=None, response_body="")
+
+        response = self.post(get_job_data())
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_expired_lock_is_taken_over(self):
+        claim_key(self.get_key(), fingerprint("crashed request"))
+        IdempotencyRecord.objects.update(expires_at=timezone.now())
+
+        response = self.post(get_job_data())
+
+        self.assertEqual(response.status_code, 201)
+
+    def test_keys_are_scoped_to_the_user(self):
+        other = create_user("other", role=UserRole.RECRUITER)
+        self.post(get_job_data())
+
+        response = self.post(get_job_data("Other Job"), user=other)
+
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn(REPLAYED_HEADER, response)
+
+    def test_anonymous_requests_are_not_deduplicated(self):
+        data = {
+            "username": "newcomer",
+            "first_name": "New",
+            "last_name": "Comer",
+            "email": "newcomer@example.com",
+            "role": UserRole.CANDIDATE,
+            "password": "Str0ng-passw0rd",
+            "confirm_password": "Str0ng-passw0rd",
+        }
+        url = "/api/v1/auth/people/register/"
+        headers = {"Idempotency-Key": self.key}
+
+        first = self.client.post(url, data, "application/json", headers=headers)
+        retry = self.client.post(url, data, "application/json", headers=headers)
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual(retry.status_code, 400)
+        self.assertFalse(IdempotencyRecord.objects.exists())
+
+    def test_uploads_are_fingerprinted_by_content(self):
+        url = f"{JOB_URL}import/"
+
+        def upload(content):
+            return self.post(
+                {"file": SimpleUploadedFile("jobs.csv", content)},
+                url=url,
+                content_type=MULTIPART_CONTENT,
+            )
+
+        header = b"title,description,location,salary,deadline\n"
+        with override_settings(JOB_IMPORT_REPORT_DIR=self.report_dir):
+            first = upload(header + b"First Job,x,Remote,1000,2099-01-01\n")
+            # Same name and size, different rows
+            second = upload(header + b"Other Job,x,Remote,1000,2099-01-01\n")
+
+        self.assertEqual(first.status_code, 201, first.data)
+        self.assertEqual(second.status_code, 400)
+        self.assertIn("Idempotency-Key", second.json())
+
+    def test_import_locks_its_key_longer(self):
+        with mock.patch("core.idempotency.claim_key", wraps=claim_key) as claim:
+            self.post(get_job_data())
+            with override_settings(JOB_IMPORT_REPORT_DIR=self.report_dir):
+                self.post(
+                    {"file": SimpleUploadedFile("jobs.csv", b"title\n")},
+                    key=uuid.uuid4().hex,
+                    url=f"{JOB_URL}import/",
+                    content_type=MULTIPART_CONTENT,
+                )
+
+        self.assertEqual(
+            [call.args[2] for call in claim.call_args_list],
+            [None, settings.JOB_IMPORT_IDEMPOTENCY_LOCK_TIMEOUT],
+        )
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class ConcurrentIdempotencyTests(TransactionTestCase):
+    """Parallel requests with one key run the view once"""
+
+    def setUp(self):
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.key = uuid.uuid4().hex
+
+    def post(self, barrier):
+        client = Client(raise_request_exception=False)
+        headers = {"Idempotency-Key": self.key, **get_auth_headers(self.recruiter)}
+        try:
+            barrier.wait()
+            response = client.post(
+                JOB_URL,
+                get_job_data(),
+                content_type="application/json",
+                headers=headers,
+            )
+            return response.status_code, response.get(REPLAYED_HEADER)
+        finally:
+            connections.close_all()
+
+    def test_parallel_requests_create_one_job(self):
+        barrier = threading.Barrier(PARALLEL_REQUESTS)
+        with ThreadPoolExecutor(max_workers=PARALLEL_REQUESTS) as executor:
+            results = list(executor.map(self.post, [barrier] * PARALLEL_REQUESTS))
+
+        self.assertEqual(Job.objects.count(), 1)
+        self.assertEqual(results.count((201, None)), 1, results)
+        # The others either saw the key locked or got the stored response
+        for result in results:
+            self.assertIn(result, [(201, None), (201, "true"), (409, None)])
@@ -0,0 +1,145 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core import mail
+from django.core.mail.backends.base import BaseEmailBackend
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.choices import EmailStatus
+from core.models import OutboxEmail
+from core.outbox import claim_batch, purge_sent, queue_email, retry_delay, send_batch
+from job.tests.utils import FAST_PASSWORD_HASHERS
+
+
+class FailingBackend(BaseEmailBackend):
+    def send_messages(self, email_messages):
+        raise ConnectionError("SMTP server unavailable")
+
+
+def queue(*recipients):
+    return queue_email("Subject", "Message", list(recipients))
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class OutboxTests(TestCase):
+    def test_email_is_only_queued_with_its_transaction(self):
+        with self.assertRaises(RuntimeError):
+            with transaction.atomic():
+                queue("lost@example.com")
+                raise RuntimeError
+
+        queue("kept@example.com")
+
+        self.assertEqual(
+            list(OutboxEmail.objects.values_list("recipient", flat=True)),
+            ["kept@example.com"],
+        )
+
+    def test_registration_queues_instead_of_sending(self):
+        response = self.client.post(
+            "/api/v1/auth/people/register/",
+            {
+                "username": "newcomer",
+                "first_name": "New",
+                "last_name": "Comer",
+                "email": "newcomer@example.com",
+                "role": "CANDIDATE",
+                "password": "Str0ng-passw0rd",
+                "confirm_password": "Str0ng-passw0rd",
+            },
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(mail.outbox, [])
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.recipient, "newcomer@example.com")
+        self.assertEqual(email.status, EmailStatus.PENDING)
+
+        call_command("send_outbox_emails", "--once", stdout=StringIO())
+
+        self.assertEqual([message.to for message in mail.outbox], [[email.recipient]])
+        email.refresh_from_db()
+        self.assertEqual(email.status, EmailStatus.SENT)
+        self.assertIsNotNone(email.sent_at)
+
+    def test_claimed_emails_are_not_claimed_twice(self):
+        queue("a@example.com", "b@example.com", "c@example.com")
+
+        first = claim_batch(2)
+        second = claim_batch(2)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(len(second), 1)
+        self.assertFalse({e.pk for e in first} & {e.pk for e in second})
+        self.assertEqual(claim_batch(2), [])
+
+    def test_failed_send_is_retried_with_backoff(self):
+        queue("retry@example.com")
+
+        before = timezone.now()
+        self.assertEqual(
+            send_batch(claim_batch(10), connection=FailingBackend()), (0, 1)
+        )
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, EmailStatus.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertEqual(email.claim_token, "")
+        self.assertIn("SMTP server unavailable", email.last_error)
+        self.assertGreaterEqual(email.available_at, before + timedelta(seconds=30))
+        # Not due again before the backoff has passed
+        self.assertEqual(claim_batch(10), [])
+
+    def test_email_fails_after_max_attempts(self):
+        queue("broken@example.com")
+
+        for attempt in range(3):
+            OutboxEmail.objects.update(available_at=timezone.now())
+            with self.assertLogs("core.outbox", "ERROR"):
+                send_batch(claim_batch(10), max_attempts=3, connection=FailingBackend())
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.status, EmailStatus.FAILED)
+        self.assertEqual(email.attempts, 3)
+        OutboxEmail.objects.update(available_at=timezone.now())
+        self.assertEqual(claim_batch(10), [])
+
+    def test_retry_delay_doubles_up_to_an_hour(self):
+        self.assertEqual(
+            [retry_delay(attempts).total_seconds() for attempts in range(1, 10)],
+            [30, 60, 120, 240, 480, 960, 1920, 3600, 3600],
+        )
+
+    def test_purge_only_deletes_old_sent_emails(self):
+        old, recent, pending = queue(
+            "old@example.com", "recent@example.com", "pending@example.com"
+        )
+        now = timezone.now()
+        OutboxEmail.objects.filter(pk=old.pk).update(
+            status=EmailStatus.SENT, sent_at=now - timedelta(days=40)
+        )
+        OutboxEmail.objects.filter(pk=recent.pk).update(
+            status=EmailStatus.SENT, sent_at=now - timedelta(days=1)
+        )
+
+        self.assertEqual(purge_sent(now - timedelta(days=30), batch_size=1), 1)
+        self.assertEqual(
+            set(OutboxEmail.objects.values_list("pk", flat=True)),
+            {recent.pk, pending.pk},
+        )
+
+    def test_purge_command(self):
+        (email,) = queue("old@example.com")
+        OutboxEmail.objects.filter(pk=email.pk).update(
+            status=EmailStatus.SENT, sent_at=timezone.now() - timedelta(days=40)
+        )
+        stdout = StringIO()
+
+        call_command("purge_outbox_emails", "--days", "30", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "Deleted 1 sent email(s)")
+        self.assertFalse(OutboxEmail.objects.exists())
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from job.models import Job, JobApplication
+from job.models import Job, JobApplication, RecruiterStats
 
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
@@ -104,6 +104,31 @@ class JobApplicationAdmin(admin.ModelAdmin):
         "applied_at",
     ]
     
-    list_select_related = ["candidate", "job"]
+    # Job.__str__ shows the recruiter of each job
+    list_select_related = ["candidate", "job__recruiter"]
+    show_full_result_count = False
+    ordering = ("-applied_at",)
+
+@admin.register(RecruiterStats)
+class RecruiterStatsAdmin(admin.ModelAdmin):
+    model = RecruiterStats
+    list_display = [
+        "recruiter",
+        "total_published_job",
+        "total_closed_job",
+        "total_candidate_application",
+        "total_candidate_hired",
+        "total_candidate_rejected",
+        "updated_at",
+    ]
+    readonly_fields = [
+        "recruiter",
+        "total_published_job",
+        "total_closed_job",
+        "total_candidate_application",
+        "total_candidate_hired",
+        "total_candidate_rejected",
+        "updated_at",
+    ]
+    list_select_related = ["recruiter"]
     show_full_result_count = False
-    ordering = ("-applied_at",)
\ No newline at end of file
@@ -0,0 +1,84 @@
+from django.db import connections, transaction
+from django.utils import timezone
+
+from job.choices import ApplicationStatusChoices, StatusChoices
+from job.models import Job, JobApplication
+from job.stats import application_status_deltas, bump_recruiter_stats
+
+
+def apply_to_job(job, candidate, using="default"):
+    """
+    Create an application with one ``INSERT ... SELECT`` guarded by the job state.
+
+    The row is only inserted while the job is open and its deadline has not
+    passed, and the job title and deadline are copied by the same statement.
+    Returns the application, or None when the job no longer accepts
+    applications. A second application of the same candidate raises
+    ``IntegrityError`` from the ``(candidate, job)`` unique constraint, so
+    concurrent submissions cannot both succeed.
+
+    The insert bypasses model signals, so the recruiter stats are bumped here
+    in the same transaction.
+    """
+    now = timezone.now()
+    application = JobApplication(
+        job_id=job.pk,
+        candidate_id=candidate.pk,
+        applied_at=now,
+        updated_at=now,
+    )
+    connection = connections[using]
+    quote = connection.ops.quote_name
+
+    def column(model, name):
+        return quote(model._meta.get_field(name).column)
+
+    def param(name, value):
+        return JobApplication._meta.get_field(name).get_db_prep_save(value, connection)
+
+    sql = (
+        f"INSERT INTO {quote(JobApplication._meta.db_table)} ("
+        f"{column(JobApplication, 'application_id')}, "
+        f"{column(JobApplication, 'job')}, "
+        f"{column(JobApplication, 'candidate')}, "
+        f"{column(JobApplication, 'status')}, "
+        f"{column(JobApplication, 'applied_at')}, "
+        f"{column(JobApplication, 'updated_at')}, "
+        f"{column(JobApplication, 'job_title')}, "
+        f"{column(JobApplication, 'job_deadline')}) "
+        f"SELECT %s, {column(Job, 'job_id')}, %s, %s, %s, %s, "
+        f"{column(Job, 'title')}, {column(Job, 'deadline')} "
+        f"FROM {quote(Job._meta.db_table)} "
+        f"WHERE {column(Job, 'job_id')} = %s "
+        f"AND {column(Job, 'status')} = %s "
+        f"AND {column(Job, 'deadline')} >= %s"
+    )
+    params = [
+        param("application_id", application.application_id),
+        param("candidate", candidate.pk),
+        application.status,
+        param("applied_at", now),
+        param("updated_at", now),
+        param("job", job.pk),
+        StatusChoices.OPEN,
+        Job._meta.get_field("deadline").get_db_prep_save(now.date(), connection),
+    ]
+
+    with transaction.atomic(using=using):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            if cursor.rowcount == 0:
+                return None
+
+        bump_recruiter_stats(
+            job.recruiter_id,
+            using=using,
+            total_candidate_application=1,
+            **application_status_deltas(None, ApplicationStatusChoices.APPLIED),
+        )
+
+    application.job_title = job.title
+    application.job_deadline = job.deadline
+    application._state.adding = False
+    application._state.db = using
+    return application
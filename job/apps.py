@@ -1,6 +1,16 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class JobConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'job'
+
+    def ready(self):
+        # Import the signals
+        from . import signals
+        from shared.cache import check_shared_cache
+        from shared.db_router import check_pin_cache
+
+        checks.register(check_pin_cache, checks.Tags.caches)
+        checks.register(check_shared_cache, checks.Tags.caches, deploy=True)
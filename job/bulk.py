@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.db import transaction
+
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.models import Job
+from job.rest.serializers.job import JobBulkItemSerializer
+from job.search import index_new_jobs
+from job.stats import bump_recruiter_stats
+
+
+class JobBulkCreator:
+    """
+    Validate and insert many jobs of one recruiter with few queries.
+
+    Rows are validated one by one with the ``JobSerializer`` rules, title
+    uniqueness is checked for a whole set of rows with a single ``IN`` query,
+    and inserts go through ``bulk_create`` in ``batch_size`` chunks. Invalid
+    rows are collected in ``errors`` instead of failing the whole batch.
+    """
+
+    def __init__(self, recruiter, batch_size=None):
+        self.recruiter = recruiter
+        self.batch_size = batch_size or settings.JOB_BULK_CREATE_BATCH_SIZE
+        self.errors = []
+        self.created_count = 0
+
+    def add_error(self, index, errors):
+        self.errors.append({"index": index, "errors": errors})
+
+    def validate(self, index, data):
+        """Return ``(index, validated_data)`` or None after recording the errors"""
+        serializer = JobBulkItemSerializer(data=data)
+        if not serializer.is_valid():
+            self.add_error(index, serializer.errors)
+            return None
+        return index, serializer.validated_data
+
+    def save(self, entries):
+        """Insert validated entries, return the created jobs in input order"""
+        unique_entries = []
+        seen_titles = set()
+        for index, data in entries:
+            if data["title"] in seen_titles:
+                self.add_error(index, {"title": ["Duplicate title in this batch."]})
+            else:
+                seen_titles.add(data["title"])
+                unique_entries.append((index, data))
+
+        existing_titles = set(
+            Job.objects.filter(title__in=seen_titles).values_list("title", flat=True)
+        )
+        candidates = []
+        for index, data in unique_entries:
+            if data["title"] in existing_titles:
+                self.add_error(
+                    index, {"title": ["job with this title already exists."]}
+                )
+            else:
+                candidates.append((index, Job(recruiter=self.recruiter, **data)))
+
+        if not candidates:
+            return []
+
+        with transaction.atomic():
+            # Conflicts from concurrent inserts are skipped, then reported below
+            Job.objects.bulk_create(
+                [job for _, job in candidates],
+                batch_size=self.batch_size,
+                ignore_conflicts=True,
+            )
+            inserted = set(
+                Job.objects.filter(
+                    pk__in=[job.pk for _, job in candidates]
+                ).values_list("pk", flat=True)
+            )
+
+            created = []
+            for index, job in candidates:
+                if job.pk in inserted:
+                    created.append(job)
+                else:
+                    self.add_error(
+                        index, {"title": ["job with this title already exists."]}
+                    )
+            if created:
+                index_new_jobs(created)
+                bump_recruiter_stats(
+                    self.recruiter.pk,
+                    total_published_job=len(created),
+                    total_closed_job=sum(
+                        job.status == StatusChoices.CLOSED for job in created
+                    ),
+                )
+                transaction.on_commit(job_list_cache.bump)
+
+        self.created_count += len(created)
+        return created
@@ -0,0 +1,6 @@
+from django.conf import settings
+
+from shared.cache import VersionedCache
+
+# Cached job list pages, bumped on every job save or delete
+job_list_cache = VersionedCache("jobs", timeout=settings.JOB_LIST_CACHE_TIMEOUT)
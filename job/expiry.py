@@ -0,0 +1,49 @@
+from collections import Counter
+
+from django.db import transaction
+from django.utils import timezone
+
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.models import Job
+from job.stats import bump_recruiter_stats, rebuild_recruiter_stats
+
+
+def close_expired_jobs(batch_size=500, today=None, using="default"):
+    """
+    Close one chunk of open jobs whose deadline has passed.
+
+    The chunk is read through the ``(status, deadline)`` index and closed with a
+    single conditional ``UPDATE``, so a job closed concurrently by another node
+    is never counted twice. The rows are not locked while reading (SQLite has
+    no row locks): the ``status`` condition of the ``UPDATE`` alone provides
+    that safety. Returns the number of jobs this call closed.
+    """
+    today = today or timezone.now().date()
+    with transaction.atomic(using=using):
+        expired = list(
+            Job.objects.using(using)
+            .filter(status=StatusChoices.OPEN, deadline__lt=today)
+            .order_by("deadline", "job_id")
+            .values_list("job_id", "recruiter_id")[:batch_size]
+        )
+        if not expired:
+            return 0
+
+        # Bulk update skips the signals, so stats and cache are handled here
+        closed = (
+            Job.objects.using(using)
+            .filter(pk__in=[job_id for job_id, _ in expired], status=StatusChoices.OPEN)
+            .update(status=StatusChoices.CLOSED, updated_at=timezone.now())
+        )
+        per_recruiter = Counter(recruiter_id for _, recruiter_id in expired)
+        if closed == len(expired):
+            for recruiter_id, count in per_recruiter.items():
+                bump_recruiter_stats(recruiter_id, using=using, total_closed_job=count)
+        else:
+            # Some jobs were closed concurrently, recount instead of guessing
+            rebuild_recruiter_stats(list(per_recruiter), using=using)
+
+        if closed:
+            transaction.on_commit(job_list_cache.bump, using=using)
+    return closed
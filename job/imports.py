@@ -0,0 +1,128 @@
+import codecs
+import csv
+import json
+import os
+import uuid
+
+from django.conf import settings
+
+from job.bulk import JobBulkCreator
+from shared.streaming import escape_formula
+
+REPORT_HEADER = ["row", "title", "errors"]
+
+
+def iter_csv_rows(upload):
+    """Yield ``(row number, data)`` from a CSV upload with a header line"""
+    reader = csv.DictReader(codecs.iterdecode(upload, "utf-8-sig"))
+    for number, row in enumerate(reader, start=1):
+        # Empty cells count as missing, extra cells without a header are dropped
+        yield number, {
+            name: value
+            for name, value in row.items()
+            if name and value not in ("", None)
+        }
+
+
+def iter_ndjson_rows(upload):
+    """Yield ``(row number, data)`` from an upload with one JSON object per line"""
+    for number, line in enumerate(codecs.iterdecode(upload, "utf-8-sig"), start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError:
+            data = None
+        yield number, data
+
+
+def get_report_path(recruiter_id, report_id):
+    return os.path.join(
+        settings.JOB_IMPORT_REPORT_DIR, str(recruiter_id), f"{report_id}.csv"
+    )
+
+
+class JobImporter:
+    """
+    Import the jobs of one recruiter from a CSV or NDJSON upload.
+
+    The upload is read row by row and saved through ``JobBulkCreator`` one
+    chunk at a time, so neither the file nor its errors are ever held in
+    memory. Rejected rows are written to a CSV error report as they are found.
+    Each chunk is committed on its own.
+    """
+
+    readers = {"csv": iter_csv_rows, "ndjson": iter_ndjson_rows}
+
+    def __init__(self, recruiter, batch_size=None):
+        self.creator = JobBulkCreator(recruiter, batch_size=batch_size)
+        self.recruiter = recruiter
+        self.report_id = uuid.uuid4().hex
+        self.report_path = get_report_path(recruiter.pk, self.report_id)
+        self.failed_count = 0
+
+    @property
+    def created_count(self):
+        return self.creator.created_count
+
+    def run(self, upload, file_format):
+        os.makedirs(os.path.dirname(self.report_path), exist_ok=True)
+        with open(self.report_path, "w", newline="") as report_file:
+            self.report = csv.writer(report_file)
+            self.report.writerow(REPORT_HEADER)
+
+            entries, titles = [], {}
+            for number, data in self.readers[file_format](upload):
+                # Every row counts toward the chunk, so rejected rows are
+                # flushed to the report as often as saved ones
+                if not isinstance(data, dict):
+                    message = (
+                        "Invalid JSON" if data is None else "Expected a JSON object"
+                    )
+                    self.creator.add_error(number, {"non_field_errors": [message]})
+                    titles[number] = ""
+                else:
+                    titles[number] = data.get("title", "")
+                    entry = self.creator.validate(number, data)
+                    if entry is not None:
+                        entries.append(entry)
+                if len(titles) >= self.creator.batch_size:
+                    self.save_chunk(entries, titles)
+                    entries, titles = [], {}
+            self.save_chunk(entries, titles)
+
+        if not self.failed_count:
+            os.remove(self.report_path)
+            self.report_id = None
+
+    def save_chunk(self, entries, titles):
+        if entries:
+            self.creator.save(entries)
+
+        for error in sorted(self.creator.errors, key=lambda error: error["index"]):
+            self.report.writerow(
+                [
+                    error["index"],
+                    escape_formula(titles.get(error["index"], "")),
+                    json.dumps(error["errors"]),
+                ]
+            )
+        self.failed_count += len(self.creator.errors)
+        self.creator.errors = []
+
+
+def purge_reports(older_than):
+    """Delete error reports last written before ``older_than``, returns the count"""
+    deleted = 0
+    cutoff = older_than.timestamp()
+    if not os.path.isdir(settings.JOB_IMPORT_REPORT_DIR):
+        return deleted
+
+    for entry in os.scandir(settings.JOB_IMPORT_REPORT_DIR):
+        if not entry.is_dir():
+            continue
+        for report in os.scandir(entry.path):
+            if report.name.endswith(".csv") and report.stat().st_mtime < cutoff:
+                os.remove(report.path)
+                deleted += 1
+    return deleted
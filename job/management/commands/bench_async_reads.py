@@ -0,0 +1,109 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+
+from auth.rest.serializers.token import UserClaimsTokenObtainPairSerializer
+from core.choices import UserRole
+from core.models import User
+from job.models import Job
+
+SYNC_PREFIX = "/api/v1/job-info/"
+ASYNC_PREFIX = "/api/v1/job-info/async/"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent read throughput of the WSGI job endpoints against "
+        "their async ASGI counterparts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--email", required=True, help="Recruiter whose token is used"
+        )
+        parser.add_argument("--requests", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=20)
+
+    def handle(self, *args, **options):
+        user = User.objects.filter(email=options["email"]).first()
+        if user is None or user.role != UserRole.RECRUITER:
+            raise CommandError("--email must belong to a recruiter")
+
+        job_id = Job.objects.values_list("job_id", flat=True).first()
+        if job_id is None:
+            raise CommandError("No jobs to read, create some first")
+
+        token = UserClaimsTokenObtainPairSerializer.get_token(user).access_token
+        headers = {"authorization": f"Bearer {token}"}
+        endpoints = [
+            ("job list", "job/"),
+            ("job detail", f"job/{job_id}/"),
+            ("application list", "application/"),
+        ]
+
+        self.stdout.write(
+            f"{options['requests']} requests per run, concurrency {options['concurrency']}"
+        )
+        self.stdout.write("Note: the WSGI job list is served from the response cache")
+        for name, path in endpoints:
+            # The test clients always send "Host: testserver"
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+            ):
+                wsgi = self.run_wsgi(SYNC_PREFIX + path, headers, options)
+                asgi = async_to_sync(self.run_asgi)(
+                    ASYNC_PREFIX + path, headers, options
+                )
+            self.stdout.write(
+                f"{name:<18} WSGI {wsgi:8.1f} req/s   ASGI {asgi:8.1f} req/s"
+                f"   ({asgi / wsgi:.2f}x)"
+            )
+
+    def run_wsgi(self, path, headers, options):
+        """Requests per second through the WSGI handler from a thread pool"""
+
+        def worker(count):
+            client = Client()
+            try:
+                for _ in range(count):
+                    self.check_response(client.get(path, headers=headers), path)
+            finally:
+                connections.close_all()
+
+        counts = self.split(options["requests"], options["concurrency"])
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=len(counts)) as pool:
+            list(pool.map(worker, counts))
+        return options["requests"] / (time.perf_counter() - started)
+
+    async def run_asgi(self, path, headers, options):
+        """Requests per second through the ASGI handler on one event loop"""
+
+        async def worker(count):
+            client = AsyncClient()
+            for _ in range(count):
+                response = await client.get(path, headers=headers)
+                self.check_response(response, path)
+
+        counts = self.split(options["requests"], options["concurrency"])
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(count) for count in counts))
+        return options["requests"] / (time.perf_counter() - started)
+
+    def split(self, total, concurrency):
+        concurrency = max(1, min(concurrency, total))
+        return [
+            total // concurrency + (index < total % concurrency)
+            for index in range(concurrency)
+        ]
+
+    def check_response(self, response, path):
+        if response.status_code != 200:
+            raise CommandError(f"GET {path} returned {response.status_code}")
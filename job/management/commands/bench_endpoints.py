@@ -0,0 +1,496 @@
+import itertools
+import json
+import platform
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+import django
+from django.conf import settings
+from django.contrib.auth.tokens import default_token_generator
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from auth.rest.serializers.token import UserClaimsTokenObtainPairSerializer
+from core.choices import UserRole
+from core.models import User
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices
+from job.imports import JobImporter
+from job.models import Job, JobApplication
+
+AUTH_PREFIX = "/api/v1/auth/"
+JOB_PREFIX = "/api/v1/job-info/"
+
+
+def percentile(samples, percent):
+    """Linear interpolation between the closest ranks"""
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * percent / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure latency percentiles and query counts of the auth and job "
+        "endpoints in-process and print them as JSON. Only reads run by default; "
+        "--writes adds every POST, PUT, PATCH and DELETE route, run against "
+        "throwaway users, jobs and applications"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+        parser.add_argument(
+            "--warmup", type=int, default=3, help="Unmeasured requests per endpoint"
+        )
+        parser.add_argument(
+            "--password",
+            default="password123",
+            help="Password of the benchmarked users, as given to seed_data",
+        )
+        parser.add_argument(
+            "--recruiter-email", help="Defaults to the recruiter with the most jobs"
+        )
+        parser.add_argument(
+            "--candidate-email",
+            help="Defaults to the candidate with the most applications",
+        )
+        parser.add_argument(
+            "--writes",
+            action="store_true",
+            help="Also measure write endpoints, this inserts users, jobs, "
+            "applications, emails and an import error report",
+        )
+        parser.add_argument(
+            "--only",
+            action="append",
+            help="Only run endpoints whose name contains this",
+        )
+        parser.add_argument("--output", help="Write the JSON report to this file")
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1")
+
+        recruiter = self.get_user(
+            UserRole.RECRUITER, options["recruiter_email"], "jobs"
+        )
+        candidate = self.get_user(
+            UserRole.CANDIDATE, options["candidate_email"], "applications"
+        )
+        job = recruiter.jobs.order_by("deadline", "job_id").first()
+        application = JobApplication.objects.filter(job__recruiter=recruiter).first()
+        if job is None or application is None:
+            raise CommandError("Seed some data first, e.g. python manage.py seed_data")
+
+        self.tokens = {
+            role: UserClaimsTokenObtainPairSerializer.get_token(user)
+            for role, user in [("recruiter", recruiter), ("candidate", candidate)]
+        }
+        self.run_id = uuid.uuid4().hex[:8]
+        endpoints = self.get_endpoints(recruiter, candidate, job, application, options)
+        if options["only"]:
+            endpoints = [
+                endpoint
+                for endpoint in endpoints
+                if any(name in endpoint["name"] for name in options["only"])
+            ]
+
+        # The test client always sends "Host: testserver"
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]):
+            results = [self.measure(endpoint, options) for endpoint in endpoints]
+
+        report = {
+            "meta": {
+                "timestamp": timezone.now().isoformat(),
+                "iterations": options["iterations"],
+                "warmup": options["warmup"],
+                "database": connection.vendor,
+                "python": platform.python_version(),
+                "django": django.get_version(),
+                "jobs": Job.objects.count(),
+                "applications": JobApplication.objects.count(),
+            },
+            "endpoints": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as file:
+                file.write(output + "\n")
+        self.stdout.write(output)
+
+    def get_user(self, role, email, related_name):
+        users = User.objects.filter(role=role)
+        if email:
+            user = users.filter(email=email).first()
+        else:
+            user = users.annotate(total=Count(related_name)).order_by("-total").first()
+        if user is None:
+            raise CommandError(f"No {role.lower()} found, seed some data first")
+        return user
+
+    def get_endpoints(self, recruiter, candidate, job, application, options):
+        """Requests covering the routes in auth.rest.urls and job.rest.urls"""
+        endpoints = [
+            self.endpoint(
+                "auth register list", "get", f"{AUTH_PREFIX}people/register/"
+            ),
+            self.endpoint(
+                "auth register detail",
+                "get",
+                f"{AUTH_PREFIX}people/register/{recruiter.pk}/",
+            ),
+            self.endpoint(
+                "auth token obtain",
+                "post",
+                f"{AUTH_PREFIX}token/",
+                role=None,
+                data=lambda: {
+                    "email": recruiter.email,
+                    "password": options["password"],
+                },
+            ),
+            self.endpoint(
+                "auth token refresh",
+                "post",
+                f"{AUTH_PREFIX}token//refresh",
+                role=None,
+                data=lambda: {"refresh": str(self.tokens["recruiter"])},
+            ),
+            self.endpoint("job list", "get", f"{JOB_PREFIX}job/"),
+            self.endpoint(
+                "job list filtered",
+                "get",
+                f"{JOB_PREFIX}job/?status=OPEN&salary__gte=50000",
+            ),
+            self.endpoint(
+                "job list sparse", "get", f"{JOB_PREFIX}job/?fields=title,deadline"
+            ),
+            self.endpoint("job search", "get", f"{JOB_PREFIX}job/search/?q=engineer"),
+            self.endpoint("job detail", "get", f"{JOB_PREFIX}job/{job.pk}/"),
+            self.endpoint(
+                "job applications",
+                "get",
+                f"{JOB_PREFIX}job/{job.pk}/applications/",
+            ),
+            self.endpoint("application list", "get", f"{JOB_PREFIX}application/"),
+            self.endpoint(
+                "application detail",
+                "get",
+                f"{JOB_PREFIX}application/{application.pk}/",
+            ),
+            self.endpoint(
+                "application mine",
+                "get",
+                f"{JOB_PREFIX}application/mine/",
+                role="candidate",
+            ),
+            self.endpoint(
+                "application export csv",
+                "get",
+                f"{JOB_PREFIX}application/export/?output=csv",
+            ),
+            self.endpoint(
+                "application export ndjson",
+                "get",
+                f"{JOB_PREFIX}application/export/?output=ndjson",
+            ),
+            self.endpoint(
+                "recruiter dashboard", "get", f"{JOB_PREFIX}recruiter-dashboard/"
+            ),
+            self.endpoint("async job list", "get", f"{JOB_PREFIX}async/job/"),
+            self.endpoint(
+                "async job detail", "get", f"{JOB_PREFIX}async/job/{job.pk}/"
+            ),
+            self.endpoint(
+                "async application list", "get", f"{JOB_PREFIX}async/application/"
+            ),
+            self.endpoint(
+                "async application detail",
+                "get",
+                f"{JOB_PREFIX}async/application/{application.pk}/",
+            ),
+        ]
+        if not options["writes"]:
+            return endpoints
+
+        deadline = str(timezone.now().date() + timedelta(days=30))
+        counter = iter(range(10**9))
+        open_jobs = Job.objects.filter(status="OPEN", deadline__gte=deadline).exclude(
+            applications__candidate=candidate
+        )
+        job_ids = iter(
+            str(pk) for pk in open_jobs.values_list("pk", flat=True)[:10_000]
+        )
+
+        def register_data():
+            email = f"bench-{self.run_id}-{next(counter)}@example.com"
+            return {
+                "email": email,
+                "username": email,
+                "first_name": "Bench",
+                "last_name": "User",
+                "role": UserRole.CANDIDATE,
+                "password": options["password"],
+                "confirm_password": options["password"],
+            }
+
+        def job_data():
+            return {
+                "title": f"Bench job {self.run_id}-{next(counter)}",
+                "description": "Benchmark job",
+                "location": "Remote",
+                "salary": 50_000,
+                "deadline": deadline,
+            }
+
+        def create_user(name, **fields):
+            return User.objects.create_user(
+                email=f"bench-{self.run_id}-{name}@example.com",
+                username=f"bench-{self.run_id}-{name}",
+                first_name="Bench",
+                last_name=name.title(),
+                password=options["password"],
+                **fields,
+            )
+
+        def new_job():
+            return Job.objects.create(recruiter=recruiter, **job_data())
+
+        def new_application():
+            return apply_to_job(new_job(), bench_candidate)
+
+        def import_data():
+            rows = "".join(
+                f"{data['title']},Imported,Remote,50000,{deadline}\n"
+                for data in (job_data() for _ in range(10))
+            )
+            content = f"title,description,location,salary,deadline\n{rows}"
+            return {"file": SimpleUploadedFile("jobs.csv", content.encode())}
+
+        # Resetting a password invalidates tokens, so use a throwaway user
+        reset_user = create_user("reset")
+        # Updated and deleted rows are throwaway ones, seeded data is kept
+        bench_candidate = create_user("candidate")
+        bench_staff = create_user("staff", is_staff=True)
+        bench_job = new_job()
+        bench_application = new_application()
+        statuses = itertools.cycle(
+            [ApplicationStatusChoices.HIRED, ApplicationStatusChoices.REJECTED]
+        )
+        self.tokens.update(
+            {
+                role: UserClaimsTokenObtainPairSerializer.get_token(user)
+                for role, user in [("bench", bench_candidate), ("staff", bench_staff)]
+            }
+        )
+
+        importer = JobImporter(recruiter)
+        importer.run([b"title\n", b"Missing fields\n"], "csv")
+
+        def reset_path():
+            reset_user.refresh_from_db(fields=["password", "last_login"])
+            uid = urlsafe_base64_encode(force_bytes(reset_user.pk))
+            token = default_token_generator.make_token(reset_user)
+            return f"{AUTH_PREFIX}password/reset-password/?uid={uid}&token={token}"
+
+        return endpoints + [
+            self.endpoint(
+                "auth register create",
+                "post",
+                f"{AUTH_PREFIX}people/register/",
+                role=None,
+                data=register_data,
+            ),
+            self.endpoint(
+                "auth forget password",
+                "post",
+                f"{AUTH_PREFIX}password/forget-password/",
+                role="candidate",
+                data=lambda: {"email": candidate.email},
+            ),
+            self.endpoint(
+                "auth reset password",
+                "post",
+                reset_path,
+                role=None,
+                data=lambda: {
+                    "new_password": options["password"],
+                    "confirm_password": options["password"],
+                },
+            ),
+            self.endpoint(
+                "auth register update",
+                "put",
+                f"{AUTH_PREFIX}people/register/{bench_candidate.pk}/",
+                role="bench",
+                data=lambda: {
+                    "username": bench_candidate.username,
+                    "first_name": f"Bench {next(counter)}",
+                    "last_name": "Candidate",
+                    "email": bench_candidate.email,
+                    "role": UserRole.CANDIDATE,
+                },
+            ),
+            self.endpoint(
+                "auth register partial update",
+                "patch",
+                f"{AUTH_PREFIX}people/register/{bench_candidate.pk}/",
+                role="bench",
+                data=lambda: {"first_name": f"Bench {next(counter)}"},
+            ),
+            self.endpoint(
+                "auth register delete",
+                "delete",
+                lambda: f"{AUTH_PREFIX}people/register/"
+                f"{create_user(f'deleted-{next(counter)}').pk}/",
+                role="staff",
+            ),
+            self.endpoint("job create", "post", f"{JOB_PREFIX}job/", data=job_data),
+            self.endpoint(
+                "job update", "put", f"{JOB_PREFIX}job/{bench_job.pk}/", data=job_data
+            ),
+            self.endpoint(
+                "job partial update",
+                "patch",
+                f"{JOB_PREFIX}job/{bench_job.pk}/",
+                data=lambda: {"salary": 50_000 + next(counter)},
+            ),
+            self.endpoint(
+                "job delete", "delete", lambda: f"{JOB_PREFIX}job/{new_job().pk}/"
+            ),
+            self.endpoint(
+                "job bulk create",
+                "post",
+                f"{JOB_PREFIX}job/bulk/",
+                data=lambda: [job_data() for _ in range(10)],
+            ),
+            self.endpoint(
+                "job import",
+                "post",
+                f"{JOB_PREFIX}job/import/",
+                data=import_data,
+                multipart=True,
+            ),
+            self.endpoint(
+                "job import errors",
+                "get",
+                f"{JOB_PREFIX}job/import/{importer.report_id}/errors/",
+            ),
+            self.endpoint(
+                "application create",
+                "post",
+                f"{JOB_PREFIX}application/",
+                role="candidate",
+                data=lambda: {"job": next(job_ids, str(job.pk))},
+            ),
+            self.endpoint(
+                "application update",
+                "put",
+                f"{JOB_PREFIX}application/{bench_application.pk}/",
+                data=lambda: {"status": next(statuses)},
+            ),
+            self.endpoint(
+                "application partial update",
+                "patch",
+                f"{JOB_PREFIX}application/{bench_application.pk}/",
+                data=lambda: {"status": next(statuses)},
+            ),
+            self.endpoint(
+                "application delete",
+                "delete",
+                lambda: f"{JOB_PREFIX}application/{new_application().pk}/",
+            ),
+            self.endpoint(
+                "application bulk status",
+                "post",
+                f"{JOB_PREFIX}application/bulk-status/",
+                data=lambda: {
+                    "application_ids": [str(bench_application.pk)],
+                    "status": next(statuses),
+                },
+            ),
+        ]
+
+    def endpoint(
+        self, name, method, path, role="recruiter", data=None, multipart=False
+    ):
+        return {
+            "name": name,
+            "method": method,
+            "path": path,
+            "role": role,
+            "data": data,
+            "multipart": multipart,
+        }
+
+    def measure(self, endpoint, options):
+        client = Client()
+        latencies = []
+        queries = []
+        statuses = {}
+
+        for iteration in range(options["warmup"] + options["iterations"]):
+            path = (
+                endpoint["path"]() if callable(endpoint["path"]) else endpoint["path"]
+            )
+            kwargs = {}
+            if endpoint["role"]:
+                access = self.tokens[endpoint["role"]].access_token
+                kwargs["headers"] = {"authorization": f"Bearer {access}"}
+            if endpoint["multipart"]:
+                kwargs["data"] = endpoint["data"]()
+            elif endpoint["data"]:
+                kwargs["data"] = json.dumps(endpoint["data"]())
+                kwargs["content_type"] = "application/json"
+
+            with CaptureQueriesContext(connection) as context:
+                started = time.perf_counter()
+                response = getattr(client, endpoint["method"])(path, **kwargs)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                    response.close()
+                elapsed = (time.perf_counter() - started) * 1000
+
+            if iteration < options["warmup"]:
+                continue
+            latencies.append(elapsed)
+            queries.append(self.count_queries(context.captured_queries))
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        return {
+            "name": endpoint["name"],
+            "method": endpoint["method"].upper(),
+            "path": endpoint["path"] if isinstance(endpoint["path"], str) else None,
+            "status": {str(code): count for code, count in sorted(statuses.items())},
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "queries": {
+                "min": min(queries),
+                "median": statistics.median(queries),
+                "max": max(queries),
+            },
+        }
+
+    def count_queries(self, captured):
+        """Application queries, leaving out the profiler's own bookkeeping"""
+        return sum(
+            1
+            for query in captured
+            if '"silk_' not in query["sql"]
+            and not query["sql"].startswith(
+                ("EXPLAIN", "BEGIN", "COMMIT", "SAVEPOINT", "RELEASE")
+            )
+        )
@@ -0,0 +1,227 @@
+import itertools
+import logging
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import Client
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from auth.rest.serializers.token import UserClaimsTokenObtainPairSerializer
+from core.choices import UserRole
+from core.models import User
+from job.choices import StatusChoices
+from job.models import Job, JobApplication
+
+JOB_PREFIX = "/api/v1/job-info/"
+
+# Django's defaults: rollback journal, full sync, small cache, no mmap and a
+# new connection per request
+BASELINE = {
+    "settings": {
+        "SQLITE_JOURNAL_MODE": "DELETE",
+        "SQLITE_SYNCHRONOUS": "FULL",
+        "SQLITE_CACHE_SIZE_KB": 2000,
+        "SQLITE_MMAP_SIZE": 0,
+    },
+    "conn_max_age": 0,
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare concurrent apply and job list throughput on SQLite with "
+        "Django's defaults against the configured SQLITE_* tuning. "
+        "This inserts applications."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--duration", type=float, default=10, help="Seconds per phase"
+        )
+        parser.add_argument("--writers", type=int, default=4)
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument(
+            "--candidates", type=int, default=200, help="Candidates who apply"
+        )
+
+    def handle(self, *args, **options):
+        if connections[DEFAULT_DB_ALIAS].vendor != "sqlite":
+            raise CommandError("The default database is not SQLite")
+
+        recruiter = User.objects.filter(role=UserRole.RECRUITER).first()
+        candidates = list(
+            User.objects.filter(role=UserRole.CANDIDATE)[: options["candidates"]]
+        )
+        job_ids = list(
+            Job.objects.filter(
+                status=StatusChoices.OPEN, deadline__gte=timezone.now().date()
+            ).values_list("job_id", flat=True)
+        )
+        if recruiter is None or not candidates or not job_ids:
+            raise CommandError("Seed some data first, e.g. python manage.py seed_data")
+
+        self.list_headers = self.get_headers(recruiter)
+        self.applications = self.iter_new_applications(candidates, job_ids)
+        self.lock = threading.Lock()
+        self.list_numbers = itertools.count()
+
+        tuned = {
+            "settings": {
+                name: getattr(settings, name) for name in BASELINE["settings"]
+            },
+            "conn_max_age": settings.DATABASES[DEFAULT_DB_ALIAS]["CONN_MAX_AGE"],
+        }
+        # The test clients always send "Host: testserver", and every failed
+        # request would otherwise log a traceback
+        request_logger = logging.getLogger("django.request")
+        level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+        try:
+            with override_settings(
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"]
+            ):
+                baseline = self.run_phase(BASELINE, options)
+                after = self.run_phase(tuned, options)
+        finally:
+            request_logger.setLevel(level)
+
+        self.stdout.write(
+            f"{options['duration']:g}s per phase, {options['writers']} writer(s) "
+            f"applying and {options['readers']} reader(s) listing jobs"
+        )
+        self.stdout.write(
+            f"{'':<10}{'apply/s':>10}{'apply p95':>12}{'list/s':>10}"
+            f"{'list p95':>12}{'total/s':>10}{'errors':>8}"
+        )
+        for name, result in [("baseline", baseline), ("tuned", after)]:
+            self.stdout.write(
+                f"{name:<10}{result['apply']['rate']:>10.1f}"
+                f"{result['apply']['p95_ms']:>10.1f}ms"
+                f"{result['list']['rate']:>10.1f}{result['list']['p95_ms']:>10.1f}ms"
+                f"{result['apply']['rate'] + result['list']['rate']:>10.1f}"
+                f"{result['apply']['errors'] + result['list']['errors']:>8}"
+            )
+        for kind in ("apply", "list"):
+            if baseline[kind]["rate"]:
+                self.stdout.write(
+                    f"{kind} throughput: "
+                    f"{after[kind]['rate'] / baseline[kind]['rate']:.2f}x"
+                )
+        self.stdout.write(
+            "Threads share the GIL: compare the total, and run with --writers 0 "
+            "or --readers 0 to measure one side alone"
+        )
+
+    def get_headers(self, user):
+        token = UserClaimsTokenObtainPairSerializer.get_token(user).access_token
+        return {"authorization": f"Bearer {token}"}
+
+    def iter_new_applications(self, candidates, job_ids):
+        """``(headers, job id)`` pairs the candidates have not applied to yet"""
+        applied = set(
+            JobApplication.objects.filter(candidate__in=candidates).values_list(
+                "candidate_id", "job_id"
+            )
+        )
+        headers = {
+            candidate.pk: self.get_headers(candidate) for candidate in candidates
+        }
+        for job_id, candidate in itertools.product(job_ids, candidates):
+            if (candidate.pk, job_id) not in applied:
+                yield headers[candidate.pk], str(job_id)
+
+    def next_application(self):
+        with self.lock:
+            return next(self.applications, None)
+
+    def run_phase(self, phase, options):
+        database = connections.settings[DEFAULT_DB_ALIAS]
+        conn_max_age = database["CONN_MAX_AGE"]
+        with override_settings(**phase["settings"]):
+            # Connections made from now on pick up the phase's pragmas, and the
+            # journal mode is switched while no other connection is open
+            connections.close_all()
+            database["CONN_MAX_AGE"] = phase["conn_max_age"]
+            try:
+                connections[DEFAULT_DB_ALIAS].ensure_connection()
+                connections.close_all()
+
+                deadline = time.perf_counter() + options["duration"]
+                workers = [self.apply_worker] * options["writers"] + [
+                    self.list_worker
+                ] * options["readers"]
+                with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+                    futures = [
+                        (worker, executor.submit(self.run_worker, worker, deadline))
+                        for worker in workers
+                    ]
+                    samples = {"apply": [], "list": []}
+                    errors = {"apply": 0, "list": 0}
+                    for worker, future in futures:
+                        kind = "apply" if worker == self.apply_worker else "list"
+                        latencies, failed = future.result()
+                        samples[kind] += latencies
+                        errors[kind] += failed
+            finally:
+                database["CONN_MAX_AGE"] = conn_max_age
+                connections.close_all()
+
+        return {
+            kind: {
+                "rate": len(samples[kind]) / options["duration"],
+                "p95_ms": (
+                    statistics.quantiles(samples[kind], n=20)[-1] * 1000
+                    if len(samples[kind]) > 1
+                    else 0.0
+                ),
+                "errors": errors[kind],
+            }
+            for kind in samples
+        }
+
+    def run_worker(self, worker, deadline):
+        """Latencies of the successful requests and the number of failures"""
+        client = Client(raise_request_exception=False)
+        latencies, failed = [], 0
+        try:
+            for number in itertools.count():
+                if time.perf_counter() >= deadline:
+                    break
+                started = time.perf_counter()
+                response = worker(client, number)
+                if response is None:
+                    break
+                if response.status_code >= 400:
+                    failed += 1
+                else:
+                    latencies.append(time.perf_counter() - started)
+        finally:
+            connections.close_all()
+        return latencies, failed
+
+    def apply_worker(self, client, number):
+        application = self.next_application()
+        if application is None:
+            return None
+        headers, job_id = application
+        return client.post(
+            f"{JOB_PREFIX}application/",
+            {"job": job_id},
+            content_type="application/json",
+            headers=headers,
+        )
+
+    def list_worker(self, client, number):
+        # A different filter per request keeps the job list cache out of it
+        number = next(self.list_numbers)
+        return client.get(
+            f"{JOB_PREFIX}job/?salary__gte={number % 100_000}"
+            f"&salary__lte={1_000_000 + number}",
+            headers=self.list_headers,
+        )
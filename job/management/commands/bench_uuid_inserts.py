@@ -0,0 +1,115 @@
+import os
+import sqlite3
+import tempfile
+import time
+import uuid
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from shared.ids import uuid7
+
+# The key column as Django creates UUID primary keys on SQLite
+TABLE_SQL = (
+    'CREATE TABLE "bench" ('
+    '"id" char(32) NOT NULL PRIMARY KEY, '
+    '"title" varchar(100) NOT NULL, '
+    '"created_at" datetime NOT NULL)'
+)
+INDEX_NAME = "sqlite_autoindex_bench_1"
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare insert rate and primary-key index size of random UUIDv4 and "
+        "time-ordered UUIDv7 keys in a scratch SQLite database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200_000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--cache-size-kb",
+            type=int,
+            default=2000,
+            help="Page cache per connection, keep it below the index size to "
+            "see the effect of locality",
+        )
+
+    def handle(self, *args, **options):
+        if options["rows"] < options["batch_size"]:
+            raise CommandError("--rows must be at least --batch-size")
+
+        self.stdout.write(
+            f"{options['rows']} rows in batches of {options['batch_size']}, "
+            f"{options['cache_size_kb']} KiB page cache"
+        )
+        self.stdout.write(
+            f"{'':<8}{'rows/s':>10}{'last 10% rows/s':>18}"
+            f"{'index pages':>14}{'index MiB':>12}{'page fill':>11}"
+        )
+        results = {}
+        for name, generate in [("uuid4", uuid.uuid4), ("uuid7", uuid7)]:
+            with tempfile.TemporaryDirectory() as directory:
+                results[name] = self.run(
+                    os.path.join(directory, "bench.sqlite3"), generate, options
+                )
+            result = results[name]
+            self.stdout.write(
+                f"{name:<8}{result['rate']:>10.0f}{result['tail_rate']:>18.0f}"
+                f"{result['pages']:>14}{result['size'] / 2**20:>12.1f}"
+                f"{result['fill']:>10.0%}"
+            )
+
+        self.stdout.write(
+            f"uuid7 vs uuid4: {results['uuid7']['rate'] / results['uuid4']['rate']:.2f}x "
+            f"insert rate, {results['uuid7']['size'] / results['uuid4']['size']:.2f}x "
+            f"index size"
+        )
+
+    def run(self, path, generate, options):
+        connection = sqlite3.connect(path, isolation_level=None)
+        try:
+            for pragma in [
+                f"PRAGMA journal_mode = {settings.SQLITE_JOURNAL_MODE}",
+                f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+                f"PRAGMA cache_size = {-options['cache_size_kb']}",
+            ]:
+                connection.execute(pragma)
+            connection.execute(TABLE_SQL)
+
+            batch_size = options["batch_size"]
+            batches = options["rows"] // batch_size
+            tail_from = batches - max(batches // 10, 1)
+            elapsed = tail_elapsed = 0.0
+            for batch in range(batches):
+                rows = [
+                    (generate().hex, f"Job {batch}-{index}", "2026-01-01 00:00:00")
+                    for index in range(batch_size)
+                ]
+                started = time.perf_counter()
+                connection.execute("BEGIN")
+                connection.executemany(
+                    'INSERT INTO "bench" ("id", "title", "created_at") '
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                connection.execute("COMMIT")
+                duration = time.perf_counter() - started
+                elapsed += duration
+                if batch >= tail_from:
+                    tail_elapsed += duration
+
+            pages, size, unused = connection.execute(
+                "SELECT COUNT(*), SUM(pgsize), SUM(unused) FROM dbstat WHERE name = ?",
+                [INDEX_NAME],
+            ).fetchone()
+            return {
+                "rate": batches * batch_size / elapsed,
+                "tail_rate": (batches - tail_from) * batch_size / tail_elapsed,
+                "pages": pages,
+                "size": size,
+                "fill": 1 - unused / size,
+            }
+        finally:
+            connection.close()
@@ -0,0 +1,47 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from job.expiry import close_expired_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Close open jobs whose deadline has passed, in chunks. Safe to run on "
+        "several nodes at once"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=3600.0,
+            help="Seconds to sleep once no expired job is left",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Close every expired job once and exit instead of polling",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            total = 0
+            try:
+                while True:
+                    closed = close_expired_jobs(batch_size=options["batch_size"])
+                    total += closed
+                    if closed < options["batch_size"]:
+                        break
+            except Exception as e:
+                logger.exception(f"Failed to close expired jobs: {str(e)}")
+
+            if total:
+                self.stdout.write(f"Closed {total} expired job(s)")
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from job.cache import job_list_cache
+
+
+class Command(BaseCommand):
+    help = "Show hit and miss counts of the job list response cache"
+
+    def handle(self, *args, **options):
+        if job_list_cache.is_process_local:
+            raise CommandError(
+                "The cache backend is local to each process, so this command "
+                "can't see the counts of the server. Set CACHE_BACKEND to a "
+                "shared cache."
+            )
+
+        stats = job_list_cache.stats()
+        lookups = stats["hits"] + stats["misses"]
+        ratio = stats["hits"] / lookups if lookups else 0
+
+        self.stdout.write(f"Version: {stats['version']}")
+        self.stdout.write(f"Hits: {stats['hits']}")
+        self.stdout.write(f"Misses: {stats['misses']}")
+        self.stdout.write(f"Hit ratio: {ratio:.2%}")
@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from job.imports import purge_reports
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete job import error reports older than "
+        "JOB_IMPORT_REPORT_RETENTION_DAYS, run it periodically e.g. from cron"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.JOB_IMPORT_REPORT_RETENTION_DAYS,
+            help="Keep reports written within this many days",
+        )
+
+    def handle(self, *args, **options):
+        older_than = timezone.now() - timedelta(days=options["days"])
+        deleted = purge_reports(older_than)
+        self.stdout.write(f"Deleted {deleted} job import report(s)")
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from job.stats import rebuild_recruiter_stats
+
+
+class Command(BaseCommand):
+    help = "Rebuild recruiter dashboard counters from the job and application tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--recruiter",
+            type=int,
+            action="append",
+            dest="recruiters",
+            help="Only rebuild the given recruiter id (can be repeated)",
+        )
+
+    def handle(self, *args, **options):
+        count = rebuild_recruiter_stats(options["recruiters"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {count} recruiter(s)"))
@@ -0,0 +1,163 @@
+import random
+import time
+import uuid
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from core.choices import UserRole
+from core.models import User, UserProfile
+from job.cache import job_list_cache
+from job.choices import ApplicationStatusChoices, StatusChoices
+from job.models import Job, JobApplication
+from job.search import index_new_jobs
+from job.stats import rebuild_recruiter_stats
+
+LOCATIONS = ["Dhaka", "Chittagong", "Sylhet", "Khulna", "Rajshahi", "Remote"]
+TITLES = [
+    "Backend Engineer",
+    "Frontend Developer",
+    "Data Analyst",
+    "QA Engineer",
+    "DevOps Engineer",
+    "Product Designer",
+]
+WORDS = "python django api sql cloud docker testing agile remote senior junior team product".split()
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed recruiters, candidates, jobs and applications with bulk inserts "
+        "for local load testing"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--recruiters", type=int, default=10)
+        parser.add_argument("--candidates", type=int, default=1000)
+        parser.add_argument("--jobs", type=int, default=500)
+        parser.add_argument("--applications", type=int, default=5000)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--password",
+            default="password123",
+            help="Password of every seeded user",
+        )
+        parser.add_argument(
+            "--prefix",
+            default=None,
+            help="Prefix of seeded emails and job titles, random by default",
+        )
+        parser.add_argument("--seed", type=int, default=None, help="Random seed")
+
+    def handle(self, *args, **options):
+        if options["applications"] > options["candidates"] * options["jobs"]:
+            raise CommandError("More applications than candidate/job pairs")
+        if options["applications"] and not (options["candidates"] and options["jobs"]):
+            raise CommandError("Applications need candidates and jobs")
+        if options["jobs"] and not options["recruiters"]:
+            raise CommandError("Jobs need recruiters")
+
+        self.random = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+        self.prefix = options["prefix"] or f"seed-{uuid.uuid4().hex[:6]}"
+        # Hashing once and sharing the hash keeps seeding fast with any hasher
+        self.password = make_password(options["password"])
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            recruiter_ids = self.create_users(UserRole.RECRUITER, options["recruiters"])
+            candidate_ids = self.create_users(UserRole.CANDIDATE, options["candidates"])
+            jobs = self.create_jobs(recruiter_ids, options["jobs"])
+            self.create_applications(jobs, candidate_ids, options["applications"])
+
+            # Bulk inserts skip the signals, so derived data is rebuilt here
+            rebuild_recruiter_stats(recruiter_ids)
+            transaction.on_commit(job_list_cache.bump)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {len(recruiter_ids)} recruiter(s), {len(candidate_ids)} "
+                f"candidate(s), {len(jobs)} job(s) and {options['applications']} "
+                f"application(s) with prefix '{self.prefix}' in "
+                f"{time.perf_counter() - started:.1f}s"
+            )
+        )
+
+    def chunks(self, total):
+        for start in range(0, total, self.batch_size):
+            yield range(start, min(start + self.batch_size, total))
+
+    def create_users(self, role, count):
+        """Insert users and their profiles, return the new user ids"""
+        user_ids = []
+        for chunk in self.chunks(count):
+            users = []
+            for index in chunk:
+                email = f"{self.prefix}-{role.lower()}-{index}@example.com"
+                users.append(
+                    User(
+                        email=email,
+                        username=email,
+                        first_name=role.title(),
+                        last_name=str(index),
+                        password=self.password,
+                        role=role,
+                    )
+                )
+            users = User.objects.bulk_create(users)
+            # Replaces the per-row create_user_profile signal
+            UserProfile.objects.bulk_create([UserProfile(user=user) for user in users])
+            user_ids.extend(user.pk for user in users)
+        return user_ids
+
+    def create_jobs(self, recruiter_ids, count):
+        today = timezone.now().date()
+        jobs = []
+        for chunk in self.chunks(count):
+            batch = [
+                Job(
+                    title=f"{self.random.choice(TITLES)} {self.prefix}-{index}",
+                    description=" ".join(self.random.choices(WORDS, k=30)),
+                    location=self.random.choice(LOCATIONS),
+                    salary=self.random.randrange(20_000, 200_000, 1_000),
+                    deadline=today + timedelta(days=self.random.randint(1, 90)),
+                    status=(
+                        StatusChoices.CLOSED
+                        if self.random.random() < 0.1
+                        else StatusChoices.OPEN
+                    ),
+                    recruiter_id=self.random.choice(recruiter_ids),
+                )
+                for index in chunk
+            ]
+            Job.objects.bulk_create(batch)
+            index_new_jobs(batch)
+            jobs.extend(batch)
+        return jobs
+
+    def create_applications(self, jobs, candidate_ids, count):
+        pairs = set()
+        while len(pairs) < count:
+            pairs.add(
+                (self.random.randrange(len(jobs)), self.random.choice(candidate_ids))
+            )
+
+        statuses = ApplicationStatusChoices.values
+        pairs = list(pairs)
+        for chunk in self.chunks(count):
+            applications = []
+            for job_index, candidate_id in (pairs[index] for index in chunk):
+                job = jobs[job_index]
+                applications.append(
+                    JobApplication(
+                        job=job,
+                        candidate_id=candidate_id,
+                        status=self.random.choices(statuses, weights=[8, 1, 1])[0],
+                        job_title=job.title,
+                        job_deadline=job.deadline,
+                    )
+                )
+            JobApplication.objects.bulk_create(applications)
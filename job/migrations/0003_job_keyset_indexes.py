@@ -0,0 +1,28 @@
+# Generated by Django 5.2.1 on 2026-10-18 13:58
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0002_alter_job_title_jobapplication"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="job",
+            index=models.Index(
+                fields=["deadline", "job_id"], name="job_deadline_job_id_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="jobapplication",
+            index=models.Index(
+                fields=["applied_at", "application_id"],
+                name="application_applied_at_idx",
+            ),
+        ),
+    ]
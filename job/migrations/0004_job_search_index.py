@@ -0,0 +1,66 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+FTS_TABLE = "job_job_fts"
+
+
+def create_search_index(apps, schema_editor):
+    """Create the FTS5 table and index every existing job"""
+    if schema_editor.connection.vendor != "sqlite":
+        return
+
+    Job = apps.get_model("job", "Job")
+    JobSearchDocument = apps.get_model("job", "JobSearchDocument")
+
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        "USING fts5(title, description, location, tokenize='porter unicode61')"
+    )
+    for job in Job.objects.iterator():
+        document = JobSearchDocument.objects.create(job=job)
+        schema_editor.execute(
+            f"INSERT INTO {FTS_TABLE}(rowid, title, description, location) "
+            "VALUES (%s, %s, %s, %s)",
+            [document.pk, job.title, job.description, job.location],
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "sqlite":
+        return
+    schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0003_job_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="JobSearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "job",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_document",
+                        to="job.job",
+                    ),
+                ),
+            ],
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_user_role"),
+        ("job", "0005_job_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RecruiterStats",
+            fields=[
+                (
+                    "recruiter",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="recruiter_stats",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("total_published_job", models.IntegerField(default=0)),
+                ("total_closed_job", models.IntegerField(default=0)),
+                ("total_candidate_application", models.IntegerField(default=0)),
+                ("total_candidate_hired", models.IntegerField(default=0)),
+                ("total_candidate_rejected", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:04
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_timestamps(apps, schema_editor):
+    """Give existing rows a usable timestamp after the column change"""
+    JobApplication = apps.get_model("job", "JobApplication")
+
+    if schema_editor.connection.vendor == "sqlite":
+        # SQLite keeps the old "YYYY-MM-DD" text, which doesn't parse as datetime
+        schema_editor.execute(
+            "UPDATE job_job SET updated_at = updated_at || ' 00:00:00' "
+            "WHERE length(updated_at) = 10"
+        )
+    JobApplication.objects.update(updated_at=F("applied_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0006_recruiterstats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobapplication",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name="job",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.RunPython(backfill_timestamps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.1 on 2026-10-18 15:20
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_job_details(apps, schema_editor):
+    """Copy the title and deadline of each job onto its existing applications"""
+    Job = apps.get_model("job", "Job")
+    JobApplication = apps.get_model("job", "JobApplication")
+
+    jobs = Job.objects.filter(pk=OuterRef("job_id"))
+    JobApplication.objects.update(
+        job_title=Subquery(jobs.values("title")[:1]),
+        job_deadline=Subquery(jobs.values("deadline")[:1]),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0007_precise_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="jobapplication",
+            name="job_title",
+            field=models.CharField(default="", editable=False, max_length=100),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="jobapplication",
+            name="job_deadline",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(copy_job_details, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="jobapplication",
+            name="job_deadline",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="jobapplication",
+            index=models.Index(
+                fields=["candidate", "applied_at", "application_id"],
+                name="application_candidate_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-18 16:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("job", "0008_jobapplication_job_details"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobapplication",
+            index=models.Index(
+                fields=["job", "status", "applied_at", "application_id"],
+                name="application_job_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.1 on 2026-10-18 14:35
+
+import shared.ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Switch the primary keys to time-ordered UUIDv7 defaults.
+
+    The default is applied in Python, so only the migration state changes;
+    SQLite would otherwise rebuild both tables for nothing. Existing rows keep
+    their random ids, since foreign keys, URLs and stored responses refer to
+    them. The ids are stored as 32 hex characters. Random v4 ids cover the
+    whole range and mostly sort after the new ``019...`` ids, so old and new
+    rows stay mixed in the index and ordering by id is not chronological. New
+    ids only append at the end of the index in tables without v4 ids.
+    """
+
+    dependencies = [
+        ("job", "0009_application_job_status_index"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="job",
+                    name="job_id",
+                    field=models.UUIDField(
+                        default=shared.ids.uuid7, primary_key=True, serialize=False
+                    ),
+                ),
+                migrations.AlterField(
+                    model_name="jobapplication",
+                    name="application_id",
+                    field=models.UUIDField(
+                        default=shared.ids.uuid7, primary_key=True, serialize=False
+                    ),
+                ),
+            ],
+        ),
+    ]
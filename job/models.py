@@ -1,10 +1,11 @@
-from django.db import models
+from django.db import models, router, transaction
 from job.choices import StatusChoices, ApplicationStatusChoices
-import uuid
 from core.models import User
+from shared.ids import uuid7
+from dirtyfields import DirtyFieldsMixin
 
-class Job(models.Model):
-    job_id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+class Job(DirtyFieldsMixin, models.Model):
+    job_id = models.UUIDField(primary_key=True, default=uuid7)
     title = models.CharField(max_length=100, unique=True)
     description = models.TextField()
     location = models.CharField(max_length=50)
@@ -12,21 +13,77 @@ class Job(models.Model):
     deadline = models.DateField()
     status = models.CharField(max_length=10, choices=StatusChoices.choices, default=StatusChoices.OPEN)
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateField(auto_now=True)
+    updated_at = models.DateTimeField(auto_now=True)
     recruiter = models.ForeignKey(User, on_delete=models.CASCADE, related_name="jobs")
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["deadline", "job_id"], name="job_deadline_job_id_idx"),
+            models.Index(fields=["status", "deadline", "job_id"], name="job_status_deadline_idx"),
+            models.Index(fields=["location", "salary"], name="job_location_salary_idx"),
+            models.Index(fields=["salary"], name="job_salary_idx"),
+        ]
+
+    # Status drives the recruiter stats, title and deadline are copied onto applications
+    FIELDS_TO_CHECK = ["status", "title", "deadline"]
+
     def __str__(self):
         return f"Job id = {self.job_id}, Job title = {self.title}, posted by {self.recruiter.first_name}"
+
+    def save(self, *args, **kwargs):
+        # Keep the row and the recruiter stats updated by signals in one transaction
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
     
-class JobApplication(models.Model):
-    application_id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+class JobApplication(DirtyFieldsMixin, models.Model):
+    application_id = models.UUIDField(primary_key=True, default=uuid7)
     job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name="applications")
     candidate = models.ForeignKey(User, on_delete=models.CASCADE, related_name="applications")
     status = models.CharField(max_length=10, choices=ApplicationStatusChoices.choices, default=ApplicationStatusChoices.APPLIED)
     applied_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    # Copied from the job so a candidate's applications are listed without a join
+    job_title = models.CharField(max_length=100, editable=False)
+    job_deadline = models.DateField(editable=False)
 
     class Meta:
         unique_together = ("candidate", "job")
+        indexes = [
+            models.Index(fields=["applied_at", "application_id"], name="application_applied_at_idx"),
+            models.Index(fields=["candidate", "applied_at", "application_id"], name="application_candidate_idx"),
+            models.Index(fields=["job", "status", "applied_at", "application_id"], name="application_job_status_idx"),
+        ]
+
+    FIELDS_TO_CHECK = ["status"]
+
+    def __str__(self):
+        return f"{self.candidate.email} => {self.job_title}"
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            super().save(*args, **kwargs)
+
+class JobSearchDocument(models.Model):
+    """Maps a job to the integer rowid of its full-text search entry"""
+
+    job = models.OneToOneField(Job, on_delete=models.CASCADE, related_name="search_document")
+
+    def __str__(self):
+        return f"Search document {self.pk} for job {self.job_id}"
+
+
+class RecruiterStats(models.Model):
+    """Dashboard counters of a recruiter, maintained incrementally"""
+
+    recruiter = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name="recruiter_stats")
+    total_published_job = models.IntegerField(default=0)
+    total_closed_job = models.IntegerField(default=0)
+    total_candidate_application = models.IntegerField(default=0)
+    total_candidate_hired = models.IntegerField(default=0)
+    total_candidate_rejected = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.candidate.email} => {self.job.title}"
\ No newline at end of file
+        return f"Stats of {self.recruiter_id}"
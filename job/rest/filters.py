@@ -0,0 +1,132 @@
+from drf_yasg import openapi
+from rest_framework import serializers
+from rest_framework.filters import BaseFilterBackend
+
+from job.choices import ApplicationStatusChoices, StatusChoices
+
+
+class JobFilterSerializer(serializers.Serializer):
+    """Validate job list query parameters"""
+
+    location = serializers.CharField(required=False, max_length=50)
+    salary__gte = serializers.IntegerField(required=False, min_value=0)
+    salary__lte = serializers.IntegerField(required=False, min_value=0)
+    status = serializers.ChoiceField(required=False, choices=StatusChoices.choices)
+    deadline__gte = serializers.DateField(required=False)
+    deadline__lte = serializers.DateField(required=False)
+
+    def validate(self, data):
+        if data.get("salary__gte", 0) > data.get("salary__lte", float("inf")):
+            raise serializers.ValidationError(
+                "salary__gte must not be greater than salary__lte"
+            )
+        if (
+            "deadline__gte" in data
+            and "deadline__lte" in data
+            and data["deadline__gte"] > data["deadline__lte"]
+        ):
+            raise serializers.ValidationError(
+                "deadline__gte must not be later than deadline__lte"
+            )
+        return data
+
+
+class ApplicationFilterSerializer(serializers.Serializer):
+    """Validate application list query parameters"""
+
+    status = serializers.ChoiceField(
+        required=False, choices=ApplicationStatusChoices.choices
+    )
+
+
+class ApplicationExportSerializer(ApplicationFilterSerializer):
+    """Validate application export query parameters"""
+
+    job = serializers.UUIDField(required=False)
+    output = serializers.ChoiceField(
+        required=False, choices=["csv", "ndjson"], default="csv"
+    )
+
+
+class JobFilterBackend(BaseFilterBackend):
+    """
+    Filter jobs by location, salary range, status and deadline window.
+
+    Every combination is served by one of the composite indexes on ``Job``:
+    ``(location, salary)``, ``(status, deadline)`` or ``(deadline, job_id)``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        serializer = JobFilterSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return queryset.filter(**serializer.validated_data)
+
+
+job_filter_parameters = [
+    openapi.Parameter(
+        name="location",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        description="Exact job location",
+    ),
+    openapi.Parameter(
+        name="salary__gte",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_INTEGER,
+        description="Minimum salary",
+    ),
+    openapi.Parameter(
+        name="salary__lte",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_INTEGER,
+        description="Maximum salary",
+    ),
+    openapi.Parameter(
+        name="status",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=StatusChoices.values,
+        description="Job status",
+    ),
+    openapi.Parameter(
+        name="deadline__gte",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        format=openapi.FORMAT_DATE,
+        description="Earliest deadline (YYYY-MM-DD)",
+    ),
+    openapi.Parameter(
+        name="deadline__lte",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        format=openapi.FORMAT_DATE,
+        description="Latest deadline (YYYY-MM-DD)",
+    ),
+]
+
+application_filter_parameters = [
+    openapi.Parameter(
+        name="status",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=ApplicationStatusChoices.values,
+        description="Application status",
+    ),
+]
+
+application_export_parameters = application_filter_parameters + [
+    openapi.Parameter(
+        name="job",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        format=openapi.FORMAT_UUID,
+        description="Only export applications of this job",
+    ),
+    openapi.Parameter(
+        name="output",
+        in_=openapi.IN_QUERY,
+        type=openapi.TYPE_STRING,
+        enum=["csv", "ndjson"],
+        description="File format, defaults to csv",
+    ),
+]
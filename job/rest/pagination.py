@@ -0,0 +1,46 @@
+from django.db.models import F
+
+from job.search import search_documents
+from shared.pagination import KeysetPagination
+
+
+class JobCursorPagination(KeysetPagination):
+    """Keyset pagination over jobs ordered by deadline"""
+
+    ordering = ("deadline", "job_id")
+
+
+class JobApplicationCursorPagination(KeysetPagination):
+    """Keyset pagination over applications ordered by application time"""
+
+    ordering = ("applied_at", "application_id")
+
+
+class JobSearchPagination(KeysetPagination):
+    """Keyset pagination over full-text search results ranked by BM25"""
+
+    ordering = ("search_score", "document_id")
+    search_query_param = "q"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        position, reverse = self.start_page(request)
+        rows = search_documents(
+            request.query_params.get(self.search_query_param, ""),
+            position=position,
+            reverse=reverse,
+            limit=self.page_size + 1,
+            using=queryset.db,
+        )
+        scores = {document_id: score for score, document_id in rows}
+
+        jobs = queryset.filter(search_document__in=scores).annotate(
+            document_id=F("search_document")
+        )
+        for job in jobs:
+            job.search_score = scores[job.document_id]
+        ranked = sorted(jobs, key=self.get_position, reverse=reverse)
+
+        return self.finish_page(ranked)
+
+    def parse_position(self, raw_position):
+        return [float(raw_position[0]), int(raw_position[1])]
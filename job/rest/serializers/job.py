@@ -1,10 +1,12 @@
 from django.utils import timezone
 from rest_framework import serializers
 
+from job.choices import ApplicationStatusChoices
 from job.models import Job, JobApplication
+from shared.serializers import DynamicFieldsModelSerializer
 
 
-class JobSerializer(serializers.ModelSerializer):
+class JobSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Job
         fields = [
@@ -39,7 +41,8 @@ class JobSerializer(serializers.ModelSerializer):
         return value
 
     def update(self, instance, validated_data):
-        update_fields = []
+        # updated_at drives the ETag / Last-Modified validators
+        update_fields = ["updated_at"]
 
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
@@ -50,7 +53,17 @@ class JobSerializer(serializers.ModelSerializer):
         return instance
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobBulkItemSerializer(JobSerializer):
+    """Job payload of a bulk create, title uniqueness is checked for the whole batch"""
+
+    class Meta(JobSerializer.Meta):
+        extra_kwargs = {
+            **JobSerializer.Meta.extra_kwargs,
+            "title": {"validators": []},
+        }
+
+
+class JobApplicationSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = JobApplication
         fields = ["application_id", "job", "candidate", "status", "applied_at"]
@@ -63,12 +76,58 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         }
 
 
+class CandidateApplicationSerializer(DynamicFieldsModelSerializer):
+    """Application of the requesting candidate with the job details copied onto it"""
+
+    class Meta:
+        model = JobApplication
+        fields = [
+            "application_id",
+            "job",
+            "job_title",
+            "job_deadline",
+            "status",
+            "applied_at",
+        ]
+        read_only_fields = fields
+
+
 class UpdateJobApplicationSerializer(serializers.ModelSerializer):
     class Meta:
         model = JobApplication
         fields = ["status"]
 
     def update(self, instance, validated_data):
-        instance.save(update_fields=["status"])
+        instance.status = validated_data.get("status", instance.status)
+        instance.save(update_fields=["status", "updated_at"])
 
         return instance
+
+
+class BulkApplicationStatusSerializer(serializers.Serializer):
+    """Move many applications of the recruiter's jobs to HIRED or REJECTED"""
+
+    application_ids = serializers.ListField(
+        child=serializers.UUIDField(), allow_empty=False, max_length=1000
+    )
+    status = serializers.ChoiceField(
+        choices=[
+            ApplicationStatusChoices.HIRED,
+            ApplicationStatusChoices.REJECTED,
+        ]
+    )
+
+
+class JobImportSerializer(serializers.Serializer):
+    """Upload of a CSV or NDJSON file of job postings"""
+
+    file = serializers.FileField()
+    file_format = serializers.ChoiceField(choices=["csv", "ndjson"], required=False)
+
+    def validate(self, data):
+        if "file_format" not in data:
+            name = data["file"].name.lower()
+            data["file_format"] = (
+                "ndjson" if name.endswith((".ndjson", ".jsonl")) else "csv"
+            )
+        return data
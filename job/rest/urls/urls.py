@@ -1,6 +1,12 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
+from job.rest.views.async_job import (
+    AsyncJobApplicationDetailAPIView,
+    AsyncJobApplicationListAPIView,
+    AsyncJobDetailAPIView,
+    AsyncJobListAPIView,
+)
 from job.rest.views.job import (
     JobApplicationViewSet,
     JobViewSet,
@@ -13,6 +19,22 @@ urlpatterns = [
         SpecificRecruiterDashboardAPIView.as_view(),
         name="recruiter-dashboard",
     ),
+    path("async/job/", AsyncJobListAPIView.as_view(), name="async-job-list"),
+    path(
+        "async/job/<uuid:pk>/",
+        AsyncJobDetailAPIView.as_view(),
+        name="async-job-detail",
+    ),
+    path(
+        "async/application/",
+        AsyncJobApplicationListAPIView.as_view(),
+        name="async-application-list",
+    ),
+    path(
+        "async/application/<uuid:pk>/",
+        AsyncJobApplicationDetailAPIView.as_view(),
+        name="async-application-detail",
+    ),
 ]
 
 router = DefaultRouter()
@@ -0,0 +1,72 @@
+from rest_framework.exceptions import NotFound
+
+from auth.authentication import ClaimsJWTAuthentication
+from auth.permissions import AsyncIsRecruiter, AsyncIsRecruiterOrCandidateOrAdmin
+from job.models import Job, JobApplication
+from job.rest.filters import JobFilterBackend
+from job.rest.pagination import JobApplicationCursorPagination, JobCursorPagination
+from job.rest.serializers.job import JobApplicationSerializer, JobSerializer
+from shared.async_views import AsyncAPIView
+
+
+class AsyncJobListAPIView(AsyncAPIView):
+    """List jobs on the event loop, same filters and cursors as the job list"""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [AsyncIsRecruiterOrCandidateOrAdmin]
+
+    async def get(self, request):
+        queryset = JobFilterBackend().filter_queryset(request, Job.objects.all(), self)
+        paginator = JobCursorPagination()
+        page = await paginator.apaginate_queryset(queryset, request, view=self)
+        return self.get_paginated_response(
+            paginator, JobSerializer(page, many=True).data
+        )
+
+
+class AsyncJobDetailAPIView(AsyncAPIView):
+    """Retrieve a single job on the event loop"""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [AsyncIsRecruiter]
+
+    async def get(self, request, pk):
+        try:
+            job = await Job.objects.aget(pk=pk)
+        except Job.DoesNotExist:
+            raise NotFound("No Job matches the given query.")
+
+        await self.check_object_permissions(request, job)
+        return self.json_response(JobSerializer(job).data)
+
+
+class AsyncJobApplicationListAPIView(AsyncAPIView):
+    """List applications on the event loop, same cursors as the application list"""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [AsyncIsRecruiter]
+
+    async def get(self, request):
+        paginator = JobApplicationCursorPagination()
+        page = await paginator.apaginate_queryset(
+            JobApplication.objects.all(), request, view=self
+        )
+        return self.get_paginated_response(
+            paginator, JobApplicationSerializer(page, many=True).data
+        )
+
+
+class AsyncJobApplicationDetailAPIView(AsyncAPIView):
+    """Retrieve a single application on the event loop"""
+
+    authentication_classes = [ClaimsJWTAuthentication]
+    permission_classes = [AsyncIsRecruiter]
+
+    async def get(self, request, pk):
+        try:
+            application = await JobApplication.objects.aget(pk=pk)
+        except JobApplication.DoesNotExist:
+            raise NotFound("No JobApplication matches the given query.")
+
+        await self.check_object_permissions(request, application)
+        return self.json_response(JobApplicationSerializer(application).data)
@@ -1,37 +1,128 @@
+import csv
 import logging
+import os
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Count
+from django.http import FileResponse
 from django.utils import timezone
+from django.utils.decorators import method_decorator
 
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework import status, viewsets
-from rest_framework.exceptions import ValidationError
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
+from rest_framework.generics import get_object_or_404
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
 from auth.permissions import IsCandidate, IsRecruiter, IsRecruiterOrCandidateOrAdmin
-from job.choices import ApplicationStatusChoices, StatusChoices
+from core.idempotency import IdempotencyMixin
+from job.applications import apply_to_job
+from job.bulk import JobBulkCreator
+from job.cache import job_list_cache
+from job.choices import ApplicationStatusChoices
+from job.imports import JobImporter, get_report_path
 from job.models import Job, JobApplication
+from job.rest.filters import (
+    ApplicationExportSerializer,
+    ApplicationFilterSerializer,
+    JobFilterBackend,
+    application_export_parameters,
+    application_filter_parameters,
+    job_filter_parameters,
+)
+from job.rest.pagination import (
+    JobApplicationCursorPagination,
+    JobCursorPagination,
+    JobSearchPagination,
+)
 from job.rest.serializers.job import (
+    BulkApplicationStatusSerializer,
+    CandidateApplicationSerializer,
     JobApplicationSerializer,
+    JobBulkItemSerializer,
+    JobImportSerializer,
     JobSerializer,
     UpdateJobApplicationSerializer,
 )
+from job.stats import (
+    bump_application_transitions,
+    get_recruiter_stats,
+    rebuild_recruiter_stats,
+)
+from shared.exceptions import Conflict
+from shared.mixins import ConditionalGetMixin, SparseFieldsetMixin
+from shared.streaming import streaming_file_response
 
 logger = logging.getLogger(__name__)
 
 
-class JobViewSet(viewsets.ModelViewSet):
+@method_decorator(
+    name="list", decorator=swagger_auto_schema(manual_parameters=job_filter_parameters)
+)
+class JobViewSet(
+    IdempotencyMixin, SparseFieldsetMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """Handles job creation and management by recruiters"""
 
-    queryset = Job.objects.select_related("recruiter").order_by("deadline")
+    queryset = Job.objects.select_related("recruiter").order_by("deadline", "job_id")
     serializer_class = JobSerializer
+    pagination_class = JobCursorPagination
+    filter_backends = [JobFilterBackend]
+    # Worst case queries per action with a cold cache, an Idempotency-Key and
+    # session authentication, which costs one query more than a token. Checked
+    # by shared.query_budget.QueryBudgetMiddleware and job.tests. Imports have
+    # none, they save one chunk at a time so their queries grow with the file
+    query_budgets = {
+        "list": 3,
+        "retrieve": 3,
+        "create": 11,
+        "update": 10,
+        "partial_update": 10,
+        "destroy": 15,
+        "bulk_create": 21,
+        "import_errors": 2,
+        "search": 4,
+        "applications": 5,
+    }
+    idempotency_lock_timeouts = {
+        "import_jobs": settings.JOB_IMPORT_IDEMPOTENCY_LOCK_TIMEOUT,
+    }
 
     def get_permissions(self):
-        if self.action == "list":
+        if self.action in ["list", "search"]:
             self.permission_classes = [IsRecruiterOrCandidateOrAdmin]
         else:
             self.permission_classes = [IsRecruiter]
 
         return super().get_permissions()
 
+    def list(self, request, *args, **kwargs):
+        """List jobs, served from the versioned cache when possible"""
+
+        key = job_list_cache.make_key(
+            request.get_host(), sorted(request.query_params.lists())
+        )
+        cached = job_list_cache.get(key)
+        if cached is not None:
+            data, etag = cached
+            response = self.conditional_response(request, etag)
+            if response is None:
+                response = self.set_validators(Response(data), etag)
+            response["X-Cache"] = "HIT"
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            job_list_cache.set(key, (response.data, response["ETag"]))
+        response["X-Cache"] = "MISS"
+        return response
+
     def perform_create(self, serializer):
         try:
             serializer.save(recruiter=self.request.user)
@@ -39,80 +130,355 @@ class JobViewSet(viewsets.ModelViewSet):
             logger.exception(f"Error creating the job: {str(e)}")
             raise ValidationError("Something went wrong while creating the job")
 
+    @swagger_auto_schema(request_body=JobBulkItemSerializer(many=True))
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request):
+        """Create many jobs at once, reporting errors per item"""
+
+        if not isinstance(request.data, list) or not request.data:
+            raise ValidationError("Expected a non-empty list of jobs")
+        if len(request.data) > settings.JOB_BULK_CREATE_MAX_ITEMS:
+            raise ValidationError(
+                f"At most {settings.JOB_BULK_CREATE_MAX_ITEMS} jobs can be created at once"
+            )
+
+        creator = JobBulkCreator(request.user)
+        entries = [
+            entry
+            for entry in (
+                creator.validate(index, data) for index, data in enumerate(request.data)
+            )
+            if entry is not None
+        ]
+        try:
+            created = creator.save(entries)
+        except Exception as e:
+            logger.exception(f"Error bulk creating jobs: {str(e)}")
+            raise ValidationError("Something went wrong while creating the jobs")
+
+        if not creator.errors:
+            response_status = status.HTTP_201_CREATED
+        elif created:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        return Response(
+            {
+                "created": JobSerializer(created, many=True).data,
+                "errors": sorted(creator.errors, key=lambda error: error["index"]),
+            },
+            status=response_status,
+        )
+
+    @swagger_auto_schema(request_body=JobImportSerializer)
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        parser_classes=[MultiPartParser],
+    )
+    def import_jobs(self, request):
+        """Create jobs from an uploaded CSV or NDJSON file, row by row"""
+
+        serializer = JobImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        importer = JobImporter(request.user)
+        try:
+            importer.run(
+                serializer.validated_data["file"],
+                serializer.validated_data["file_format"],
+            )
+        except UnicodeDecodeError:
+            raise ValidationError({"file": "File must be UTF-8 encoded"})
+        except csv.Error as e:
+            raise ValidationError({"file": f"Malformed CSV: {str(e)}"})
+        except Exception as e:
+            logger.exception(f"Error importing jobs: {str(e)}")
+            raise ValidationError("Something went wrong while importing the jobs")
+
+        if not importer.failed_count:
+            response_status = status.HTTP_201_CREATED
+        elif importer.created_count:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+
+        error_report = None
+        if importer.report_id:
+            error_report = reverse(
+                "job-import-errors",
+                kwargs={"report_id": importer.report_id},
+                request=request,
+            )
+        return Response(
+            {
+                "created": importer.created_count,
+                "failed": importer.failed_count,
+                "error_report": error_report,
+            },
+            status=response_status,
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"import/(?P<report_id>[0-9a-f]{32})/errors",
+    )
+    def import_errors(self, request, report_id):
+        """Download the per-row error report of a job import"""
+
+        path = get_report_path(request.user.pk, report_id)
+        if not os.path.exists(path):
+            raise NotFound("Error report not found")
+        return FileResponse(
+            open(path, "rb"),
+            as_attachment=True,
+            filename="job-import-errors.csv",
+            content_type="text/csv",
+        )
+
+    @swagger_auto_schema(
+        manual_parameters=[
+            openapi.Parameter(
+                name="q",
+                in_=openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                required=True,
+                description="Search terms matched against title, description and location",
+            ),
+        ],
+    )
+    @action(detail=False, methods=["get"], pagination_class=JobSearchPagination)
+    def search(self, request):
+        """Full-text search over jobs ranked by relevance"""
+
+        if not request.query_params.get("q", "").strip():
+            raise ValidationError({"q": "This query parameter is required"})
+
+        page = self.paginate_queryset(self.get_queryset())
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
+
+    @swagger_auto_schema(manual_parameters=application_filter_parameters)
+    @action(
+        detail=True,
+        methods=["get"],
+        pagination_class=JobApplicationCursorPagination,
+    )
+    def applications(self, request, pk=None):
+        """List applications of one of the recruiter's jobs with per-status counts"""
+
+        job = get_object_or_404(
+            Job.objects.filter(recruiter=request.user).only("job_id"), pk=pk
+        )
+        filters = ApplicationFilterSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        # Both queries are served by the (job, status, applied_at) index
+        applications = JobApplication.objects.filter(job=job)
+        status_counts = dict.fromkeys(ApplicationStatusChoices.values, 0)
+        status_counts.update(
+            applications.order_by().values_list("status").annotate(total=Count("*"))
+        )
+
+        page = self.paginate_queryset(
+            applications.filter(**filters.validated_data).only(
+                "application_id", "job_id", "candidate_id", "status", "applied_at"
+            )
+        )
+        response = self.get_paginated_response(
+            JobApplicationSerializer(page, many=True).data
+        )
+        response.data["status_counts"] = status_counts
+        return response
+
 
-class JobApplicationViewSet(viewsets.ModelViewSet):
+class JobApplicationViewSet(
+    IdempotencyMixin, SparseFieldsetMixin, ConditionalGetMixin, viewsets.ModelViewSet
+):
     """Handle job applications by candidates and review by recruiters"""
 
     queryset = JobApplication.objects.select_related("job", "candidate").order_by(
-        "applied_at"
+        "applied_at", "application_id"
     )
+    pagination_class = JobApplicationCursorPagination
+    query_budgets = {
+        "list": 3,
+        "retrieve": 3,
+        "create": 7,
+        "update": 5,
+        "partial_update": 5,
+        "destroy": 5,
+        "mine": 3,
+        "export": 2,
+        "bulk_status": 7,
+    }
 
     def get_serializer_class(self):
         """Return serializers based on action"""
 
         if self.action in ["update", "partial_update"]:
             return UpdateJobApplicationSerializer
+        elif self.action == "mine":
+            return CandidateApplicationSerializer
         else:
             return JobApplicationSerializer
 
     def get_permissions(self):
         """Assign permission based on action"""
 
-        if self.action == "create":
+        if self.action in ["create", "mine"]:
             self.permission_classes = [IsCandidate]
         else:
             self.permission_classes = [IsRecruiter]
         return super().get_permissions()
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action != "mine":
+            return queryset
+
+        # Served by the (candidate, applied_at) index without joining jobs
+        queryset = queryset.select_related(None).filter(candidate=self.request.user)
+        if self.get_sparse_fields() is None:
+            queryset = queryset.only(
+                *self.get_projection(
+                    queryset.model, CandidateApplicationSerializer.Meta.fields
+                )
+            )
+        return queryset
+
     def perform_create(self, serializer):
-        """Handle job application creation with validation for duplicates and job status"""
+        """Apply to a job with a conditional insert, duplicates surface as 409"""
 
-        candidate = self.request.user
         job = serializer.validated_data.get("job")
-
-        if job.deadline < timezone.now().date() or job.status == StatusChoices.CLOSED:
-            raise ValidationError("This job is no longer accepting applications")
-        if JobApplication.objects.filter(candidate=candidate, job=job).exists():
-            raise ValidationError("You have already applied for this job")
         try:
-            serializer.save(candidate=candidate)
+            application = apply_to_job(job, self.request.user)
+        except IntegrityError as e:
+            # Only the (candidate, job) unique constraint means a duplicate
+            if (
+                JobApplication.objects.using("default")
+                .filter(job=job, candidate=self.request.user)
+                .exists()
+            ):
+                raise Conflict("You have already applied for this job")
+            logger.exception(f"Error during job application creation: {str(e)}")
+            raise ValidationError("Something wrong while applying to the job")
         except Exception as e:
             logger.exception(f"Error during job application creation: {str(e)}")
             raise ValidationError("Something wrong while applying to the job")
 
+        if application is None:
+            raise ValidationError("This job is no longer accepting applications")
+        serializer.instance = application
+
+    @action(detail=False, methods=["get"])
+    def mine(self, request):
+        """List the requesting candidate's applications by application time"""
+
+        return self.list(request)
+
+    @swagger_auto_schema(manual_parameters=application_export_parameters)
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Stream all applications of the recruiter's jobs as CSV or NDJSON"""
+
+        filters = ApplicationExportSerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+        options = dict(filters.validated_data)
+        output = options.pop("output")
+
+        columns = [
+            "application_id",
+            "job_id",
+            "job_title",
+            "job_deadline",
+            "candidate_id",
+            "candidate__email",
+            "candidate__first_name",
+            "candidate__last_name",
+            "status",
+            "applied_at",
+        ]
+        applications = JobApplication.objects.filter(
+            job__recruiter=request.user, **options
+        )
+        rows = (
+            # Route now, the rows are only read once the response streams
+            applications.using(applications.db)
+            .order_by("applied_at", "application_id")
+            .values_list(*columns)
+            .iterator(chunk_size=settings.APPLICATION_EXPORT_CHUNK_SIZE)
+        )
+        header = [column.replace("__", "_") for column in columns]
+        return streaming_file_response(output, header, rows, "applications")
+
+    @swagger_auto_schema(request_body=BulkApplicationStatusSerializer)
+    @action(detail=False, methods=["post"], url_path="bulk-status")
+    def bulk_status(self, request):
+        """Hire or reject many applications of the recruiter's jobs at once"""
+
+        serializer = BulkApplicationStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        application_ids = set(serializer.validated_data["application_ids"])
+        new_status = serializer.validated_data["status"]
+
+        with transaction.atomic():
+            owned = dict(
+                JobApplication.objects.filter(
+                    pk__in=application_ids, job__recruiter=request.user
+                ).values_list("pk", "status")
+            )
+            unknown = application_ids - owned.keys()
+            if unknown:
+                raise PermissionDenied(
+                    {
+                        "details": "Some applications don't belong to your jobs",
+                        "application_ids": sorted(str(pk) for pk in unknown),
+                    }
+                )
+
+            changing = [pk for pk, old in owned.items() if old != new_status]
+            updated = (
+                JobApplication.objects.filter(pk__in=changing)
+                .exclude(status=new_status)
+                .update(status=new_status, updated_at=timezone.now())
+            )
+
+            if updated == len(changing):
+                bump_application_transitions(
+                    request.user.pk, [owned[pk] for pk in changing], new_status
+                )
+            else:
+                # Some rows changed concurrently, recount instead of guessing
+                rebuild_recruiter_stats([request.user.pk])
+
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
 
 class SpecificRecruiterDashboardAPIView(APIView):
     """Provide job and application stats for the recruiter"""
 
     permission_classes = [IsRecruiter]
+    # Recruiters get their stats row when they are created, so this is a
+    # single read; older recruiters without one rebuild it on first access
+    query_budgets = {"get": 3}
 
     def get(self, request):
         """Return recruiter specific dashboard stats"""
 
         try:
-            recruiter = request.user
-
-            total_published_job = Job.objects.filter(recruiter=recruiter).count()
-            total_closed_job = Job.objects.filter(
-                recruiter=recruiter, status=StatusChoices.CLOSED
-            ).count()
-            total_candidate_application = JobApplication.objects.filter(
-                job__recruiter=recruiter
-            ).count()
-            total_candidate_hired = JobApplication.objects.filter(
-                job__recruiter=recruiter, status=ApplicationStatusChoices.HIRED
-            ).count()
-            total_candidate_rejected = JobApplication.objects.filter(
-                job__recruiter=recruiter, status=ApplicationStatusChoices.REJECTED
-            ).count()
+            stats = get_recruiter_stats(request.user.pk)
 
             return Response(
                 {
-                    "total_published_job": total_published_job,
-                    "total_closed_job": total_closed_job,
-                    "total_candidate_application": total_candidate_application,
-                    "total_candidate_hired": total_candidate_hired,
-                    "total_candidate_rejected": total_candidate_rejected,
+                    "total_published_job": stats.total_published_job,
+                    "total_closed_job": stats.total_closed_job,
+                    "total_candidate_application": stats.total_candidate_application,
+                    "total_candidate_hired": stats.total_candidate_hired,
+                    "total_candidate_rejected": stats.total_candidate_rejected,
                 }
             )
         except Exception as e:
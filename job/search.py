@@ -0,0 +1,91 @@
+from django.db import connections, transaction
+
+from job.models import JobSearchDocument
+
+FTS_TABLE = "job_job_fts"
+
+# Column weights for bm25(): title, description, location
+BM25_WEIGHTS = (10.0, 1.0, 5.0)
+
+INDEXED_FIELDS = {"title", "description", "location"}
+
+
+def build_match_expression(query):
+    """Turn free text into an FTS5 query that ANDs every quoted term"""
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms if term)
+
+
+def index_job(job, using="default"):
+    """Insert or replace the full-text entry of a job"""
+    with transaction.atomic(using=using):
+        document, _ = JobSearchDocument.objects.using(using).get_or_create(job=job)
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [document.pk])
+            cursor.execute(
+                f"INSERT INTO {FTS_TABLE}(rowid, title, description, location) "
+                "VALUES (%s, %s, %s, %s)",
+                [document.pk, job.title, job.description, job.location],
+            )
+
+
+def index_new_jobs(jobs, using="default"):
+    """Index freshly bulk-inserted jobs, which never had an entry before"""
+    documents = JobSearchDocument.objects.using(using).bulk_create(
+        [JobSearchDocument(job=job) for job in jobs]
+    )
+    with connections[using].cursor() as cursor:
+        cursor.executemany(
+            f"INSERT INTO {FTS_TABLE}(rowid, title, description, location) "
+            "VALUES (%s, %s, %s, %s)",
+            [
+                (document.pk, job.title, job.description, job.location)
+                for document, job in zip(documents, jobs)
+            ],
+        )
+
+
+def unindex_document(document_id, using="default"):
+    """Remove a full-text entry by its rowid"""
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [document_id])
+
+
+def unindex_documents(documents, using="default"):
+    """Remove the full-text entries of a ``JobSearchDocument`` queryset at once"""
+    sql, params = documents.using(using).values("pk").query.sql_with_params()
+    with connections[using].cursor() as cursor:
+        cursor.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({sql})", params)
+
+
+def search_documents(query, position=None, reverse=False, limit=20, using="default"):
+    """
+    Return ``(score, document_id)`` rows ranked by BM25, best match first.
+
+    ``position`` is the ``(score, document_id)`` of the last row already seen;
+    only rows strictly after it (or before it when ``reverse``) are returned.
+    """
+    expression = build_match_expression(query)
+    if not expression:
+        return []
+
+    weights = ", ".join(str(weight) for weight in BM25_WEIGHTS)
+    sql = (
+        f"SELECT score, rowid FROM ("
+        f"SELECT rowid, bm25({FTS_TABLE}, {weights}) AS score "
+        f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s)"
+    )
+    params = [expression]
+
+    comparison = "<" if reverse else ">"
+    if position is not None:
+        sql += f" WHERE score {comparison} %s OR (score = %s AND rowid {comparison} %s)"
+        params += [position[0], position[0], position[1]]
+
+    direction = "DESC" if reverse else "ASC"
+    sql += f" ORDER BY score {direction}, rowid {direction} LIMIT %s"
+    params.append(limit)
+
+    with connections[using].cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.fetchall()
@@ -0,0 +1,183 @@
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from core.choices import UserRole
+from core.models import User
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.models import Job, JobApplication, JobSearchDocument, RecruiterStats
+from job.search import INDEXED_FIELDS, index_job, unindex_document, unindex_documents
+from job.stats import (
+    application_status_deltas,
+    bump_recruiter_stats,
+    uncount_applications,
+)
+
+
+def get_origin_model(origin):
+    """The model whose ``delete()`` started a delete, None when unknown"""
+    if origin is None:
+        return None
+    return origin.model if isinstance(origin, QuerySet) else type(origin)
+
+
+@receiver(post_save, sender=Job)
+def sync_job_search_index(sender, instance, created, update_fields=None, **kwargs):
+    """Keep the full-text entry of a job in sync with its searchable fields."""
+    if update_fields is not None and not INDEXED_FIELDS.intersection(update_fields):
+        return
+    index_job(instance, using=kwargs["using"])
+
+
+@receiver(post_delete, sender=JobSearchDocument)
+def remove_job_search_entry(sender, instance, origin=None, **kwargs):
+    """Drop the full-text entry when its job (and document) is deleted."""
+    # Entries of a deleted recruiter go at once in forget_deleted_user
+    if get_origin_model(origin) is User:
+        return
+    unindex_document(instance.pk, using=kwargs["using"])
+
+
+@receiver(pre_save, sender=Job)
+@receiver(pre_save, sender=JobApplication)
+def remember_previous_status(sender, instance, update_fields=None, **kwargs):
+    """Keep the stored status around so post_save can count the transition."""
+    if instance._state.adding:
+        instance._previous_status = None
+    elif update_fields is not None and "status" not in update_fields:
+        instance._previous_status = instance.status
+    else:
+        instance._previous_status = instance.get_dirty_fields().get(
+            "status", instance.status
+        )
+
+
+@receiver(pre_save, sender=JobApplication)
+def copy_job_details(sender, instance, **kwargs):
+    """Copy the job title and deadline onto a new application."""
+    if instance._state.adding:
+        instance.job_title = instance.job.title
+        instance.job_deadline = instance.job.deadline
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_details_change(sender, instance, update_fields=None, **kwargs):
+    """Note whether the copied job details change so post_save can propagate them."""
+    details = {"title", "deadline"}
+    if update_fields is not None:
+        details = details.intersection(update_fields)
+    instance._job_details_changed = not instance._state.adding and bool(
+        details.intersection(instance.get_dirty_fields())
+    )
+
+
+@receiver(post_save, sender=Job)
+def sync_application_job_details(sender, instance, created, **kwargs):
+    """Refresh the job title and deadline copied onto the job's applications."""
+    if created or not instance._job_details_changed:
+        return
+    JobApplication.objects.using(kwargs["using"]).filter(job=instance).update(
+        job_title=instance.title,
+        job_deadline=instance.deadline,
+        updated_at=timezone.now(),
+    )
+
+
+@receiver(post_save, sender=Job)
+def count_job_stats(sender, instance, created, **kwargs):
+    """Count published and closed jobs of the recruiter."""
+    closed = instance.status == StatusChoices.CLOSED
+    if created:
+        deltas = {"total_published_job": 1, "total_closed_job": int(closed)}
+    else:
+        was_closed = instance._previous_status == StatusChoices.CLOSED
+        deltas = {"total_closed_job": int(closed) - int(was_closed)}
+    bump_recruiter_stats(instance.recruiter_id, using=kwargs["using"], **deltas)
+
+
+@receiver(post_delete, sender=Job)
+def uncount_job_stats(sender, instance, origin=None, **kwargs):
+    """Remove a deleted job from the recruiter counters."""
+    # A deleted recruiter takes their counters with them
+    if get_origin_model(origin) is User:
+        return
+    bump_recruiter_stats(
+        instance.recruiter_id,
+        create_missing=False,
+        using=kwargs["using"],
+        total_published_job=-1,
+        total_closed_job=-int(instance.status == StatusChoices.CLOSED),
+    )
+
+
+@receiver(post_save, sender=JobApplication)
+def count_application_stats(sender, instance, created, **kwargs):
+    """Count applications, hires and rejections of the job's recruiter."""
+    if created:
+        deltas = {"total_candidate_application": 1}
+        deltas.update(application_status_deltas(None, instance.status))
+    else:
+        deltas = application_status_deltas(instance._previous_status, instance.status)
+    bump_recruiter_stats(instance.job.recruiter_id, using=kwargs["using"], **deltas)
+
+
+@receiver(pre_delete, sender=Job)
+def uncount_job_applications(sender, instance, origin=None, **kwargs):
+    """Remove the applications of a job about to be deleted, in one UPDATE."""
+    if get_origin_model(origin) is User:
+        return
+    using = kwargs["using"]
+    uncount_applications(JobApplication.objects.filter(job=instance.pk), using=using)
+
+
+@receiver(post_delete, sender=JobApplication)
+def uncount_application_stats(sender, instance, origin=None, **kwargs):
+    """Remove a deleted application from the recruiter counters."""
+    # Cascades from a job or user are counted in bulk before the delete
+    if get_origin_model(origin) in (Job, User):
+        return
+    deltas = {"total_candidate_application": -1}
+    deltas.update(application_status_deltas(instance.status, None))
+    bump_recruiter_stats(
+        job_id=instance.job_id,
+        create_missing=False,
+        using=kwargs["using"],
+        **deltas,
+    )
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_job_list_cache(sender, instance, **kwargs):
+    """Bump the job list version once the change is committed and visible."""
+    transaction.on_commit(job_list_cache.bump, using=kwargs.get("using"))
+
+
+@receiver(pre_delete, sender=User)
+def forget_deleted_user(sender, instance, **kwargs):
+    """
+    Update counters and the search index for a user about to be deleted.
+
+    Their applications leave the counters of other recruiters and their jobs
+    leave the full-text index with a few statements instead of one per row.
+    """
+    using = kwargs["using"]
+    uncount_applications(
+        JobApplication.objects.filter(candidate=instance.pk).exclude(
+            job__recruiter=instance.pk
+        ),
+        using=using,
+    )
+    unindex_documents(
+        JobSearchDocument.objects.filter(job__recruiter=instance.pk), using=using
+    )
+
+
+@receiver(post_save, sender=User)
+def create_recruiter_stats(sender, instance, created, raw=False, **kwargs):
+    """Start new recruiters with empty counters instead of a rebuild on first use."""
+    if created and not raw and instance.role == UserRole.RECRUITER:
+        RecruiterStats.objects.using(kwargs["using"]).create(recruiter=instance)
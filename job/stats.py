@@ -0,0 +1,184 @@
+from django.db import transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from core.choices import UserRole
+from core.models import User
+from job.choices import ApplicationStatusChoices, StatusChoices
+from job.models import Job, JobApplication, RecruiterStats
+
+# Counter bumped for an application in each status
+APPLICATION_STATUS_FIELDS = {
+    ApplicationStatusChoices.HIRED: "total_candidate_hired",
+    ApplicationStatusChoices.REJECTED: "total_candidate_rejected",
+}
+
+
+def rebuild_recruiter_stats(recruiter_ids=None, using="default"):
+    """
+    Recompute dashboard counters from the job and application tables.
+
+    Rebuilds every recruiter when ``recruiter_ids`` is None. Returns the number
+    of stats rows written.
+    """
+    jobs = Job.objects.using(using)
+    applications = JobApplication.objects.using(using)
+    if recruiter_ids is None:
+        recruiter_ids = (
+            User.objects.using(using)
+            .filter(role=UserRole.RECRUITER)
+            .values_list("pk", flat=True)
+        )
+    else:
+        jobs = jobs.filter(recruiter__in=recruiter_ids)
+        applications = applications.filter(job__recruiter__in=recruiter_ids)
+
+    stats = {
+        recruiter_id: RecruiterStats(recruiter_id=recruiter_id)
+        for recruiter_id in recruiter_ids
+    }
+
+    job_counts = jobs.values("recruiter").annotate(
+        published=Count("pk"),
+        closed=Count("pk", filter=Q(status=StatusChoices.CLOSED)),
+    )
+    for row in job_counts:
+        entry = stats.setdefault(
+            row["recruiter"], RecruiterStats(recruiter_id=row["recruiter"])
+        )
+        entry.total_published_job = row["published"]
+        entry.total_closed_job = row["closed"]
+
+    application_counts = applications.values("job__recruiter").annotate(
+        total=Count("pk"),
+        hired=Count("pk", filter=Q(status=ApplicationStatusChoices.HIRED)),
+        rejected=Count("pk", filter=Q(status=ApplicationStatusChoices.REJECTED)),
+    )
+    for row in application_counts:
+        recruiter_id = row["job__recruiter"]
+        entry = stats.setdefault(
+            recruiter_id, RecruiterStats(recruiter_id=recruiter_id)
+        )
+        entry.total_candidate_application = row["total"]
+        entry.total_candidate_hired = row["hired"]
+        entry.total_candidate_rejected = row["rejected"]
+
+    now = timezone.now()
+    for entry in stats.values():
+        entry.updated_at = now
+
+    with transaction.atomic(using=using):
+        RecruiterStats.objects.using(using).bulk_create(
+            stats.values(),
+            update_conflicts=True,
+            unique_fields=["recruiter"],
+            update_fields=[
+                "total_published_job",
+                "total_closed_job",
+                "total_candidate_application",
+                "total_candidate_hired",
+                "total_candidate_rejected",
+                "updated_at",
+            ],
+        )
+    return len(stats)
+
+
+def bump_recruiter_stats(
+    recruiter_id=None, job_id=None, create_missing=True, using="default", **deltas
+):
+    """
+    Apply counter deltas with a single ``UPDATE ... SET x = x + n``.
+
+    The recruiter is given directly or through one of their jobs. A recruiter
+    without a stats row yet is rebuilt from scratch, which already includes the
+    change being recorded. Deletion paths pass ``create_missing=False`` so no
+    row is created for a user that is being deleted.
+    """
+    deltas = {field: delta for field, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    stats = RecruiterStats.objects.using(using)
+    if recruiter_id is not None:
+        stats = stats.filter(recruiter_id=recruiter_id)
+    else:
+        stats = stats.filter(recruiter__jobs=job_id)
+
+    updated = stats.update(
+        updated_at=timezone.now(),
+        **{field: F(field) + delta for field, delta in deltas.items()},
+    )
+    if not updated and create_missing and recruiter_id is not None:
+        rebuild_recruiter_stats([recruiter_id], using=using)
+
+
+def application_status_deltas(old_status, new_status, count=1):
+    """Counter deltas for ``count`` applications moving between two statuses"""
+    deltas = {}
+    if old_status in APPLICATION_STATUS_FIELDS:
+        field = APPLICATION_STATUS_FIELDS[old_status]
+        deltas[field] = deltas.get(field, 0) - count
+    if new_status in APPLICATION_STATUS_FIELDS:
+        field = APPLICATION_STATUS_FIELDS[new_status]
+        deltas[field] = deltas.get(field, 0) + count
+    return deltas
+
+
+def uncount_applications(applications, using="default"):
+    """
+    Remove applications that are about to be deleted from their counters.
+
+    Runs one grouped query and one UPDATE per recruiter, for cascades that
+    would otherwise update the counters once per application.
+    """
+    deltas = {}
+    rows = (
+        applications.using(using)
+        .values("job__recruiter", "status")
+        .annotate(count=Count("pk"))
+        .order_by()
+    )
+    for row in rows:
+        recruiter_deltas = deltas.setdefault(
+            row["job__recruiter"], {"total_candidate_application": 0}
+        )
+        recruiter_deltas["total_candidate_application"] -= row["count"]
+        status_deltas = application_status_deltas(row["status"], None, row["count"])
+        for field, delta in status_deltas.items():
+            recruiter_deltas[field] = recruiter_deltas.get(field, 0) + delta
+
+    for recruiter_id, recruiter_deltas in deltas.items():
+        bump_recruiter_stats(
+            recruiter_id, create_missing=False, using=using, **recruiter_deltas
+        )
+
+
+def bump_application_transitions(
+    recruiter_id, old_statuses, new_status, using="default"
+):
+    """Record many applications moving from their ``old_statuses`` to one status"""
+    deltas = {}
+    for old_status in old_statuses:
+        for field, delta in application_status_deltas(old_status, new_status).items():
+            deltas[field] = deltas.get(field, 0) + delta
+    bump_recruiter_stats(recruiter_id, using=using, **deltas)
+
+
+def get_recruiter_stats(recruiter_id, using=None):
+    """
+    Return the stats row of a recruiter, building it on first access.
+
+    Reads go through the database router unless ``using`` is given; a missing
+    row is built and read back on the primary.
+    """
+    stats = (
+        RecruiterStats.objects.db_manager(using)
+        .filter(recruiter_id=recruiter_id)
+        .first()
+    )
+    if stats is None:
+        using = using or "default"
+        rebuild_recruiter_stats([recruiter_id], using=using)
+        stats = RecruiterStats.objects.using(using).get(recruiter_id=recruiter_id)
+    return stats
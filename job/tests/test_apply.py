@@ -0,0 +1,77 @@
+import uuid
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.choices import StatusChoices
+from job.models import JobApplication, RecruiterStats
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class ApplyTests(TestCase):
+    """``POST application/`` answers 409 for duplicates and only for those"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.job = create_job(self.recruiter)
+
+    def apply(self, job=None):
+        return self.client.post(
+            f"{JOB_PREFIX}application/",
+            {"job": str((job or self.job).pk)},
+            content_type="application/json",
+            headers={
+                **get_auth_headers(self.candidate),
+                "Idempotency-Key": uuid.uuid4().hex,
+            },
+        )
+
+    def test_apply(self):
+        response = self.apply()
+
+        self.assertEqual(response.status_code, 201, response.data)
+        application = JobApplication.objects.get()
+        self.assertEqual(response.data["application_id"], str(application.pk))
+        self.assertEqual(application.job_title, self.job.title)
+        stats = RecruiterStats.objects.get(recruiter=self.recruiter)
+        self.assertEqual(stats.total_candidate_application, 1)
+
+    def test_duplicate_is_a_conflict(self):
+        self.apply()
+
+        response = self.apply()
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(JobApplication.objects.count(), 1)
+
+    def test_other_integrity_errors_are_not_conflicts(self):
+        with mock.patch(
+            "job.rest.views.job.apply_to_job",
+            side_effect=IntegrityError("FOREIGN KEY constraint failed"),
+        ):
+            with self.assertLogs("job.rest.views.job", "ERROR"):
+                response = self.apply()
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_closed_job_is_refused(self):
+        job = create_job(
+            self.recruiter, title="Closed Job", status=StatusChoices.CLOSED
+        )
+
+        response = self.apply(job)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(JobApplication.objects.exists())
@@ -0,0 +1,47 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+from django.test import Client, TransactionTestCase
+
+from core.choices import UserRole
+from job.models import JobApplication
+from job.tests.utils import JOB_PREFIX, create_job, create_user, get_auth_headers
+
+PARALLEL_REQUESTS = 8
+
+
+class ConcurrentApplyTests(TransactionTestCase):
+    """Parallel applications of one candidate to one job create a single row"""
+
+    def setUp(self):
+        recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.job = create_job(recruiter)
+        self.candidate = create_user("candidate")
+
+    def apply(self, barrier):
+        client = Client(raise_request_exception=False)
+        headers = get_auth_headers(self.candidate)
+        try:
+            barrier.wait()
+            return client.post(
+                f"{JOB_PREFIX}application/",
+                {"job": str(self.job.pk)},
+                content_type="application/json",
+                headers=headers,
+            ).status_code
+        finally:
+            connections.close_all()
+
+    def test_parallel_applies_create_one_application(self):
+        barrier = threading.Barrier(PARALLEL_REQUESTS)
+        with ThreadPoolExecutor(max_workers=PARALLEL_REQUESTS) as executor:
+            statuses = list(executor.map(self.apply, [barrier] * PARALLEL_REQUESTS))
+
+        self.assertEqual(sorted(statuses), [201] + [409] * (PARALLEL_REQUESTS - 1))
+        self.assertEqual(
+            JobApplication.objects.filter(
+                job=self.job, candidate=self.candidate
+            ).count(),
+            1,
+        )
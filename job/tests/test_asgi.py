@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.test import SimpleTestCase, override_settings
+from django.utils.module_loading import import_string
+
+# Added by settings only when their feature is enabled
+OPTIONAL_MIDDLEWARE = [
+    "shared.db_router.ReadReplicaMiddleware",
+    "shared.query_budget.QueryBudgetMiddleware",
+]
+# Sync-only, and only meant for debugging
+SILK_MIDDLEWARE = "silk.middleware.SilkyMiddleware"
+
+
+class ASGIHandlerTests(SimpleTestCase):
+    """Under ASGI, requests reach async views without a sync_to_async thread"""
+
+    def get_middleware(self):
+        return [
+            *(name for name in settings.MIDDLEWARE if name != SILK_MIDDLEWARE),
+            *(name for name in OPTIONAL_MIDDLEWARE if name not in settings.MIDDLEWARE),
+        ]
+
+    def test_every_middleware_is_async_capable(self):
+        for name in self.get_middleware():
+            with self.subTest(middleware=name):
+                self.assertTrue(getattr(import_string(name), "async_capable", False))
+
+    def test_no_middleware_is_adapted(self):
+        # Django logs every sync_to_async adaptation while building the chain
+        with override_settings(MIDDLEWARE=self.get_middleware(), DEBUG=True):
+            with self.assertNoLogs("django.request", level="DEBUG"):
+                ASGIHandler()
@@ -0,0 +1,170 @@
+import uuid
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.models import Job, JobSearchDocument, RecruiterStats
+from job.search import search_documents
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class JobBulkCreateTests(TestCase):
+    """``POST job/bulk/`` creates what it can and reports every rejected item"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.existing = create_job(self.recruiter, title="Existing Job")
+
+    def get_job_data(self, title, **fields):
+        return {
+            "title": title,
+            "description": "Created in bulk",
+            "location": "Remote",
+            "salary": 60_000,
+            "deadline": self.existing.deadline.isoformat(),
+            **fields,
+        }
+
+    def post(self, data):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                f"{JOB_PREFIX}job/bulk/",
+                data,
+                content_type="application/json",
+                headers={
+                    **get_auth_headers(self.recruiter),
+                    "Idempotency-Key": uuid.uuid4().hex,
+                },
+            )
+
+    def get_stats(self):
+        return RecruiterStats.objects.get(recruiter=self.recruiter)
+
+    def test_all_created(self):
+        version = job_list_cache.get_version()
+
+        response = self.post(
+            [
+                self.get_job_data("Bulk Job 1"),
+                self.get_job_data("Bulk Job 2", status=StatusChoices.CLOSED),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(
+            [job["title"] for job in response.data["created"]],
+            ["Bulk Job 1", "Bulk Job 2"],
+        )
+        self.assertEqual(response.data["errors"], [])
+        # Side effects of the bulk path, which skips the model signals
+        self.assertEqual(JobSearchDocument.objects.count(), 3)
+        self.assertEqual(len(search_documents("bulk")), 2)
+        stats = self.get_stats()
+        self.assertEqual(stats.total_published_job, 3)
+        self.assertEqual(stats.total_closed_job, 1)
+        self.assertGreater(job_list_cache.get_version(), version)
+
+    @override_settings(JOB_BULK_CREATE_BATCH_SIZE=2)
+    def test_inserts_in_batches(self):
+        response = self.post([self.get_job_data(f"Bulk Job {n}") for n in range(5)])
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(Job.objects.filter(title__startswith="Bulk").count(), 5)
+
+    def test_partial_success_is_multi_status(self):
+        response = self.post(
+            [
+                self.get_job_data("Bulk Job"),
+                self.get_job_data("Bad Salary", salary=0),
+                self.get_job_data("Bulk Job"),
+                self.get_job_data("Existing Job"),
+            ]
+        )
+
+        self.assertEqual(response.status_code, 207, response.data)
+        self.assertEqual(
+            [job["title"] for job in response.data["created"]], ["Bulk Job"]
+        )
+        self.assertEqual(
+            response.data["errors"],
+            [
+                {
+                    "index": 1,
+                    "errors": {"salary": ["salary must be greater than zero"]},
+                },
+                {"index": 2, "errors": {"title": ["Duplicate title in this batch."]}},
+                {
+                    "index": 3,
+                    "errors": {"title": ["job with this title already exists."]},
+                },
+            ],
+        )
+        self.assertEqual(self.get_stats().total_published_job, 2)
+
+    def test_nothing_created_is_bad_request(self):
+        version = job_list_cache.get_version()
+
+        response = self.post([self.get_job_data("Existing Job")])
+
+        self.assertEqual(response.status_code, 400, response.data)
+        self.assertEqual(response.data["created"], [])
+        self.assertEqual(self.get_stats().total_published_job, 1)
+        self.assertEqual(job_list_cache.get_version(), version)
+
+    def test_title_taken_during_insert_is_reported(self):
+        racing = {}
+
+        def insert_concurrently(execute, sql, params, many, context):
+            # Another request commits the same title between the existence
+            # check and the INSERT, which ignore_conflicts then skips
+            if not racing and sql.startswith("INSERT") and 'INTO "job_job" ' in sql:
+                racing["job"] = None
+                racing["job"] = create_job(self.recruiter, title="Racing Job")
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(insert_concurrently):
+            response = self.post(
+                [self.get_job_data("Racing Job"), self.get_job_data("Bulk Job")]
+            )
+
+        self.assertEqual(response.status_code, 207, response.data)
+        self.assertEqual(
+            [job["title"] for job in response.data["created"]], ["Bulk Job"]
+        )
+        self.assertEqual(
+            response.data["errors"],
+            [
+                {
+                    "index": 0,
+                    "errors": {"title": ["job with this title already exists."]},
+                }
+            ],
+        )
+        self.assertEqual(Job.objects.get(title="Racing Job"), racing["job"])
+        # Only the rows actually inserted are indexed and counted
+        self.assertEqual(JobSearchDocument.objects.count(), 3)
+        self.assertEqual(self.get_stats().total_published_job, 3)
+
+    def test_payload_must_be_a_non_empty_list(self):
+        for data in [[], {"title": "Bulk Job"}]:
+            with self.subTest(data=data):
+                self.assertEqual(self.post(data).status_code, 400)
+
+    @override_settings(JOB_BULK_CREATE_MAX_ITEMS=2)
+    def test_too_many_items(self):
+        response = self.post([self.get_job_data(f"Bulk Job {n}") for n in range(3)])
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Job.objects.filter(title__startswith="Bulk").exists())
@@ -0,0 +1,136 @@
+import uuid
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices
+from job.models import JobApplication, RecruiterStats
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class BulkApplicationStatusTests(TestCase):
+    """``POST application/bulk-status/`` only touches the recruiter's applications"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.other_recruiter = create_user("other", role=UserRole.RECRUITER)
+        job = create_job(self.recruiter)
+        other_job = create_job(self.other_recruiter, title="Data Engineer")
+        candidates = [create_user(f"candidate{number}") for number in range(3)]
+        self.applications = [apply_to_job(job, candidate) for candidate in candidates]
+        self.other_application = apply_to_job(other_job, candidates[0])
+
+    def post(self, application_ids, new_status, user=None):
+        return self.client.post(
+            f"{JOB_PREFIX}application/bulk-status/",
+            {
+                "application_ids": [str(pk) for pk in application_ids],
+                "status": new_status,
+            },
+            content_type="application/json",
+            headers={
+                **get_auth_headers(user or self.recruiter),
+                "Idempotency-Key": uuid.uuid4().hex,
+            },
+        )
+
+    def get_statuses(self):
+        return {
+            application.pk: application.status
+            for application in JobApplication.objects.all()
+        }
+
+    def get_stats(self, recruiter=None):
+        return RecruiterStats.objects.get(recruiter=recruiter or self.recruiter)
+
+    def test_updates_statuses_and_stats(self):
+        response = self.post(
+            [a.pk for a in self.applications[:2]], ApplicationStatusChoices.HIRED
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data, {"updated": 2})
+        statuses = self.get_statuses()
+        self.assertEqual(
+            [statuses[a.pk] for a in self.applications],
+            [
+                ApplicationStatusChoices.HIRED,
+                ApplicationStatusChoices.HIRED,
+                ApplicationStatusChoices.APPLIED,
+            ],
+        )
+        stats = self.get_stats()
+        self.assertEqual(stats.total_candidate_hired, 2)
+        self.assertEqual(stats.total_candidate_rejected, 0)
+
+    def test_moving_between_statuses_moves_the_counts(self):
+        ids = [a.pk for a in self.applications]
+        self.post(ids[:2], ApplicationStatusChoices.HIRED)
+
+        response = self.post(ids, ApplicationStatusChoices.REJECTED)
+
+        self.assertEqual(response.data, {"updated": 3})
+        stats = self.get_stats()
+        self.assertEqual(stats.total_candidate_hired, 0)
+        self.assertEqual(stats.total_candidate_rejected, 3)
+
+    def test_unchanged_applications_are_not_counted(self):
+        ids = [a.pk for a in self.applications]
+        self.post(ids, ApplicationStatusChoices.HIRED)
+
+        response = self.post(ids, ApplicationStatusChoices.HIRED)
+
+        self.assertEqual(response.data, {"updated": 0})
+        self.assertEqual(self.get_stats().total_candidate_hired, 3)
+
+    def test_applications_of_other_recruiters_are_refused(self):
+        response = self.post(
+            [self.applications[0].pk, self.other_application.pk],
+            ApplicationStatusChoices.HIRED,
+        )
+
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            response.data["application_ids"], [str(self.other_application.pk)]
+        )
+        # Nothing is updated, not even the recruiter's own application
+        self.assertEqual(
+            set(self.get_statuses().values()), {ApplicationStatusChoices.APPLIED}
+        )
+        self.assertEqual(self.get_stats().total_candidate_hired, 0)
+        self.assertEqual(self.get_stats(self.other_recruiter).total_candidate_hired, 0)
+
+    def test_unknown_applications_are_refused(self):
+        response = self.post([uuid.uuid4()], ApplicationStatusChoices.HIRED)
+
+        self.assertEqual(response.status_code, 403)
+
+    def test_invalid_payload(self):
+        for ids, new_status in [
+            ([self.applications[0].pk], ApplicationStatusChoices.APPLIED),
+            ([self.applications[0].pk], "PROMOTED"),
+            ([], ApplicationStatusChoices.HIRED),
+            (["not-a-uuid"], ApplicationStatusChoices.HIRED),
+        ]:
+            with self.subTest(ids=ids, status=new_status):
+                response = self.post(ids, new_status)
+                self.assertEqual(response.status_code, 400)
+
+    def test_candidates_cannot_change_statuses(self):
+        candidate = self.applications[0].candidate
+
+        response = self.post(
+            [self.applications[0].pk], ApplicationStatusChoices.HIRED, user=candidate
+        )
+
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,100 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+MINE_URL = f"{JOB_PREFIX}application/mine/"
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class CandidateApplicationsTests(TestCase):
+    """``GET application/mine/`` lists the candidate's own applications"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.other_candidate = create_user("other")
+        self.jobs = [
+            create_job(self.recruiter, title=f"Engineer {number}")
+            for number in range(3)
+        ]
+        self.applications = [apply_to_job(job, self.candidate) for job in self.jobs]
+        apply_to_job(self.jobs[0], self.other_candidate)
+
+    def get(self, url=MINE_URL, user=None):
+        return self.client.get(url, headers=get_auth_headers(user or self.candidate))
+
+    def test_lists_only_own_applications_in_application_order(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            [a["application_id"] for a in response.data["results"]],
+            [str(a.pk) for a in self.applications],
+        )
+        self.assertEqual(
+            response.data["results"][0],
+            {
+                "application_id": str(self.applications[0].pk),
+                "job": self.jobs[0].pk,
+                "job_title": "Engineer 0",
+                "job_deadline": self.jobs[0].deadline.isoformat(),
+                "status": "APPLIED",
+                "applied_at": response.data["results"][0]["applied_at"],
+            },
+        )
+
+    def test_job_changes_are_copied_onto_applications(self):
+        job = self.jobs[0]
+        job.title = "Staff Engineer"
+        job.deadline += timedelta(days=7)
+        job.save()
+
+        result = self.get().data["results"][0]
+
+        self.assertEqual(result["job_title"], "Staff Engineer")
+        self.assertEqual(result["job_deadline"], job.deadline.isoformat())
+
+    def test_reads_a_single_table(self):
+        self.get()
+
+        with CaptureQueriesContext(connection) as queries:
+            self.get()
+
+        (query,) = [q["sql"] for q in queries]
+        self.assertIn('FROM "job_jobapplication"', query)
+        self.assertNotIn("JOIN", query)
+
+    def test_pagination(self):
+        first = self.get(f"{MINE_URL}?page_size=2").data
+        second = self.get(first["next"]).data
+
+        self.assertEqual(
+            [a["application_id"] for a in first["results"] + second["results"]],
+            [str(a.pk) for a in self.applications],
+        )
+        self.assertIsNone(second["next"])
+
+    def test_candidate_without_applications(self):
+        response = self.get(user=create_user("newcomer"))
+
+        self.assertEqual(response.data["results"], [])
+
+    def test_recruiters_are_refused(self):
+        self.assertEqual(self.get(user=self.recruiter).status_code, 403)
+
+    def test_anonymous_is_refused(self):
+        self.assertEqual(self.client.get(MINE_URL).status_code, 401)
@@ -0,0 +1,116 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils.http import http_date
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class ConditionalGetTests(TestCase):
+    """List and detail responses honour ``If-None-Match`` and ``If-Modified-Since``"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.job = create_job(self.recruiter)
+        self.application = apply_to_job(self.job, self.candidate)
+        self.job_url = f"{JOB_PREFIX}job/{self.job.pk}/"
+
+    def get(self, url, user=None, **headers):
+        headers.update(get_auth_headers(user or self.recruiter))
+        return self.client.get(url, headers=headers)
+
+    def test_detail_has_validators(self):
+        response = self.get(self.job_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(
+            response["Last-Modified"], http_date(self.job.updated_at.timestamp())
+        )
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get(self.job_url)["ETag"]
+
+        response = self.get(self.job_url, if_none_match=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_update_changes_etag(self):
+        etag = self.get(self.job_url)["ETag"]
+        self.job.title = "Platform Engineer"
+        self.job.save()
+
+        response = self.get(self.job_url, if_none_match=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(response.data["title"], "Platform Engineer")
+
+    def test_several_and_weak_etags(self):
+        etag = self.get(self.job_url)["ETag"]
+
+        for header in [
+            f'"other", {etag}',
+            f"W/{etag}",
+            f'W/"other", W/{etag}',
+            "*",
+        ]:
+            with self.subTest(header=header):
+                response = self.get(self.job_url, if_none_match=header)
+                self.assertEqual(response.status_code, 304)
+
+        response = self.get(self.job_url, if_none_match='"other", W/"another"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_modified_since(self):
+        last_modified = self.get(self.job_url)["Last-Modified"]
+
+        response = self.get(self.job_url, if_modified_since=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_list_is_not_modified_until_a_row_changes(self):
+        url = f"{JOB_PREFIX}application/"
+        response = self.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)
+        etag = response["ETag"]
+
+        self.assertEqual(self.get(url, if_none_match=etag).status_code, 304)
+
+        self.application.status = ApplicationStatusChoices.HIRED
+        self.application.save()
+        response = self.get(url, if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_list_etag_depends_on_the_query(self):
+        url = f"{JOB_PREFIX}application/"
+        etag = self.get(url)["ETag"]
+
+        response = self.get(f"{url}?page_size=1", if_none_match=etag)
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_cached_job_list_is_not_modified(self):
+        url = f"{JOB_PREFIX}job/"
+        etag = self.get(url, user=self.candidate)["ETag"]
+
+        response = self.get(url, user=self.candidate, if_none_match=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["X-Cache"], "HIT")
+        self.assertEqual(response["ETag"], etag)
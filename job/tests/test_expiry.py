@@ -0,0 +1,114 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.choices import UserRole
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.expiry import close_expired_jobs
+from job.models import Job, RecruiterStats
+from job.tests.utils import FAST_PASSWORD_HASHERS, create_job, create_user
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class CloseExpiredJobsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.today = timezone.now().date()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.other_recruiter = create_user("other", role=UserRole.RECRUITER)
+        self.expired = [
+            create_job(self.recruiter, title=f"Expired {number}") for number in range(3)
+        ] + [create_job(self.other_recruiter, title="Other Expired")]
+        self.current = create_job(self.recruiter, title="Current")
+        self.closed = create_job(
+            self.recruiter, title="Closed", status=StatusChoices.CLOSED
+        )
+        # Deadlines move to the past without the signals, like time passing
+        Job.objects.filter(pk__in=[job.pk for job in self.expired]).update(
+            deadline=self.today - timedelta(days=1)
+        )
+        Job.objects.filter(pk=self.closed.pk).update(
+            deadline=self.today - timedelta(days=1)
+        )
+
+    def get_closed_counts(self):
+        return dict(RecruiterStats.objects.values_list("recruiter", "total_closed_job"))
+
+    def get_open_titles(self):
+        return set(
+            Job.objects.filter(status=StatusChoices.OPEN).values_list(
+                "title", flat=True
+            )
+        )
+
+    def test_closes_expired_open_jobs(self):
+        version = job_list_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(close_expired_jobs(), 4)
+
+        self.assertEqual(self.get_open_titles(), {"Current"})
+        self.assertEqual(
+            self.get_closed_counts(),
+            {self.recruiter.pk: 4, self.other_recruiter.pk: 1},
+        )
+        self.assertGreater(job_list_cache.get_version(), version)
+
+    def test_running_twice_closes_nothing_more(self):
+        close_expired_jobs()
+        counts = self.get_closed_counts()
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(close_expired_jobs(), 0)
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(self.get_closed_counts(), counts)
+
+    def test_batches(self):
+        self.assertEqual(close_expired_jobs(batch_size=3), 3)
+        self.assertEqual(close_expired_jobs(batch_size=3), 1)
+        self.assertEqual(close_expired_jobs(batch_size=3), 0)
+
+        self.assertEqual(self.get_closed_counts()[self.recruiter.pk], 4)
+
+    def test_today_is_configurable(self):
+        self.assertEqual(close_expired_jobs(today=self.today - timedelta(days=1)), 0)
+        self.assertEqual(
+            close_expired_jobs(today=self.current.deadline + timedelta(days=1)), 5
+        )
+
+    def test_jobs_closed_concurrently_are_not_counted_twice(self):
+        raced = self.expired[0]
+
+        def close_concurrently(execute, sql, params, many, context):
+            # Another node closes a job between the read and the UPDATE
+            if (
+                sql.startswith('UPDATE "job_job"')
+                and raced.status != StatusChoices.CLOSED
+            ):
+                raced.status = StatusChoices.CLOSED
+                raced.save()
+            return execute(sql, params, many, context)
+
+        with connection.execute_wrapper(close_concurrently):
+            closed = close_expired_jobs()
+
+        self.assertEqual(closed, 3)
+        self.assertEqual(
+            self.get_closed_counts(),
+            {self.recruiter.pk: 4, self.other_recruiter.pk: 1},
+        )
+
+    def test_command(self):
+        stdout = StringIO()
+
+        call_command("close_expired_jobs", "--once", "--batch-size", "2", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "Closed 4 expired job(s)")
+        self.assertEqual(self.get_open_titles(), {"Current"})
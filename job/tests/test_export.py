@@ -0,0 +1,119 @@
+import csv
+import io
+import json
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from core.models import User
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+EXPORT_URL = f"{JOB_PREFIX}application/export/"
+HEADER = [
+    "application_id",
+    "job_id",
+    "job_title",
+    "job_deadline",
+    "candidate_id",
+    "candidate_email",
+    "candidate_first_name",
+    "candidate_last_name",
+    "status",
+    "applied_at",
+]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class ApplicationExportTests(TestCase):
+    """``GET application/export/`` streams the recruiter's applications"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.job = create_job(self.recruiter, title="+Backend Engineer")
+        self.other_job = create_job(self.recruiter, title="Data Engineer")
+        self.candidate = create_user("candidate")
+        User.objects.filter(pk=self.candidate.pk).update(
+            first_name='=HYPERLINK("http://evil.example","x")', last_name="@SUM(A1)"
+        )
+        self.applications = [
+            apply_to_job(self.job, self.candidate),
+            apply_to_job(self.other_job, self.candidate),
+        ]
+        self.applications[1].status = ApplicationStatusChoices.HIRED
+        self.applications[1].save()
+        other_recruiter = create_user("other", role=UserRole.RECRUITER)
+        apply_to_job(create_job(other_recruiter, title="Other Job"), self.candidate)
+
+    def export(self, query="", user=None):
+        response = self.client.get(
+            f"{EXPORT_URL}{query}", headers=get_auth_headers(user or self.recruiter)
+        )
+        if response.streaming:
+            response.body = b"".join(response.streaming_content).decode()
+        return response
+
+    def read_csv(self, query=""):
+        response = self.export(query)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        return list(csv.reader(io.StringIO(response.body)))
+
+    def test_csv(self):
+        response = self.export()
+
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="applications.csv"',
+        )
+        header, *rows = list(csv.reader(io.StringIO(response.body)))
+        self.assertEqual(header, HEADER)
+        self.assertEqual(
+            [row[0] for row in rows], [str(a.pk) for a in self.applications]
+        )
+        self.assertEqual(rows[0][3], self.job.deadline.isoformat())
+        self.assertEqual(rows[1][8], ApplicationStatusChoices.HIRED)
+
+    def test_csv_escapes_formulas(self):
+        header, row, _ = self.read_csv()
+
+        self.assertEqual(row[2], "'+Backend Engineer")
+        self.assertEqual(row[6], '\'=HYPERLINK("http://evil.example","x")')
+        self.assertEqual(row[7], "'@SUM(A1)")
+        self.assertEqual(row[5], "candidate@example.com")
+
+    def test_ndjson_keeps_raw_values(self):
+        response = self.export("?output=ndjson")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = [json.loads(line) for line in response.body.splitlines()]
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(list(lines[0]), HEADER)
+        self.assertEqual(lines[0]["job_title"], "+Backend Engineer")
+        self.assertEqual(lines[0]["candidate_last_name"], "@SUM(A1)")
+        self.assertEqual(lines[0]["candidate_id"], self.candidate.pk)
+
+    def test_filters(self):
+        _, *rows = self.read_csv(f"?status={ApplicationStatusChoices.HIRED}")
+        self.assertEqual([row[0] for row in rows], [str(self.applications[1].pk)])
+
+        _, *rows = self.read_csv(f"?job={self.job.pk}")
+        self.assertEqual([row[0] for row in rows], [str(self.applications[0].pk)])
+
+    def test_invalid_parameters(self):
+        for query in ["?output=xlsx", "?status=PROMOTED", "?job=42"]:
+            with self.subTest(query=query):
+                self.assertEqual(self.export(query).status_code, 400)
+
+    def test_candidates_are_refused(self):
+        self.assertEqual(self.export(user=self.candidate).status_code, 403)
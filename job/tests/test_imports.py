@@ -0,0 +1,233 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+import uuid
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.client import MULTIPART_CONTENT
+from django.test.utils import CaptureQueriesContext
+
+from core.choices import UserRole
+from job.imports import JobImporter, get_report_path
+from job.models import Job
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_user,
+    get_auth_headers,
+)
+
+IMPORT_URL = f"{JOB_PREFIX}job/import/"
+CSV_HEADER = "title,description,location,salary,deadline\n"
+
+
+def csv_row(title, salary=50_000):
+    return f"{title},Imported,Remote,{salary},2099-01-01\n"
+
+
+def ndjson_row(title, salary=50_000):
+    return json.dumps(
+        {
+            "title": title,
+            "description": "Imported",
+            "location": "Remote",
+            "salary": salary,
+            "deadline": "2099-01-01",
+        }
+    )
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class JobImportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.report_dir = directory.name
+        settings = override_settings(JOB_IMPORT_REPORT_DIR=self.report_dir)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def run_import(self, content, file_format="csv", batch_size=None):
+        importer = JobImporter(self.recruiter, batch_size=batch_size)
+        importer.run(io.BytesIO(content.encode()), file_format)
+        return importer
+
+    def read_report(self, importer):
+        with open(get_report_path(self.recruiter.pk, importer.report_id)) as report:
+            return list(csv.reader(report))
+
+    def upload(self, content, name="jobs.csv", user=None, **data):
+        if isinstance(content, str):
+            content = content.encode()
+        return self.client.post(
+            IMPORT_URL,
+            {"file": SimpleUploadedFile(name, content), **data},
+            content_type=MULTIPART_CONTENT,
+            headers=get_auth_headers(user or self.recruiter),
+        )
+
+    def test_rows_are_saved_in_chunks(self):
+        content = CSV_HEADER + "".join(csv_row(f"Job {n}") for n in range(5))
+
+        with CaptureQueriesContext(connection) as queries:
+            importer = self.run_import(content, batch_size=2)
+
+        inserts = [
+            q
+            for q in queries
+            if q["sql"].startswith("INSERT") and '"job_job"' in q["sql"]
+        ]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(importer.created_count, 5)
+        self.assertEqual(importer.failed_count, 0)
+        self.assertIsNone(importer.report_id)
+
+    def test_report_lists_rejected_rows_in_order(self):
+        rows = [
+            csv_row("Job 1"),
+            csv_row("Bad Salary", salary=0),
+            csv_row("Job 1"),
+            csv_row("Job 2"),
+            "Missing Fields\n",
+            csv_row("Job 3"),
+        ]
+
+        importer = self.run_import(CSV_HEADER + "".join(rows), batch_size=2)
+
+        self.assertEqual(importer.created_count, 3)
+        self.assertEqual(importer.failed_count, 3)
+        header, *report = self.read_report(importer)
+        self.assertEqual(header, ["row", "title", "errors"])
+        self.assertEqual(
+            [(row, title) for row, title, _ in report],
+            [("2", "Bad Salary"), ("3", "Job 1"), ("5", "Missing Fields")],
+        )
+        self.assertEqual(
+            json.loads(report[0][2]), {"salary": ["salary must be greater than zero"]}
+        )
+        self.assertIn("description", json.loads(report[2][2]))
+
+    def test_malformed_ndjson_rows(self):
+        content = "\n".join(
+            [ndjson_row("Job 1"), "{not json", "", "[1, 2]", ndjson_row("Job 2")]
+        )
+
+        importer = self.run_import(content, "ndjson")
+
+        self.assertEqual(importer.created_count, 2)
+        self.assertEqual(
+            [
+                (row, json.loads(errors))
+                for row, _, errors in self.read_report(importer)[1:]
+            ],
+            [
+                ("2", {"non_field_errors": ["Invalid JSON"]}),
+                ("4", {"non_field_errors": ["Expected a JSON object"]}),
+            ],
+        )
+
+    def test_csv_without_known_columns(self):
+        importer = self.run_import("name,pay\nJob 1,100\n")
+
+        self.assertEqual(importer.created_count, 0)
+        self.assertEqual(importer.failed_count, 1)
+
+    def test_report_escapes_formulas(self):
+        importer = self.run_import(CSV_HEADER + csv_row("=cmd()", salary=0))
+
+        self.assertEqual(self.read_report(importer)[1][1], "'=cmd()")
+
+    def test_upload_without_errors(self):
+        response = self.upload(CSV_HEADER + csv_row("Job 1"))
+
+        self.assertEqual(response.status_code, 201, response.data)
+        self.assertEqual(
+            response.data, {"created": 1, "failed": 0, "error_report": None}
+        )
+        self.assertEqual(os.listdir(self.report_dir), [str(self.recruiter.pk)])
+        self.assertEqual(
+            os.listdir(os.path.join(self.report_dir, str(self.recruiter.pk))), []
+        )
+
+    def test_partial_upload_links_the_report(self):
+        response = self.upload(
+            "\n".join([ndjson_row("Job 1"), ndjson_row("Job 2", salary=0)]),
+            name="jobs.ndjson",
+        )
+
+        self.assertEqual(response.status_code, 207, response.data)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["failed"], 1)
+
+        download = self.client.get(
+            response.data["error_report"], headers=get_auth_headers(self.recruiter)
+        )
+        self.assertEqual(download.status_code, 200)
+        self.assertEqual(download["Content-Type"], "text/csv")
+        content = b"".join(download.streaming_content).decode()
+        self.assertIn("Job 2", content)
+
+        other = create_user("other", role=UserRole.RECRUITER)
+        download = self.client.get(
+            response.data["error_report"], headers=get_auth_headers(other)
+        )
+        self.assertEqual(download.status_code, 404)
+
+    def test_nothing_imported_is_bad_request(self):
+        response = self.upload(CSV_HEADER + csv_row("Job 1", salary=0))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Job.objects.exists())
+
+    def test_format_can_be_given_explicitly(self):
+        response = self.upload(
+            ndjson_row("Job 1"), name="jobs.txt", file_format="ndjson"
+        )
+
+        self.assertEqual(response.status_code, 201, response.data)
+
+    def test_undecodable_upload(self):
+        response = self.upload(CSV_HEADER.encode() + b"Caf\xe9,x,Remote,1,2099-01-01\n")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"file": "File must be UTF-8 encoded"})
+
+    def test_malformed_csv(self):
+        response = self.upload('title\n"' + "x" * (csv.field_size_limit() + 1))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertTrue(response.data["file"].startswith("Malformed CSV"))
+
+    def test_unknown_report(self):
+        response = self.client.get(
+            f"{IMPORT_URL}{uuid.uuid4().hex}/errors/",
+            headers=get_auth_headers(self.recruiter),
+        )
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_purge_old_reports(self):
+        old = self.run_import(CSV_HEADER + csv_row("Old", salary=0))
+        recent = self.run_import(CSV_HEADER + csv_row("Recent", salary=0))
+        old_path = get_report_path(self.recruiter.pk, old.report_id)
+        week_ago = time.time() - 8 * 24 * 3600
+        os.utime(old_path, (week_ago, week_ago))
+        stdout = StringIO()
+
+        call_command("purge_job_import_reports", stdout=stdout)
+
+        self.assertEqual(stdout.getvalue().strip(), "Deleted 1 job import report(s)")
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(
+            os.path.exists(get_report_path(self.recruiter.pk, recent.report_id))
+        )
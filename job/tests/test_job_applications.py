@@ -0,0 +1,96 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class JobApplicationsTests(TestCase):
+    """``GET job/<pk>/applications/`` is scoped to the recruiter's own jobs"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.job = create_job(self.recruiter)
+        other_job = create_job(self.recruiter, title="Data Engineer")
+        self.candidates = [create_user(f"candidate{number}") for number in range(5)]
+        self.applications = [
+            apply_to_job(self.job, candidate) for candidate in self.candidates
+        ]
+        apply_to_job(other_job, self.candidates[0])
+        for application, new_status in zip(
+            self.applications,
+            [ApplicationStatusChoices.HIRED, ApplicationStatusChoices.REJECTED],
+        ):
+            application.status = new_status
+            application.save()
+        self.url = f"{JOB_PREFIX}job/{self.job.pk}/applications/"
+
+    def get(self, url=None, user=None):
+        return self.client.get(
+            url or self.url, headers=get_auth_headers(user or self.recruiter)
+        )
+
+    def test_lists_the_job_applications_with_status_counts(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            [a["application_id"] for a in response.data["results"]],
+            [str(a.pk) for a in self.applications],
+        )
+        self.assertEqual(
+            response.data["status_counts"],
+            {
+                ApplicationStatusChoices.APPLIED: 3,
+                ApplicationStatusChoices.HIRED: 1,
+                ApplicationStatusChoices.REJECTED: 1,
+            },
+        )
+
+    def test_status_filter_keeps_the_overall_counts(self):
+        response = self.get(f"{self.url}?status={ApplicationStatusChoices.APPLIED}")
+
+        self.assertEqual(
+            [a["application_id"] for a in response.data["results"]],
+            [str(a.pk) for a in self.applications[2:]],
+        )
+        self.assertEqual(
+            response.data["status_counts"][ApplicationStatusChoices.HIRED], 1
+        )
+
+    def test_invalid_status_filter(self):
+        self.assertEqual(self.get(f"{self.url}?status=PROMOTED").status_code, 400)
+
+    def test_pagination(self):
+        ids, url = [], f"{self.url}?page_size=2"
+        while url:
+            page = self.get(url).data
+            self.assertLessEqual(len(page["results"]), 2)
+            self.assertIn("status_counts", page)
+            ids.extend(a["application_id"] for a in page["results"])
+            url = page["next"]
+
+        self.assertEqual(ids, [str(a.pk) for a in self.applications])
+
+    def test_other_recruiters_get_not_found(self):
+        other = create_user("other", role=UserRole.RECRUITER)
+
+        self.assertEqual(self.get(user=other).status_code, 404)
+
+    def test_candidates_are_refused(self):
+        self.assertEqual(self.get(user=self.candidates[0]).status_code, 403)
+
+    def test_unknown_job(self):
+        url = f"{JOB_PREFIX}job/00000000-0000-0000-0000-000000000000/applications/"
+
+        self.assertEqual(self.get(url).status_code, 404)
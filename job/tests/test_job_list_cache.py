@@ -0,0 +1,145 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.choices import UserRole
+from job.cache import job_list_cache
+from job.choices import StatusChoices
+from job.expiry import close_expired_jobs
+from job.models import Job
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+from shared.cache import check_shared_cache
+
+FILE_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": "/tmp/jobsite-test-cache",
+    }
+}
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class JobListCacheTests(TestCase):
+    """Every write path makes the cached job list pages unreachable"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.headers = get_auth_headers(create_user("candidate"))
+        self.job = create_job(self.recruiter)
+
+    def get_list(self):
+        response = self.client.get(f"{JOB_PREFIX}job/", headers=self.headers)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response
+
+    def get_titles(self, response):
+        return sorted(job["title"] for job in response.data["results"])
+
+    def assertInvalidates(self, write, titles):
+        self.assertEqual(self.get_list()["X-Cache"], "MISS")
+        self.assertEqual(self.get_list()["X-Cache"], "HIT")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            write()
+
+        response = self.get_list()
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(self.get_titles(response), titles)
+
+    def test_create_invalidates(self):
+        self.assertInvalidates(
+            lambda: create_job(self.recruiter, title="Data Engineer"),
+            ["Backend Engineer", "Data Engineer"],
+        )
+
+    def test_update_invalidates(self):
+        def write():
+            self.job.title = "Platform Engineer"
+            self.job.save()
+
+        self.assertInvalidates(write, ["Platform Engineer"])
+
+    def test_delete_invalidates(self):
+        self.assertInvalidates(self.job.delete, [])
+
+    def test_api_create_invalidates(self):
+        def write():
+            response = self.client.post(
+                f"{JOB_PREFIX}job/",
+                {
+                    "title": "Data Engineer",
+                    "description": "Own the data pipelines",
+                    "location": "Berlin",
+                    "salary": 80_000,
+                    "deadline": self.job.deadline.isoformat(),
+                },
+                content_type="application/json",
+                headers=get_auth_headers(self.recruiter),
+            )
+            self.assertEqual(response.status_code, 201, response.data)
+
+        self.assertInvalidates(write, ["Backend Engineer", "Data Engineer"])
+
+    def test_expiry_invalidates(self):
+        def write():
+            Job.objects.filter(pk=self.job.pk).update(
+                deadline=timezone.now().date() - timedelta(days=1)
+            )
+            close_expired_jobs()
+
+        self.assertInvalidates(write, ["Backend Engineer"])
+        self.assertEqual(
+            self.get_list().data["results"][0]["status"], StatusChoices.CLOSED
+        )
+
+    def test_rollback_keeps_the_cache(self):
+        self.get_list()
+        version = job_list_cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            create_job(self.recruiter, title="Data Engineer")
+
+        self.assertTrue(callbacks)
+        self.assertEqual(job_list_cache.get_version(), version)
+        self.assertEqual(self.get_list()["X-Cache"], "HIT")
+
+
+class VersionedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_evicted_version_moves_forward(self):
+        version = job_list_cache.bump()
+        stale_key = job_list_cache.make_key("page")
+        job_list_cache.set(stale_key, "stale")
+
+        cache.delete(job_list_cache._key("version"))
+
+        self.assertGreater(job_list_cache.bump(), version)
+        self.assertNotEqual(job_list_cache.make_key("page"), stale_key)
+
+    def test_missing_version_is_seeded_from_the_clock(self):
+        version = job_list_cache.get_version()
+
+        self.assertGreater(version, 1)
+        self.assertEqual(job_list_cache.bump(), version + 1)
+
+    def test_process_local_backend_warns(self):
+        self.assertEqual([e.id for e in check_shared_cache(None)], ["cache.W001"])
+
+        with override_settings(CACHES=FILE_CACHE):
+            self.assertEqual(check_shared_cache(None), [])
+
+    def test_stats_command_refuses_process_local_backend(self):
+        with self.assertRaises(CommandError):
+            call_command("job_cache_stats")
@@ -0,0 +1,108 @@
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.choices import UserRole
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class KeysetPaginationTests(TestCase):
+    """Walk the job list, ordered by ``(deadline, job_id)``, page by page"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.headers = get_auth_headers(create_user("candidate"))
+        self.today = timezone.now().date()
+        # Several jobs share each deadline, so pages break inside a tie
+        self.jobs = [
+            create_job(
+                self.recruiter,
+                title=f"Engineer {number}",
+                deadline=self.today + timedelta(days=10 + number // 3),
+            )
+            for number in range(9)
+        ]
+
+    def get_page(self, url):
+        response = self.client.get(url, headers=self.headers)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def walk(self, url, insert=None):
+        ids, pages = [], 0
+        while url:
+            page = self.get_page(url)
+            ids.extend(job["job_id"] for job in page["results"])
+            url = page["next"]
+            pages += 1
+            if url and insert is not None:
+                insert(pages)
+        return ids
+
+    def get_expected_ids(self):
+        jobs = sorted(self.jobs, key=lambda job: (job.deadline, job.pk))
+        return [str(job.pk) for job in jobs]
+
+    def test_walk_returns_every_job_once_in_order(self):
+        ids = self.walk(f"{JOB_PREFIX}job/?page_size=2")
+
+        self.assertEqual(ids, self.get_expected_ids())
+
+    def test_cursor_is_stable_under_concurrent_inserts(self):
+        def insert(pages):
+            # One job before the cursor, one after it, at every page
+            self.jobs.append(
+                create_job(self.recruiter, title=f"Early {pages}", deadline=self.today)
+            )
+            self.jobs.append(
+                create_job(
+                    self.recruiter,
+                    title=f"Late {pages}",
+                    deadline=self.today + timedelta(days=100 + pages),
+                )
+            )
+
+        ids = self.walk(f"{JOB_PREFIX}job/?page_size=2", insert=insert)
+
+        self.assertEqual(len(ids), len(set(ids)))
+        early = {str(job.pk) for job in self.jobs if job.title.startswith("Early")}
+        self.assertFalse(early & set(ids))
+        # Every row after the cursor, including the late inserts, is reached
+        self.assertEqual(
+            ids, [job_id for job_id in self.get_expected_ids() if job_id not in early]
+        )
+
+    def test_previous_link_returns_the_prior_page(self):
+        first = self.get_page(f"{JOB_PREFIX}job/?page_size=4")
+        self.assertIsNone(first["previous"])
+
+        second = self.get_page(first["next"])
+        previous = self.get_page(second["previous"])
+
+        self.assertEqual(previous["results"], first["results"])
+        self.assertIsNotNone(previous["next"])
+        self.assertIsNone(previous["previous"])
+
+    def test_last_page_has_no_next_link(self):
+        page = self.get_page(f"{JOB_PREFIX}job/?page_size=9")
+
+        self.assertEqual(len(page["results"]), 9)
+        self.assertIsNone(page["next"])
+
+    def test_bad_cursor_is_not_found(self):
+        for cursor in ["garbage", "eyJwIjpbXX0=", "eyJwIjpbIngiLCJ5Il19"]:
+            with self.subTest(cursor=cursor):
+                response = self.client.get(
+                    f"{JOB_PREFIX}job/?cursor={cursor}", headers=self.headers
+                )
+                self.assertEqual(response.status_code, 404)
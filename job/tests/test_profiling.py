@@ -0,0 +1,141 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+from shared.profiling import request_metrics
+
+JOB_LIST_ENDPOINT = f"{JOB_PREFIX}job/"
+
+
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS,
+    PROFILING_METRICS_TOKEN="",
+    PROFILING_SLOW_REQUEST_MS=60_000,
+)
+class ProfilingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        request_metrics.reset()
+        self.addCleanup(request_metrics.reset)
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.staff = create_user("staff")
+        self.staff.is_staff = True
+        self.staff.save(update_fields=["is_staff"])
+        create_job(self.recruiter)
+
+    def list_jobs(self):
+        response = self.client.get(
+            JOB_LIST_ENDPOINT, headers=get_auth_headers(self.recruiter)
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def get_metrics(self):
+        self.client.force_login(self.staff)
+        response = self.client.get("/metrics")
+        self.client.logout()
+        self.assertEqual(response.status_code, 200)
+        return response.content.decode()
+
+    def get_slow_requests(self):
+        self.client.force_login(self.staff)
+        response = self.client.get("/metrics/slow-requests")
+        self.client.logout()
+        self.assertEqual(response.status_code, 200)
+        return response.json()["results"]
+
+    def test_metrics_are_staff_only_without_token(self):
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+        self.assertEqual(self.client.get("/metrics/slow-requests").status_code, 403)
+
+        self.client.force_login(self.recruiter)
+        self.assertEqual(self.client.get("/metrics").status_code, 403)
+
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
+        self.assertEqual(self.client.get("/metrics/slow-requests").status_code, 200)
+
+    @override_settings(PROFILING_METRICS_TOKEN="scrape-token")
+    def test_metrics_token(self):
+        self.assertEqual(
+            self.client.get(
+                "/metrics", headers={"Authorization": "Bearer wrong"}
+            ).status_code,
+            403,
+        )
+        self.assertEqual(
+            self.client.get(
+                "/metrics", headers={"Authorization": "Bearer scrape-token"}
+            ).status_code,
+            200,
+        )
+        self.client.force_login(self.staff)
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1)
+    def test_metrics_output(self):
+        self.list_jobs()
+        self.list_jobs()
+
+        metrics = self.get_metrics()
+        labels = 'method="GET",endpoint="/api/v1/job-info/job/"'
+        self.assertIn(
+            f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2', metrics
+        )
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 2", metrics)
+        self.assertIn(f'http_responses_total{{{labels},status="200"}} 2', metrics)
+        self.assertIn(f"http_sampled_requests_total{{{labels}}} 2", metrics)
+        queries = [
+            line
+            for line in metrics.splitlines()
+            if line.startswith(f"http_sampled_queries_total{{{labels}}}")
+        ]
+        self.assertEqual(len(queries), 1)
+        self.assertGreater(int(queries[0].split()[-1]), 0)
+
+    @override_settings(PROFILING_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_only_timed(self):
+        self.list_jobs()
+
+        metrics = self.get_metrics()
+        labels = 'method="GET",endpoint="/api/v1/job-info/job/"'
+        self.assertIn(f"http_request_duration_seconds_count{{{labels}}} 1", metrics)
+        self.assertNotIn("http_sampled_requests_total{", metrics)
+
+    @override_settings(PROFILING_SAMPLE_RATE=1, PROFILING_SLOW_REQUEST_MS=0)
+    def test_slow_request_log(self):
+        self.list_jobs()
+
+        entry = self.get_slow_requests()[0]
+        self.assertEqual(entry["method"], "GET")
+        self.assertEqual(entry["path"], JOB_LIST_ENDPOINT)
+        self.assertEqual(entry["endpoint"], "/api/v1/job-info/job/")
+        self.assertEqual(entry["view"], "job-list")
+        self.assertEqual(entry["status"], 200)
+        self.assertTrue(entry["sampled"])
+        self.assertGreater(entry["sql_count"], 0)
+        self.assertIsNotNone(entry["sql_ms"])
+
+    @override_settings(PROFILING_SAMPLE_RATE=0, PROFILING_SLOW_REQUEST_MS=0)
+    def test_unsampled_slow_request_has_no_sql_totals(self):
+        self.list_jobs()
+
+        entry = self.get_slow_requests()[0]
+        self.assertEqual(entry["path"], JOB_LIST_ENDPOINT)
+        self.assertFalse(entry["sampled"])
+        self.assertIsNone(entry["sql_count"])
+        self.assertIsNone(entry["sql_ms"])
+
+    @override_settings(PROFILING_SAMPLE_RATE=0, PROFILING_SLOW_REQUEST_MS=0)
+    def test_slow_requests_are_newest_first(self):
+        self.list_jobs()
+        self.client.get("/metrics")
+
+        paths = [entry["path"] for entry in self.get_slow_requests()]
+        self.assertEqual(paths[:2], ["/metrics", JOB_LIST_ENDPOINT])
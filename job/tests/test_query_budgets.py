@@ -0,0 +1,348 @@
+import os
+import tempfile
+import uuid
+
+from django.contrib import admin
+from django.contrib.auth.tokens import default_token_generator
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.choices import ApplicationStatusChoices, StatusChoices
+from job.imports import get_report_path
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+from shared.query_budget import enforce_query_budgets, query_budget
+
+AUTH_PREFIX = "/api/v1/auth/"
+# Jobs per recruiter and candidates applying to each job
+SEEDED_ROWS = 4
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class SeededTestCase(TestCase):
+    """
+    Two recruiters with several jobs, each with several applications.
+
+    Lists hold more than one row, so a query per row breaks the budget.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.job = create_job(self.recruiter)
+        self.application = apply_to_job(self.job, self.candidate)
+
+        candidates = [self.candidate] + [
+            create_user(f"candidate-{number}") for number in range(1, SEEDED_ROWS)
+        ]
+        other_recruiter = create_user("other-recruiter", role=UserRole.RECRUITER)
+        for recruiter in (self.recruiter, other_recruiter):
+            for number in range(SEEDED_ROWS):
+                if recruiter == self.recruiter and number == 0:
+                    job = self.job
+                else:
+                    job = create_job(
+                        recruiter, title=f"{recruiter.username} job {number}"
+                    )
+                for candidate in candidates:
+                    if (job, candidate) != (self.job, self.candidate):
+                        apply_to_job(job, candidate)
+
+
+@enforce_query_budgets()
+class JWTQueryBudgetTests(SeededTestCase):
+    """
+    Call every action with a declared query budget, with a cold cache.
+
+    ``enforce_query_budgets`` fails any request that runs more queries than
+    its view allows.
+    """
+
+    def login(self, user):
+        self.headers = get_auth_headers(user)
+
+    def request(self, method, path, data=None, user=None, **kwargs):
+        headers = {}
+        if user is not None:
+            self.login(user)
+            headers.update(self.headers)
+        if method == "post":
+            headers["Idempotency-Key"] = uuid.uuid4().hex
+        if data is not None and "content_type" not in kwargs:
+            kwargs["content_type"] = "application/json"
+        response = getattr(self.client, method)(path, data, headers=headers, **kwargs)
+        self.assertLess(response.status_code, 400, getattr(response, "data", None))
+        return response
+
+    def get_job_data(self, title="Data Engineer"):
+        return {
+            "title": title,
+            "description": "Own the data pipelines",
+            "location": "Berlin",
+            "salary": 80_000,
+            "deadline": self.job.deadline.isoformat(),
+        }
+
+    # Jobs
+
+    def test_job_list(self):
+        self.request("get", f"{JOB_PREFIX}job/", user=self.candidate)
+
+    def test_job_retrieve(self):
+        self.request("get", f"{JOB_PREFIX}job/{self.job.pk}/", user=self.recruiter)
+
+    def test_job_create(self):
+        self.request(
+            "post", f"{JOB_PREFIX}job/", self.get_job_data(), user=self.recruiter
+        )
+
+    def test_job_update(self):
+        self.request(
+            "put",
+            f"{JOB_PREFIX}job/{self.job.pk}/",
+            self.get_job_data(),
+            user=self.recruiter,
+        )
+
+    def test_job_partial_update(self):
+        self.request(
+            "patch",
+            f"{JOB_PREFIX}job/{self.job.pk}/",
+            {"status": StatusChoices.CLOSED},
+            user=self.recruiter,
+        )
+
+    def test_job_destroy(self):
+        self.request("delete", f"{JOB_PREFIX}job/{self.job.pk}/", user=self.recruiter)
+
+    def test_job_bulk_create(self):
+        self.request(
+            "post",
+            f"{JOB_PREFIX}job/bulk/",
+            [self.get_job_data(f"Data Engineer {number}") for number in range(3)],
+            user=self.recruiter,
+        )
+
+    def test_job_import_errors(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(JOB_IMPORT_REPORT_DIR=directory):
+                report_id = uuid.uuid4().hex
+                path = get_report_path(self.recruiter.pk, report_id)
+                os.makedirs(os.path.dirname(path))
+                with open(path, "w") as report:
+                    report.write("row,title,errors\n")
+
+                response = self.request(
+                    "get",
+                    f"{JOB_PREFIX}job/import/{report_id}/errors/",
+                    user=self.recruiter,
+                )
+                b"".join(response.streaming_content)
+
+    def test_job_search(self):
+        self.request("get", f"{JOB_PREFIX}job/search/?q=engineer", user=self.candidate)
+
+    def test_job_applications(self):
+        self.request(
+            "get",
+            f"{JOB_PREFIX}job/{self.job.pk}/applications/",
+            user=self.recruiter,
+        )
+
+    # Applications
+
+    def test_application_list(self):
+        self.request("get", f"{JOB_PREFIX}application/", user=self.recruiter)
+
+    def test_application_retrieve(self):
+        self.request(
+            "get",
+            f"{JOB_PREFIX}application/{self.application.pk}/",
+            user=self.recruiter,
+        )
+
+    def test_application_create(self):
+        job = create_job(self.recruiter, title="Site Reliability Engineer")
+        self.request(
+            "post",
+            f"{JOB_PREFIX}application/",
+            {"job": str(job.pk)},
+            user=self.candidate,
+        )
+
+    def test_application_update(self):
+        self.request(
+            "put",
+            f"{JOB_PREFIX}application/{self.application.pk}/",
+            {"status": ApplicationStatusChoices.HIRED},
+            user=self.recruiter,
+        )
+
+    def test_application_partial_update(self):
+        self.request(
+            "patch",
+            f"{JOB_PREFIX}application/{self.application.pk}/",
+            {"status": ApplicationStatusChoices.REJECTED},
+            user=self.recruiter,
+        )
+
+    def test_application_destroy(self):
+        self.request(
+            "delete",
+            f"{JOB_PREFIX}application/{self.application.pk}/",
+            user=self.recruiter,
+        )
+
+    def test_application_mine(self):
+        self.request("get", f"{JOB_PREFIX}application/mine/", user=self.candidate)
+
+    def test_application_export(self):
+        response = self.request(
+            "get", f"{JOB_PREFIX}application/export/", user=self.recruiter
+        )
+        b"".join(response.streaming_content)
+
+    def test_application_bulk_status(self):
+        self.request(
+            "post",
+            f"{JOB_PREFIX}application/bulk-status/",
+            {
+                "application_ids": [str(self.application.pk)],
+                "status": ApplicationStatusChoices.HIRED,
+            },
+            user=self.recruiter,
+        )
+
+    def test_recruiter_dashboard(self):
+        self.request("get", f"{JOB_PREFIX}recruiter-dashboard/", user=self.recruiter)
+
+    # Users
+
+    def test_user_list(self):
+        self.request("get", f"{AUTH_PREFIX}people/register/", user=self.candidate)
+
+    def test_user_retrieve(self):
+        self.request(
+            "get",
+            f"{AUTH_PREFIX}people/register/{self.candidate.pk}/",
+            user=self.candidate,
+        )
+
+    def test_user_create(self):
+        self.request(
+            "post",
+            f"{AUTH_PREFIX}people/register/",
+            {
+                "username": "new-recruiter",
+                "first_name": "New",
+                "last_name": "Recruiter",
+                "email": "new-recruiter@example.com",
+                "role": UserRole.RECRUITER,
+                "password": "Str0ng-passw0rd",
+                "confirm_password": "Str0ng-passw0rd",
+            },
+        )
+
+    def test_user_update(self):
+        self.request(
+            "put",
+            f"{AUTH_PREFIX}people/register/{self.candidate.pk}/",
+            {
+                "username": "candidate",
+                "first_name": "Renamed",
+                "last_name": "Tester",
+                "email": "candidate@example.com",
+                "role": UserRole.CANDIDATE,
+            },
+            user=self.candidate,
+        )
+
+    def test_user_partial_update(self):
+        self.request(
+            "patch",
+            f"{AUTH_PREFIX}people/register/{self.candidate.pk}/",
+            {"first_name": "Renamed"},
+            user=self.candidate,
+        )
+
+    def test_user_destroy(self):
+        self.request(
+            "delete",
+            f"{AUTH_PREFIX}people/register/{self.recruiter.pk}/",
+            user=self.recruiter,
+        )
+
+    def test_forget_password(self):
+        self.request(
+            "post",
+            f"{AUTH_PREFIX}password/forget-password/",
+            {"email": self.candidate.email},
+            user=self.candidate,
+        )
+
+    def test_reset_password(self):
+        uid = urlsafe_base64_encode(force_bytes(self.candidate.pk))
+        token = default_token_generator.make_token(self.candidate)
+        self.request(
+            "post",
+            f"{AUTH_PREFIX}password/reset-password/?uid={uid}&token={token}",
+            {"new_password": "N3w-passw0rd", "confirm_password": "N3w-passw0rd"},
+        )
+
+
+class SessionQueryBudgetTests(JWTQueryBudgetTests):
+    """The same calls authenticated with a session instead of a token"""
+
+    def login(self, user):
+        self.client.force_login(user)
+        self.headers = {}
+
+
+class AdminChangelistQueryBudgetTests(SeededTestCase):
+    """Admin changelists run a fixed number of queries, however many rows"""
+
+    # Including the session and user lookups of the logged-in superuser
+    budgets = {
+        "core.user": 4,
+        "core.userprofile": 5,
+        "core.outboxemail": 4,
+        "core.idempotencyrecord": 4,
+        "job.job": 5,
+        "job.jobapplication": 5,
+        "job.recruiterstats": 4,
+    }
+
+    def setUp(self):
+        super().setUp()
+        superuser = create_user("admin")
+        superuser.is_staff = superuser.is_superuser = True
+        superuser.save(update_fields=["is_staff", "is_superuser"])
+        self.client.force_login(superuser)
+
+    def test_every_changelist_has_a_budget(self):
+        labels = {
+            model._meta.label_lower
+            for model in admin.site._registry
+            if model._meta.app_label in ("core", "job")
+        }
+        self.assertEqual(labels, set(self.budgets))
+
+    def test_changelists(self):
+        for label, budget in self.budgets.items():
+            app_label, model_name = label.split(".")
+            path = reverse(f"admin:{app_label}_{model_name}_changelist")
+            with self.subTest(changelist=label):
+                with query_budget(budget, label=f"{label} changelist"):
+                    response = self.client.get(path)
+                self.assertEqual(response.status_code, 200)
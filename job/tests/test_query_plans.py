@@ -0,0 +1,47 @@
+import itertools
+from datetime import date
+
+from django.db import connection
+from django.test import TestCase
+
+from job.choices import StatusChoices
+from job.rest.views.job import JobViewSet
+
+FILTERS = {
+    "location": "Remote",
+    "salary__gte": 50_000,
+    "salary__lte": 150_000,
+    "status": StatusChoices.OPEN,
+    "deadline__gte": date(2026, 1, 1),
+    "deadline__lte": date(2026, 12, 31),
+}
+
+
+class JobListQueryPlanTests(TestCase):
+    """Every job list filter combination is served by an index on ``Job``"""
+
+    def get_plan(self, filters):
+        queryset = JobViewSet.queryset.filter(**filters)
+        # A page as JobCursorPagination fetches it
+        sql, params = queryset[:21].query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[-1] for row in cursor.fetchall()]
+
+    def test_no_full_table_scan(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Query plans are checked on SQLite")
+
+        for size in range(len(FILTERS) + 1):
+            for names in itertools.combinations(FILTERS, size):
+                filters = {name: FILTERS[name] for name in names}
+                plan = self.get_plan(filters)
+                with self.subTest(filters=list(filters)):
+                    scans = [
+                        step
+                        for step in plan
+                        if step.startswith("SCAN job_job")
+                        and "USING INDEX" not in step
+                        and "USING COVERING INDEX" not in step
+                    ]
+                    self.assertEqual(scans, [], "\n".join(plan))
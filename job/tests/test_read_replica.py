@@ -0,0 +1,149 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test import TransactionTestCase, override_settings
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.choices import StatusChoices
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+from shared.db_router import get_pin_key
+from shared.db_wrappers import context_execute_wrapper
+
+REPLICA = "test-replica"
+ROUTER = "shared.db_router.ReadReplicaRouter"
+MIDDLEWARE = "shared.db_router.ReadReplicaMiddleware"
+
+
+class QueryLog:
+    """``execute_wrapper`` noting the database alias and SQL of each query"""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((context["connection"].alias, sql))
+        return execute(sql, params, many, context)
+
+    def aliases(self, table):
+        """Aliases of the queries reading from ``table``, joins aside"""
+        return {alias for alias, sql in self.queries if f'FROM "{table}"' in sql}
+
+    def writes(self):
+        return [
+            (alias, sql)
+            for alias, sql in self.queries
+            if sql.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE"))
+        ]
+
+
+@override_settings(
+    PASSWORD_HASHERS=FAST_PASSWORD_HASHERS,
+    DATABASE_READ_ALIAS=REPLICA,
+    DATABASE_ROUTERS=[ROUTER],
+    MIDDLEWARE=[
+        *settings.MIDDLEWARE[:1],
+        MIDDLEWARE,
+        *(name for name in settings.MIDDLEWARE[1:] if name != MIDDLEWARE),
+    ],
+)
+class ReadReplicaRoutingTests(TransactionTestCase):
+    """
+    Route through a replica alias opened on the test database.
+
+    The alias is a second connection to the same file, like a TEST MIRROR of
+    default, so routed reads see committed rows and every query names its
+    alias.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Added once the test runner has set up the test database, which it
+        # would otherwise try to create for the unknown alias
+        default = connections[DEFAULT_DB_ALIAS].settings_dict
+        connections.settings[REPLICA] = {
+            **default,
+            "TEST": {**default["TEST"], "MIRROR": DEFAULT_DB_ALIAS},
+        }
+        cls.addClassCleanup(cls.remove_replica)
+        cls.databases = {DEFAULT_DB_ALIAS, REPLICA}
+        super().setUpClass()
+
+    @classmethod
+    def remove_replica(cls):
+        connections[REPLICA].close()
+        del connections[REPLICA]
+        del connections.settings[REPLICA]
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.job = create_job(self.recruiter)
+        apply_to_job(self.job, self.candidate)
+
+    def request(self, method, path, user, data=None):
+        log = QueryLog()
+        with context_execute_wrapper(log):
+            response = getattr(self.client, method)(
+                path,
+                data,
+                content_type="application/json",
+                headers=get_auth_headers(user),
+            )
+        self.assertLess(response.status_code, 400, getattr(response, "data", None))
+        return log
+
+    def test_reads_go_to_the_replica(self):
+        log = self.request("get", f"{JOB_PREFIX}application/", self.recruiter)
+
+        self.assertEqual(log.aliases("job_jobapplication"), {REPLICA})
+        # Users are not replicated reads
+        self.assertEqual(log.aliases("core_user"), {DEFAULT_DB_ALIAS})
+
+    def test_writes_go_to_the_primary(self):
+        log = self.request(
+            "patch",
+            f"{JOB_PREFIX}job/{self.job.pk}/",
+            self.recruiter,
+            {"status": StatusChoices.CLOSED},
+        )
+
+        self.assertTrue(log.writes())
+        self.assertEqual({alias for alias, _ in log.writes()}, {DEFAULT_DB_ALIAS})
+        # An unsafe request never reads from the replica
+        self.assertEqual(log.aliases("job_job"), {DEFAULT_DB_ALIAS})
+
+    def test_writer_is_pinned_to_the_primary(self):
+        self.request(
+            "patch",
+            f"{JOB_PREFIX}job/{self.job.pk}/",
+            self.recruiter,
+            {"status": StatusChoices.CLOSED},
+        )
+        self.assertTrue(cache.get(get_pin_key(self.recruiter.pk)))
+
+        log = self.request("get", f"{JOB_PREFIX}application/", self.recruiter)
+        self.assertEqual(log.aliases("job_jobapplication"), {DEFAULT_DB_ALIAS})
+
+        # Other users keep reading from the replica
+        log = self.request("get", f"{JOB_PREFIX}application/mine/", self.candidate)
+        self.assertEqual(log.aliases("job_jobapplication"), {REPLICA})
+
+    def test_pin_expires(self):
+        self.request(
+            "patch",
+            f"{JOB_PREFIX}job/{self.job.pk}/",
+            self.recruiter,
+            {"status": StatusChoices.CLOSED},
+        )
+        cache.delete(get_pin_key(self.recruiter.pk))
+
+        log = self.request("get", f"{JOB_PREFIX}application/", self.recruiter)
+        self.assertEqual(log.aliases("job_jobapplication"), {REPLICA})
@@ -0,0 +1,149 @@
+import io
+import tempfile
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from core.choices import UserRole
+from job.bulk import JobBulkCreator
+from job.imports import JobImporter
+from job.models import JobSearchDocument
+from job.search import search_documents
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class JobSearchTests(TestCase):
+    """The full-text index follows every write path and ranks by relevance"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.headers = get_auth_headers(create_user("candidate"))
+
+    def search(self, query, **params):
+        response = self.client.get(
+            f"{JOB_PREFIX}job/search/",
+            {"q": query, **params},
+            headers=self.headers,
+        )
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def search_titles(self, query):
+        return [job["title"] for job in self.search(query)["results"]]
+
+    def test_create_is_indexed(self):
+        create_job(self.recruiter, title="Rust Developer")
+
+        self.assertEqual(self.search_titles("rust"), ["Rust Developer"])
+
+    def test_update_reindexes(self):
+        job = create_job(self.recruiter, title="Rust Developer")
+        job.title = "Go Developer"
+        job.save()
+
+        self.assertEqual(self.search_titles("rust"), [])
+        self.assertEqual(self.search_titles("go"), ["Go Developer"])
+
+    def test_delete_unindexes(self):
+        job = create_job(self.recruiter, title="Rust Developer")
+        job.delete()
+
+        self.assertEqual(self.search_titles("rust"), [])
+        self.assertFalse(JobSearchDocument.objects.exists())
+
+    def test_recruiter_delete_unindexes(self):
+        create_job(self.recruiter, title="Rust Developer")
+        create_job(self.recruiter, title="Rust Engineer")
+        other = create_user("other", role=UserRole.RECRUITER)
+        create_job(other, title="Rust Architect")
+        self.recruiter.delete()
+
+        self.assertEqual(self.search_titles("rust"), ["Rust Architect"])
+        self.assertEqual(JobSearchDocument.objects.count(), 1)
+        self.assertEqual(len(search_documents("rust")), 1)
+
+    def test_bulk_create_is_indexed(self):
+        creator = JobBulkCreator(self.recruiter)
+        entries = [
+            creator.validate(index, data)
+            for index, data in enumerate(
+                [
+                    {
+                        "title": f"Kotlin Developer {number}",
+                        "description": "Mobile apps",
+                        "location": "Lisbon",
+                        "salary": 70_000,
+                        "deadline": "2099-01-01",
+                    }
+                    for number in range(3)
+                ]
+            )
+        ]
+        creator.save(entries)
+
+        self.assertEqual(len(self.search_titles("kotlin")), 3)
+        self.assertEqual(len(self.search_titles("lisbon")), 3)
+
+    def test_import_is_indexed(self):
+        upload = io.BytesIO(
+            b"title,description,location,salary,deadline\n"
+            b"Elixir Developer,Realtime systems,Remote,75000,2099-01-01\n"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            with override_settings(JOB_IMPORT_REPORT_DIR=directory):
+                JobImporter(self.recruiter).run(upload, "csv")
+
+        self.assertEqual(self.search_titles("elixir realtime"), ["Elixir Developer"])
+
+    def test_title_matches_rank_first(self):
+        create_job(
+            self.recruiter,
+            title="Platform Engineer",
+            description="Keep the python services running",
+        )
+        create_job(self.recruiter, title="Python Engineer")
+
+        self.assertEqual(
+            self.search_titles("python"), ["Python Engineer", "Platform Engineer"]
+        )
+
+    def test_every_term_must_match(self):
+        create_job(self.recruiter, title="Python Engineer", location="Berlin")
+        create_job(self.recruiter, title="Python Developer", location="Paris")
+
+        self.assertEqual(self.search_titles("python berlin"), ["Python Engineer"])
+        # Quotes are escaped rather than parsed as FTS5 syntax
+        self.assertEqual(self.search_titles('python "berlin'), ["Python Engineer"])
+
+    def test_pagination_walks_every_match_once(self):
+        for number in range(5):
+            create_job(self.recruiter, title=f"Scala Engineer {number}")
+        create_job(self.recruiter, title="Haskell Engineer")
+
+        titles, previous_pages = [], []
+        page = self.search("scala", page_size=2)
+        while True:
+            previous_pages.append(page)
+            titles.extend(job["title"] for job in page["results"])
+            if not page["next"]:
+                break
+            page = self.client.get(page["next"], headers=self.headers).data
+
+        self.assertEqual(sorted(titles), [f"Scala Engineer {n}" for n in range(5)])
+        previous = self.client.get(page["previous"], headers=self.headers).data
+        self.assertEqual(previous["results"], previous_pages[-2]["results"])
+
+    def test_query_is_required(self):
+        response = self.client.get(
+            f"{JOB_PREFIX}job/search/", {"q": "  "}, headers=self.headers
+        )
+
+        self.assertEqual(response.status_code, 400)
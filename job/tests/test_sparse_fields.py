@@ -0,0 +1,117 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class SparseFieldsetTests(TestCase):
+    """``?fields=`` narrows both the payload and the columns read"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.candidate = create_user("candidate")
+        self.job = create_job(self.recruiter)
+        self.application = apply_to_job(self.job, self.candidate)
+
+    def get(self, url, user=None):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                url, headers=get_auth_headers(user or self.recruiter)
+            )
+        self.queries = [query["sql"] for query in queries]
+        return response
+
+    def get_job_selects(self):
+        return [
+            sql
+            for sql in self.queries
+            if sql.startswith("SELECT") and 'FROM "job_job"' in sql
+        ]
+
+    def test_list_projection(self):
+        response = self.get(f"{JOB_PREFIX}job/?fields=title,salary", self.candidate)
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            response.data["results"], [{"title": "Backend Engineer", "salary": 90_000}]
+        )
+        (select,) = self.get_job_selects()
+        self.assertNotIn('"description"', select)
+        # Pagination and ETag columns are loaded even when not requested
+        self.assertIn('"deadline"', select)
+        self.assertIn('"updated_at"', select)
+
+    def test_detail_projection(self):
+        response = self.get(f"{JOB_PREFIX}job/{self.job.pk}/?fields=location")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data, {"location": "Remote"})
+        (select,) = self.get_job_selects()
+        self.assertNotIn('"description"', select)
+
+    def test_search_projection(self):
+        response = self.get(
+            f"{JOB_PREFIX}job/search/?q=backend&fields=title", self.candidate
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["results"], [{"title": "Backend Engineer"}])
+
+    def test_related_fields_are_primary_keys_without_a_join(self):
+        response = self.get(f"{JOB_PREFIX}application/?fields=job,candidate")
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            response.data["results"],
+            [{"job": self.job.pk, "candidate": self.candidate.pk}],
+        )
+        self.assertFalse(self.get_job_selects())
+        self.assertFalse(any("JOIN" in sql for sql in self.queries))
+
+    def test_mine_projection(self):
+        response = self.get(
+            f"{JOB_PREFIX}application/mine/?fields=job_title,status", self.candidate
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(
+            response.data["results"],
+            [{"job_title": "Backend Engineer", "status": "APPLIED"}],
+        )
+
+    def test_unknown_fields_are_rejected(self):
+        for fields in ["title,bogus", "job.title", "recruiter__email"]:
+            with self.subTest(fields=fields):
+                response = self.get(f"{JOB_PREFIX}job/?fields={fields}")
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("fields", response.data)
+
+    def test_blank_fields_return_everything(self):
+        response = self.get(f"{JOB_PREFIX}job/{self.job.pk}/?fields=")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("description", response.data)
+
+    def test_writes_ignore_fields(self):
+        response = self.client.patch(
+            f"{JOB_PREFIX}job/{self.job.pk}/?fields=title",
+            {"salary": 95_000},
+            content_type="application/json",
+            headers=get_auth_headers(self.recruiter),
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(response.data["salary"], 95_000)
+        self.assertIn("description", response.data)
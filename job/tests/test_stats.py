@@ -0,0 +1,182 @@
+import uuid
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.choices import UserRole
+from job.applications import apply_to_job
+from job.bulk import JobBulkCreator
+from job.choices import ApplicationStatusChoices, StatusChoices
+from job.expiry import close_expired_jobs
+from job.models import Job, RecruiterStats
+from job.stats import rebuild_recruiter_stats
+from job.tests.utils import (
+    FAST_PASSWORD_HASHERS,
+    JOB_PREFIX,
+    create_job,
+    create_user,
+    get_auth_headers,
+)
+
+STATS_FIELDS = [
+    "total_published_job",
+    "total_closed_job",
+    "total_candidate_application",
+    "total_candidate_hired",
+    "total_candidate_rejected",
+]
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class RecruiterStatsTests(TestCase):
+    """Incremental counters always agree with a rebuild from the tables"""
+
+    def setUp(self):
+        cache.clear()
+        self.recruiter = create_user("recruiter", role=UserRole.RECRUITER)
+        self.other_recruiter = create_user("other", role=UserRole.RECRUITER)
+        self.candidates = [create_user(f"candidate{number}") for number in range(3)]
+        self.job = create_job(self.recruiter)
+        self.other_job = create_job(self.other_recruiter, title="Data Engineer")
+
+    def get_stats(self, recruiter):
+        return RecruiterStats.objects.values(*STATS_FIELDS).get(recruiter=recruiter)
+
+    def assertStatsMatchRebuild(self, **expected):
+        counted = {
+            recruiter.pk: self.get_stats(recruiter)
+            for recruiter in [self.recruiter, self.other_recruiter]
+        }
+        rebuild_recruiter_stats()
+        for recruiter in [self.recruiter, self.other_recruiter]:
+            with self.subTest(recruiter=recruiter.username):
+                self.assertEqual(counted[recruiter.pk], self.get_stats(recruiter))
+        for field, value in expected.items():
+            self.assertEqual(counted[self.recruiter.pk][field], value, field)
+
+    def apply_all(self, job):
+        return [apply_to_job(job, candidate) for candidate in self.candidates]
+
+    def test_create(self):
+        create_job(self.recruiter, title="Closed Job", status=StatusChoices.CLOSED)
+        self.apply_all(self.job)
+
+        self.assertStatsMatchRebuild(
+            total_published_job=2, total_closed_job=1, total_candidate_application=3
+        )
+
+    def test_close_and_reopen(self):
+        self.job.status = StatusChoices.CLOSED
+        self.job.save()
+        self.assertStatsMatchRebuild(total_closed_job=1)
+
+        self.job.status = StatusChoices.OPEN
+        self.job.save(update_fields=["status"])
+        self.assertStatsMatchRebuild(total_closed_job=0)
+
+    def test_application_status_changes(self):
+        hired, rejected, moved = self.apply_all(self.job)
+        hired.status = ApplicationStatusChoices.HIRED
+        hired.save()
+        rejected.status = ApplicationStatusChoices.REJECTED
+        rejected.save()
+        moved.status = ApplicationStatusChoices.HIRED
+        moved.save()
+        moved.status = ApplicationStatusChoices.REJECTED
+        moved.save()
+
+        self.assertStatsMatchRebuild(
+            total_candidate_hired=1, total_candidate_rejected=2
+        )
+
+    def test_delete(self):
+        hired, *_ = self.apply_all(self.job)
+        hired.status = ApplicationStatusChoices.HIRED
+        hired.save()
+        hired.delete()
+        self.assertStatsMatchRebuild(
+            total_candidate_application=2, total_candidate_hired=0
+        )
+
+        self.job.delete()
+        self.assertStatsMatchRebuild(
+            total_published_job=0, total_candidate_application=0
+        )
+
+    def test_delete_cascades(self):
+        hired, *_ = self.apply_all(self.other_job)
+        hired.status = ApplicationStatusChoices.HIRED
+        hired.save()
+        self.apply_all(self.job)
+        Job.objects.filter(pk=self.job.pk).delete()
+        self.assertStatsMatchRebuild(
+            total_published_job=0, total_candidate_application=0
+        )
+
+        # The other recruiter loses the applications of a deleted candidate
+        self.candidates[0].delete()
+        self.assertStatsMatchRebuild()
+        self.assertEqual(
+            self.get_stats(self.other_recruiter)["total_candidate_application"], 2
+        )
+        self.assertEqual(
+            self.get_stats(self.other_recruiter)["total_candidate_hired"], 0
+        )
+
+    def test_bulk_create(self):
+        creator = JobBulkCreator(self.recruiter)
+        deadline = (timezone.now().date() + timedelta(days=30)).isoformat()
+        entries = [
+            creator.validate(
+                number,
+                {
+                    "title": f"Bulk Job {number}",
+                    "description": "Created in bulk",
+                    "location": "Remote",
+                    "salary": 60_000,
+                    "deadline": deadline,
+                    "status": status,
+                },
+            )
+            for number, status in enumerate(
+                [StatusChoices.OPEN, StatusChoices.OPEN, StatusChoices.CLOSED]
+            )
+        ]
+        creator.save(entries)
+
+        self.assertStatsMatchRebuild(total_published_job=4, total_closed_job=1)
+
+    def test_bulk_status(self):
+        applications = self.apply_all(self.job)
+        applications[0].status = ApplicationStatusChoices.REJECTED
+        applications[0].save()
+
+        response = self.client.post(
+            f"{JOB_PREFIX}application/bulk-status/",
+            {
+                "application_ids": [str(a.pk) for a in applications],
+                "status": ApplicationStatusChoices.HIRED,
+            },
+            content_type="application/json",
+            headers={
+                **get_auth_headers(self.recruiter),
+                "Idempotency-Key": uuid.uuid4().hex,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertStatsMatchRebuild(
+            total_candidate_hired=3, total_candidate_rejected=0
+        )
+
+    def test_expiry(self):
+        yesterday = timezone.now().date() - timedelta(days=1)
+        expired = create_job(self.recruiter, title="Expired Job")
+        Job.objects.filter(pk__in=[expired.pk, self.other_job.pk]).update(
+            deadline=yesterday
+        )
+
+        self.assertEqual(close_expired_jobs(), 2)
+        self.assertStatsMatchRebuild(total_published_job=2, total_closed_job=1)
@@ -0,0 +1,39 @@
+from datetime import timedelta
+
+from django.utils import timezone
+
+from auth.rest.serializers.token import UserClaimsTokenObtainPairSerializer
+from core.choices import UserRole
+from core.models import User
+from job.models import Job
+
+JOB_PREFIX = "/api/v1/job-info/"
+# Hashing is not what the tests measure
+FAST_PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+
+def create_user(name, role=UserRole.CANDIDATE):
+    return User.objects.create_user(
+        email=f"{name}@example.com",
+        first_name=name.title(),
+        last_name="Tester",
+        password="Str0ng-passw0rd",
+        username=name,
+        role=role,
+    )
+
+
+def create_job(recruiter, title="Backend Engineer", **fields):
+    fields = {
+        "description": "Build and run the job site API",
+        "location": "Remote",
+        "salary": 90_000,
+        "deadline": timezone.now().date() + timedelta(days=30),
+        **fields,
+    }
+    return Job.objects.create(recruiter=recruiter, title=title, **fields)
+
+
+def get_auth_headers(user):
+    token = UserClaimsTokenObtainPairSerializer.get_token(user).access_token
+    return {"authorization": f"Bearer {token}"}
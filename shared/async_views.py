@@ -0,0 +1,93 @@
+from django.contrib.auth.models import AnonymousUser
+from django.http import JsonResponse
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class AsyncAPIView(View):
+    """
+    Minimal async counterpart of DRF's ``APIView`` for read-only endpoints.
+
+    DRF views are synchronous, so under ASGI every request would be handed to
+    a worker thread. This view keeps the whole request on the event loop:
+    authentication classes must provide ``aauthenticate`` and permission
+    classes ``ahas_permission`` / ``ahas_object_permission``.
+    """
+
+    authentication_classes = ()
+    permission_classes = ()
+    http_method_names = ["get", "head", "options"]
+
+    async def dispatch(self, request, *args, **kwargs):
+        request = Request(request)
+        self.request = request
+        try:
+            await self.initial(request)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(
+                    self, request.method.lower(), self.http_method_not_allowed
+                )
+            else:
+                handler = self.http_method_not_allowed
+            return await handler(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self.handle_exception(exc)
+
+    async def initial(self, request):
+        request.user = AnonymousUser()
+        for authentication_class in self.authentication_classes:
+            authenticator = authentication_class()
+            result = await authenticator.aauthenticate(request)
+            if result is not None:
+                request.user, request.auth = result
+                request._authenticator = authenticator
+                break
+
+        for permission_class in self.permission_classes:
+            if not await permission_class().ahas_permission(request, self):
+                self.permission_denied(request)
+
+    async def check_object_permissions(self, request, obj):
+        for permission_class in self.permission_classes:
+            permission = permission_class()
+            if not await permission.ahas_object_permission(request, self, obj):
+                self.permission_denied(request)
+
+    def permission_denied(self, request):
+        if not request.user.is_authenticated:
+            raise exceptions.NotAuthenticated()
+        raise exceptions.PermissionDenied()
+
+    def handle_exception(self, exc):
+        data = (
+            exc.detail
+            if isinstance(exc.detail, (list, dict))
+            else {"detail": exc.detail}
+        )
+        response = self.json_response(data, status=exc.status_code)
+
+        if (
+            isinstance(
+                exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)
+            )
+            and self.authentication_classes
+        ):
+            response.status_code = status.HTTP_401_UNAUTHORIZED
+            response["WWW-Authenticate"] = self.authentication_classes[
+                0
+            ]().authenticate_header(self.request)
+        return response
+
+    def json_response(self, data, status=status.HTTP_200_OK):
+        return JsonResponse(data, status=status, encoder=JSONEncoder, safe=False)
+
+    def get_paginated_response(self, paginator, data):
+        return self.json_response(
+            {
+                "next": paginator.get_next_link(),
+                "previous": paginator.get_previous_link(),
+                "results": data,
+            }
+        )
@@ -1,8 +1,7 @@
-import uuid
-
 from django.db import models
 
 from shared.choices import StatusChoices
+from shared.ids import uuid7
 
 from dirtyfields import DirtyFieldsMixin
 from typing import Iterable
@@ -12,7 +11,7 @@ class BaseModel(DirtyFieldsMixin, models.Model):
     """Base class for all other models."""
 
     uid = models.UUIDField(
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         db_index=True,
         unique=True,
@@ -0,0 +1,103 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+
+# Backends whose entries other worker processes can't see
+PROCESS_LOCAL_CACHES = {
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+}
+
+
+class VersionedCache:
+    """
+    Cache namespace invalidated by bumping a single version counter.
+
+    Every key embeds the current version, so one ``incr`` makes all earlier
+    entries unreachable and they simply expire. A missing version (never set
+    or evicted) is seeded from the clock, so it never goes back to a number
+    whose entries may still be cached. Hits and misses are counted in the
+    cache itself so they can be reported across processes sharing it.
+    """
+
+    def __init__(self, namespace, timeout=300, alias="default"):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.alias = alias
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def is_process_local(self):
+        return settings.CACHES[self.alias]["BACKEND"] in PROCESS_LOCAL_CACHES
+
+    def _key(self, name):
+        return f"{self.namespace}:{name}"
+
+    def get_version(self):
+        version = self.cache.get(self._key("version"))
+        if version is None:
+            seed = time.time_ns()
+            self.cache.add(self._key("version"), seed, timeout=None)
+            version = self.cache.get(self._key("version"), seed)
+        return version
+
+    def bump(self):
+        """Invalidate every entry of the namespace"""
+        try:
+            return self.cache.incr(self._key("version"))
+        except ValueError:
+            # Evicted: a fresh clock seed is past every version handed out
+            return self.get_version()
+
+    def make_key(self, *parts):
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()
+        return self._key(f"v{self.get_version()}:{digest}")
+
+    def get(self, key):
+        value = self.cache.get(key)
+        self._count("hits" if value is not None else "misses")
+        return value
+
+    def set(self, key, value):
+        self.cache.set(key, value, timeout=self.timeout)
+
+    def _count(self, name):
+        key = self._key(name)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            if not self.cache.add(key, 1, timeout=None):
+                self.cache.incr(key)
+
+    def stats(self):
+        hits = self.cache.get(self._key("hits"), 0)
+        misses = self.cache.get(self._key("misses"), 0)
+        return {
+            "version": self.get_version(),
+            "hits": hits,
+            "misses": misses,
+        }
+
+
+def check_shared_cache(app_configs, **kwargs):
+    """Versioned cache bumps must reach every worker process"""
+    backend = settings.CACHES[DEFAULT_CACHE_ALIAS]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Warning(
+            f"{backend} is local to each process, so a job list cached by one "
+            "worker is not invalidated by writes served by another, and "
+            "job_cache_stats only sees its own empty cache.",
+            hint="Set CACHE_BACKEND to a shared cache such as Redis, Memcached, "
+            "the database or the file-based cache when running several worker "
+            "processes.",
+            id="cache.W001",
+        )
+    ]
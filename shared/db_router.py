@@ -0,0 +1,154 @@
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core import checks
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from shared.cache import PROCESS_LOCAL_CACHES
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# Apps whose reads may be served by the replica: jobs, applications, search
+# documents and the dashboard stats
+READ_APP_LABELS = {"job"}
+PIN_KEY_PREFIX = "db-pin"
+
+routing_state = ContextVar("routing_state", default=None)
+
+
+def get_pin_key(user_id):
+    return f"{PIN_KEY_PREFIX}:{user_id}"
+
+
+class RoutingState:
+    """Routing decisions of the request being served"""
+
+    def __init__(self, request):
+        self.request = request
+        self.safe = request.method in SAFE_METHODS
+        self.wrote = False
+        self.pinned = None
+
+    def get_user_id(self):
+        # DRF copies the authenticated user onto the Django request
+        user = getattr(self.request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user.pk
+
+    def is_pinned(self):
+        """Whether this user wrote recently enough for the replica to lag"""
+        if self.pinned is None:
+            user_id = self.get_user_id()
+            if user_id is None:
+                return False
+            self.pinned = bool(cache.get(get_pin_key(user_id)))
+        return self.pinned
+
+
+class ReadReplicaRouter:
+    """
+    Send reads of the job app to ``DATABASE_READ_ALIAS`` during safe requests.
+
+    Everything else, writes, and any request outside ``ReadReplicaMiddleware``
+    (management commands, the outbox worker) use the primary. Once a request
+    writes to the job app it reads from the primary until it ends, and
+    ``ReadReplicaMiddleware`` keeps the user on the primary for
+    ``READ_YOUR_WRITES_SECONDS`` more after any request that wrote.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = routing_state.get()
+        if state is None or not state.safe or state.wrote:
+            return None
+        if model._meta.app_label not in READ_APP_LABELS:
+            return None
+        if settings.DATABASE_READ_ALIAS not in connections:
+            return None
+        if state.is_pinned():
+            return DEFAULT_DB_ALIAS
+        return settings.DATABASE_READ_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = routing_state.get()
+        if state is not None and model._meta.app_label in READ_APP_LABELS:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        aliases = {DEFAULT_DB_ALIAS, settings.DATABASE_READ_ALIAS}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+
+class ReadReplicaMiddleware:
+    """Track the routing state of each request for ``ReadReplicaRouter``"""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        state = RoutingState(request)
+        token = routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routing_state.reset(token)
+
+        if self.should_pin(state, response):
+            user_id = state.get_user_id()
+            if user_id is not None:
+                cache.set(get_pin_key(user_id), True, settings.READ_YOUR_WRITES_SECONDS)
+        return response
+
+    async def __acall__(self, request):
+        state = RoutingState(request)
+        token = routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            routing_state.reset(token)
+
+        if self.should_pin(state, response):
+            # A lazy session user may still have to be loaded from the database
+            user_id = await sync_to_async(state.get_user_id)()
+            if user_id is not None:
+                await cache.aset(
+                    get_pin_key(user_id), True, settings.READ_YOUR_WRITES_SECONDS
+                )
+        return response
+
+    def should_pin(self, state, response):
+        # Raw SQL writes bypass the router, so successful unsafe requests count
+        # as writes too
+        return state.wrote or (not state.safe and response.status_code < 400)
+
+
+def check_pin_cache(app_configs, **kwargs):
+    """Read-your-writes pins must be visible to every worker process"""
+    if settings.DATABASE_READ_ALIAS not in settings.DATABASES:
+        return []
+    backend = settings.CACHES[DEFAULT_CACHE_ALIAS]["BACKEND"]
+    if backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Error(
+            f"{backend} is local to each process, so a user who just wrote is "
+            "only kept on the primary by the worker that served the write.",
+            hint="Set CACHE_BACKEND to a shared cache such as Redis, Memcached, "
+            "the database or the file-based cache when DATABASE_REPLICA_NAME "
+            "is set.",
+            id="db_router.E001",
+        )
+    ]
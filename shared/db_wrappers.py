@@ -0,0 +1,36 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+active_wrappers = ContextVar("active_wrappers", default=())
+
+
+def run_active_wrappers(execute, sql, params, many, context):
+    """Execute wrapper calling the wrappers installed for the current context"""
+    # Nested like Django's own execute_wrappers, the first one is outermost
+    for wrapper in reversed(active_wrappers.get()):
+        execute = partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install_context_wrappers(connection):
+    # First in the list, so a connection opened inside Django's own
+    # execute_wrapper() block does not pop it when the block ends
+    if run_active_wrappers not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, run_active_wrappers)
+
+
+@contextmanager
+def context_execute_wrapper(wrapper):
+    """
+    Install ``wrapper`` on every database connection for the current context.
+
+    Unlike ``connection.execute_wrapper()``, which only sees the connection of
+    the calling thread, this follows the request into ``sync_to_async``
+    threads, so it also works in async middleware and views under ASGI.
+    """
+    token = active_wrappers.set((*active_wrappers.get(), wrapper))
+    try:
+        yield wrapper
+    finally:
+        active_wrappers.reset(token)
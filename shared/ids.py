@@ -0,0 +1,51 @@
+import os
+import threading
+import time
+import uuid
+
+_lock = threading.Lock()
+_last_timestamp = 0
+_counter = 0
+
+COUNTER_MAX = 0xFFF
+
+
+def uuid7():
+    """
+    Return a time-ordered UUID version 7 (RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds, followed by a 12-bit
+    counter and 62 random bits, so each id sorts after the UUIDv7 ids made
+    before it. The counter starts at a random value every millisecond and
+    keeps ids generated by one process strictly increasing, borrowing the
+    next millisecond on overflow.
+
+    Random UUIDv4 ids cover the whole key range, and current UUIDv7 ids start
+    with ``019`` or ``01a`` in hex, so they sort before almost every v4 id
+    rather than after them. In a table that already holds v4 ids, new rows
+    land among the old ones and ordering by id is not chronological. Inserts
+    only append at the end of the index in tables without v4 ids.
+    """
+    global _last_timestamp, _counter
+
+    with _lock:
+        timestamp = time.time_ns() // 1_000_000
+        if timestamp > _last_timestamp:
+            _last_timestamp = timestamp
+            # Leave half of the range for ids generated in the same millisecond
+            _counter = int.from_bytes(os.urandom(2), "big") & (COUNTER_MAX >> 1)
+        else:
+            _counter += 1
+            if _counter > COUNTER_MAX:
+                _last_timestamp += 1
+                _counter = 0
+        timestamp, counter = _last_timestamp, _counter
+
+    random_bits = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    return uuid.UUID(
+        int=(timestamp << 80)
+        | (0x7 << 76)
+        | (counter << 64)
+        | (0b10 << 62)
+        | random_bits
+    )
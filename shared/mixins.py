@@ -0,0 +1,153 @@
+import hashlib
+
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from shared.serializers import DynamicFieldsModelSerializer
+
+
+class ConditionalGetMixin:
+    """
+    ETag and Last-Modified validators for ``list`` and ``retrieve``.
+
+    Validators are derived from the primary keys and ``updated_at`` of the rows
+    being returned, so a matching ``If-None-Match`` is answered with 304 before
+    anything is serialized. List pages only send an ETag: a page can change
+    through deletes without its newest timestamp moving.
+    """
+
+    last_modified_field = "updated_at"
+
+    def get_etag(self, rows, *extra):
+        digest = hashlib.sha256()
+        digest.update(self.request.get_full_path().encode())
+        for part in extra:
+            digest.update(f"|{part}".encode())
+        for row in rows:
+            modified = getattr(row, self.last_modified_field)
+            digest.update(f"|{row.pk}@{modified.isoformat()}".encode())
+        digest.update(f"|{len(rows)}".encode())
+        return quote_etag(digest.hexdigest())
+
+    def get_last_modified(self, rows):
+        timestamps = [getattr(row, self.last_modified_field) for row in rows]
+        return int(max(timestamps).timestamp()) if timestamps else None
+
+    def conditional_response(self, request, etag, last_modified=None):
+        """Return a 304/412 response if the request preconditions say so"""
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            self.set_validators(response, etag, last_modified)
+        return response
+
+    def set_validators(self, response, etag, last_modified=None):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        paginated = page is not None
+
+        if paginated:
+            etag = self.get_etag(
+                page, self.paginator.get_next_link(), self.paginator.get_previous_link()
+            )
+        else:
+            page = list(queryset)
+            etag = self.get_etag(page)
+
+        not_modified = self.conditional_response(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(page, many=True)
+        if paginated:
+            response = self.get_paginated_response(serializer.data)
+        else:
+            response = Response(serializer.data)
+        return self.set_validators(response, etag)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        etag = self.get_etag([instance])
+        last_modified = self.get_last_modified([instance])
+
+        not_modified = self.conditional_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(instance)
+        return self.set_validators(Response(serializer.data), etag, last_modified)
+
+
+class SparseFieldsetMixin:
+    """
+    ``?fields=a,b`` support for read actions.
+
+    The serializer only emits the requested fields and the queryset is
+    narrowed with ``.only()``, so unused columns are never read. Columns the
+    view itself needs (primary key, pagination keys, ``updated_at``) are always
+    loaded.
+    """
+
+    fields_query_param = "fields"
+
+    def get_sparse_fields(self):
+        if not hasattr(self, "_sparse_fields"):
+            self._sparse_fields = self._parse_sparse_fields()
+        return self._sparse_fields
+
+    def _parse_sparse_fields(self):
+        if self.request is None or self.request.method not in SAFE_METHODS:
+            return None
+        raw = self.request.query_params.get(self.fields_query_param)
+        if not raw:
+            return None
+
+        serializer_class = self.get_serializer_class()
+        if not issubclass(serializer_class, DynamicFieldsModelSerializer):
+            return None
+
+        fields = [name.strip() for name in raw.split(",") if name.strip()]
+        unknown = set(fields) - set(serializer_class().fields)
+        if unknown:
+            raise ValidationError(
+                {
+                    self.fields_query_param: f"Unknown field(s): {', '.join(sorted(unknown))}"
+                }
+            )
+        return fields
+
+    def get_projection(self, model, fields):
+        """Model columns to load for the requested serializer fields"""
+        serializer_fields = self.get_serializer_class()().fields
+        names = {model._meta.pk.name}
+        names.update(getattr(self.paginator, "ordering", ()))
+        names.add(getattr(self, "last_modified_field", ""))
+        names.update(serializer_fields[field].source for field in fields)
+
+        concrete = {field.name for field in model._meta.concrete_fields}
+        return sorted(name for name in names if name in concrete)
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        return queryset.select_related(None).only(
+            *self.get_projection(queryset.model, fields)
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs.setdefault("fields", fields)
+        return super().get_serializer(*args, **kwargs)
@@ -0,0 +1,194 @@
+import base64
+import binascii
+import json
+from functools import reduce
+from operator import or_
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opaque cursor pagination keyed on a unique, ordered tuple of columns.
+
+    Every page is fetched with a ``WHERE (a, b) > (x, y) ORDER BY a, b LIMIT n``
+    style query, so the cost of a page does not depend on its depth and no
+    ``COUNT(*)`` is ever issued. ``ordering`` must end with a unique column and
+    should be backed by a composite index in the same order.
+    """
+
+    ordering = ()
+    page_size = api_settings.PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self.get_page_queryset(queryset, request)
+        return self.finish_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """Async variant of ``paginate_queryset`` for async views"""
+        queryset = self.get_page_queryset(queryset, request)
+        return self.finish_page([obj async for obj in queryset.aiterator()])
+
+    def get_page_queryset(self, queryset, request):
+        """Order, filter past the cursor and slice one look-ahead row"""
+        self.model = queryset.model
+        position, reverse = self.start_page(request)
+
+        order = [f"-{field}" for field in self.ordering] if reverse else self.ordering
+        queryset = queryset.order_by(*order)
+        if position is not None:
+            queryset = queryset.filter(self.build_keyset_filter(position, reverse))
+        return queryset[: self.page_size + 1]
+
+    def start_page(self, request):
+        """Read page size and cursor from the request"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.base_url = request.build_absolute_uri()
+
+        position, reverse = self.decode_cursor(request)
+        self.has_cursor = position is not None
+        self.reverse = reverse
+        return position, reverse
+
+    def finish_page(self, results):
+        """Trim the look-ahead row and restore ascending order"""
+        self.has_more = len(results) > self.page_size
+        self.page = results[: self.page_size]
+        if self.reverse:
+            self.page.reverse()
+        return self.page
+
+    def get_page_size(self, request):
+        if self.page_size_query_param:
+            try:
+                size = int(request.query_params[self.page_size_query_param])
+                if size > 0:
+                    return min(size, self.max_page_size)
+            except (KeyError, ValueError):
+                pass
+        return self.page_size
+
+    def build_keyset_filter(self, position, reverse):
+        """Build ``(a > x) OR (a = x AND b > y) ...`` for the ordering tuple"""
+        lookup = "lt" if reverse else "gt"
+        clauses = []
+        for index, field in enumerate(self.ordering):
+            conditions = {
+                name: value
+                for name, value in zip(self.ordering[:index], position[:index])
+            }
+            conditions[f"{field}__{lookup}"] = position[index]
+            clauses.append(Q(**conditions))
+        return reduce(or_, clauses)
+
+    def parse_position(self, raw_position):
+        """Convert decoded cursor values back to python values"""
+        return [
+            self.model._meta.get_field(field).to_python(value)
+            for field, value in zip(self.ordering, raw_position)
+        ]
+
+    def get_position(self, instance):
+        return [getattr(instance, field) for field in self.ordering]
+
+    def encode_cursor(self, position, reverse):
+        payload = {
+            "p": [
+                value.isoformat() if hasattr(value, "isoformat") else str(value)
+                for value in position
+            ],
+            "r": reverse,
+        }
+        token = base64.urlsafe_b64encode(
+            json.dumps(payload, separators=(",", ":")).encode()
+        ).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode()))
+            raw_position = payload["p"]
+            reverse = bool(payload.get("r", False))
+            if len(raw_position) != len(self.ordering):
+                raise ValueError
+            position = self.parse_position(raw_position)
+        except (
+            AttributeError,
+            KeyError,
+            TypeError,
+            ValueError,
+            binascii.Error,
+            DjangoValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_next_link(self):
+        if not self.page:
+            return None
+        if not self.reverse and not self.has_more:
+            return None
+        return self.encode_cursor(self.get_position(self.page[-1]), False)
+
+    def get_previous_link(self):
+        if not self.page:
+            return None
+        if self.reverse and not self.has_more:
+            return None
+        if not self.reverse and not self.has_cursor:
+            return None
+        return self.encode_cursor(self.get_position(self.page[0]), True)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Number of results to return per page.",
+                "schema": {"type": "integer"},
+            },
+        ]
@@ -0,0 +1,299 @@
+import hmac
+import random
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import nullcontext
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse
+from django.utils import timezone
+from django.views.decorators.http import require_GET
+
+from shared.db_wrappers import context_execute_wrapper
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+UNMATCHED_ENDPOINT = "<unmatched>"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+NAMED_GROUP = re.compile(r"\(\?P<(\w+)>[^)]*\)")
+
+
+class QueryTimer:
+    """``execute_wrapper`` counting the queries of a request and their time"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class LatencyHistogram:
+    """Request durations in seconds, bucketed like a Prometheus histogram"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        # One slot per bucket plus the +Inf overflow, made cumulative on render
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+
+    def cumulative_counts(self):
+        running = 0
+        for count in self.counts:
+            running += count
+            yield running
+
+
+def escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(**labels):
+    return ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items())
+
+
+class RequestMetrics:
+    """
+    In-memory request metrics of the current process.
+
+    Holds a latency histogram per endpoint, request counters per status, the
+    SQL totals of sampled requests and a ring buffer of the most recent slow
+    requests. Every worker process keeps its own metrics, so each one is
+    scraped separately.
+    """
+
+    def __init__(self, buckets, slow_request_limit):
+        self.buckets = sorted(buckets)
+        self.lock = threading.Lock()
+        self.histograms = {}
+        self.responses = {}
+        self.sampled = {}
+        self.slow_requests = deque(maxlen=slow_request_limit)
+
+    def record(self, method, endpoint, status_code, duration, timer=None):
+        key = (method, endpoint)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = LatencyHistogram(self.buckets)
+            histogram.observe(duration)
+
+            status_key = (method, endpoint, status_code)
+            self.responses[status_key] = self.responses.get(status_key, 0) + 1
+
+            if timer is not None:
+                requests, queries, query_time = self.sampled.get(key, (0, 0, 0.0))
+                self.sampled[key] = (
+                    requests + 1,
+                    queries + timer.count,
+                    query_time + timer.duration,
+                )
+
+    def add_slow_request(self, entry):
+        with self.lock:
+            self.slow_requests.append(entry)
+
+    def get_slow_requests(self):
+        """Slow requests, newest first"""
+        with self.lock:
+            return list(reversed(self.slow_requests))
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.responses.clear()
+            self.sampled.clear()
+            self.slow_requests.clear()
+
+    def render(self):
+        """The metrics in the Prometheus text exposition format"""
+        with self.lock:
+            histograms = {
+                key: (list(histogram.cumulative_counts()), histogram.total)
+                for key, histogram in self.histograms.items()
+            }
+            responses = dict(self.responses)
+            sampled = dict(self.sampled)
+
+        lines = [
+            "# HELP http_request_duration_seconds Request latency per endpoint",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        for (method, endpoint), (counts, total) in sorted(histograms.items()):
+            labels = format_labels(method=method, endpoint=endpoint)
+            for bound, count in zip([*self.buckets, "+Inf"], counts):
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} '
+                    f"{count}"
+                )
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {total}")
+            lines.append(
+                f"http_request_duration_seconds_count{{{labels}}} {counts[-1]}"
+            )
+
+        lines += [
+            "# HELP http_responses_total Responses per endpoint and status code",
+            "# TYPE http_responses_total counter",
+        ]
+        for (method, endpoint, status_code), count in sorted(responses.items()):
+            labels = format_labels(method=method, endpoint=endpoint, status=status_code)
+            lines.append(f"http_responses_total{{{labels}}} {count}")
+
+        lines += [
+            "# HELP http_sampled_requests_total Requests profiled for SQL",
+            "# TYPE http_sampled_requests_total counter",
+            "# HELP http_sampled_queries_total SQL queries of sampled requests",
+            "# TYPE http_sampled_queries_total counter",
+            "# HELP http_sampled_query_seconds_total SQL time of sampled requests",
+            "# TYPE http_sampled_query_seconds_total counter",
+        ]
+        for (method, endpoint), (requests, queries, query_time) in sorted(
+            sampled.items()
+        ):
+            labels = format_labels(method=method, endpoint=endpoint)
+            lines.append(f"http_sampled_requests_total{{{labels}}} {requests}")
+            lines.append(f"http_sampled_queries_total{{{labels}}} {queries}")
+            lines.append(f"http_sampled_query_seconds_total{{{labels}}} {query_time}")
+
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics(
+    settings.PROFILING_LATENCY_BUCKETS, settings.PROFILING_SLOW_REQUEST_LIMIT
+)
+
+
+def get_endpoint(match):
+    """
+    The route of a resolved request, e.g. ``/api/v1/job-info/job/<pk>/``.
+
+    Routes instead of paths keep the number of label values bounded. Regex
+    routes from the DRF routers are turned into the same placeholder form.
+    """
+    route = NAMED_GROUP.sub(r"<\1>", match.route).replace("^", "").replace("$", "")
+    return f"/{route}"
+
+
+class ProfilingMiddleware:
+    """
+    Sampled, in-memory request profiling.
+
+    Every request is timed into the latency histogram of its endpoint, which
+    costs a clock read and a dict update. SQL is only counted and timed for a
+    ``PROFILING_SAMPLE_RATE`` share of requests. Requests slower than
+    ``PROFILING_SLOW_REQUEST_MS`` are kept in a ring buffer. Whether a request
+    is slow is only known once it finished, so only sampled slow requests
+    carry SQL totals, the others have ``sql_count`` and ``sql_ms`` set to None.
+    Nothing is written to the database.
+
+    Streaming responses are timed until the view returns, not while streaming.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            # Stay on the event loop under ASGI instead of a sync thread
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        timer = self.get_timer()
+        started = time.perf_counter()
+        with self.time_queries(timer):
+            response = self.get_response(request)
+        duration = time.perf_counter() - started
+
+        self.record(request, response, duration, timer)
+        return response
+
+    async def __acall__(self, request):
+        timer = self.get_timer()
+        started = time.perf_counter()
+        with self.time_queries(timer):
+            response = await self.get_response(request)
+        duration = time.perf_counter() - started
+
+        self.record(request, response, duration, timer)
+        return response
+
+    def get_timer(self):
+        """A ``QueryTimer`` for sampled requests, None for the others"""
+        if random.random() < settings.PROFILING_SAMPLE_RATE:
+            return QueryTimer()
+        return None
+
+    def time_queries(self, timer):
+        return context_execute_wrapper(timer) if timer else nullcontext()
+
+    def record(self, request, response, duration, timer):
+        match = request.resolver_match
+        endpoint = get_endpoint(match) if match else UNMATCHED_ENDPOINT
+        method = request.method if request.method in METHODS else "OTHER"
+        request_metrics.record(method, endpoint, response.status_code, duration, timer)
+
+        if duration * 1000 < settings.PROFILING_SLOW_REQUEST_MS:
+            return
+        request_metrics.add_slow_request(
+            {
+                "timestamp": timezone.now().isoformat(),
+                "method": method,
+                "path": request.path,
+                "endpoint": endpoint,
+                "view": match.view_name if match else None,
+                "status": response.status_code,
+                "sampled": timer is not None,
+                "duration_ms": round(duration * 1000, 3),
+                "sql_count": timer.count if timer else None,
+                "sql_ms": round(timer.duration * 1000, 3) if timer else None,
+            }
+        )
+
+
+def has_metrics_access(request):
+    """
+    A request bearing ``PROFILING_METRICS_TOKEN``, or one of a staff user.
+
+    Without a configured token only logged-in staff users can read metrics.
+    """
+    token = settings.PROFILING_METRICS_TOKEN
+    if token and hmac.compare_digest(
+        request.headers.get("Authorization", ""), f"Bearer {token}"
+    ):
+        return True
+    user = getattr(request, "user", None)
+    return bool(user and user.is_active and user.is_staff)
+
+
+@require_GET
+def metrics_view(request):
+    """Prometheus scrape endpoint"""
+    if not has_metrics_access(request):
+        return HttpResponseForbidden()
+    return HttpResponse(request_metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@require_GET
+def slow_requests_view(request):
+    """Recent slow requests of this process, newest first"""
+    if not has_metrics_access(request):
+        return HttpResponseForbidden()
+    return JsonResponse({"results": request_metrics.get_slow_requests()})
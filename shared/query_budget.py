@@ -0,0 +1,185 @@
+import logging
+import re
+from collections import Counter
+from contextlib import ContextDecorator
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from shared.db_wrappers import context_execute_wrapper
+
+logger = logging.getLogger(__name__)
+
+QUERY_COUNT_HEADER = "X-Query-Count"
+# Transaction bookkeeping says nothing about N+1 problems
+IGNORED_STATEMENTS = ("SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN", "COMMIT")
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+WHITESPACE = re.compile(r"\s+")
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised when code runs more queries than its declared budget"""
+
+
+def get_sql_shape(sql):
+    """SQL with its literals and placeholder lists folded, to group repeats"""
+    shape = STRING_LITERAL.sub("?", sql)
+    shape = NUMBER.sub("?", shape).replace("%s", "?")
+    shape = PLACEHOLDER_LIST.sub("(...)", shape)
+    return WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryRecorder:
+    """``execute_wrapper`` recording the SQL run while it is installed"""
+
+    def __init__(self, using=None):
+        self.using = using
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        if self.using is None or context["connection"].alias == self.using:
+            if not sql.lstrip().upper().startswith(IGNORED_STATEMENTS):
+                # Skip the profiler's own bookkeeping when Silk is enabled
+                if '"silk_' not in sql:
+                    self.queries.append(sql)
+        return execute(sql, params, many, context)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def record(self):
+        return context_execute_wrapper(self)
+
+    def duplicates(self):
+        """``(shape, count)`` of every SQL shape run more than once, most first"""
+        counts = Counter(get_sql_shape(sql) for sql in self.queries)
+        return [(shape, count) for shape, count in counts.most_common() if count > 1]
+
+    def describe(self, label, budget):
+        lines = [f"{label} ran {self.count} queries, the budget is {budget}"]
+        duplicates = self.duplicates()
+        if duplicates:
+            lines.append("Repeated queries:")
+            lines += [f"  {count}x {shape}" for shape, count in duplicates]
+        return "\n".join(lines)
+
+
+class query_budget(ContextDecorator):
+    """
+    Fail with ``QueryBudgetExceeded`` when the block runs more than ``max_queries``.
+
+    Works as a context manager and as a test decorator::
+
+        @query_budget(4)
+        def test_job_list(self):
+            self.client.get("/api/v1/job-info/job/")
+    """
+
+    def __init__(self, max_queries, using=None, label="Block"):
+        self.max_queries = max_queries
+        self.using = using
+        self.label = label
+
+    def __enter__(self):
+        self.recorder = QueryRecorder(self.using)
+        self.recording = self.recorder.record()
+        return self.recording.__enter__()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recording.__exit__(exc_type, exc_value, traceback)
+        if exc_type is None and self.recorder.count > self.max_queries:
+            raise QueryBudgetExceeded(
+                self.recorder.describe(self.label, self.max_queries)
+            )
+        return False
+
+
+def enforce_query_budgets():
+    """
+    Test decorator failing every request that exceeds its view's query budget.
+
+    Installs ``QueryBudgetMiddleware`` in raising mode, for use on test
+    classes or methods that call the API through the test client.
+    """
+    # Imported here so the middleware does not load the test framework
+    from django.test.utils import override_settings
+
+    middleware = "shared.query_budget.QueryBudgetMiddleware"
+    return override_settings(
+        MIDDLEWARE=[
+            *(name for name in settings.MIDDLEWARE if name != middleware),
+            middleware,
+        ],
+        QUERY_BUDGET_RAISE=True,
+    )
+
+
+def get_view_budget(view_func, method):
+    """
+    The ``(name, budget)`` declared for a request, or None.
+
+    Views declare budgets in ``query_budgets``, keyed by action for viewsets
+    and by lowercase HTTP method for plain API views.
+    """
+    view_class = getattr(view_func, "cls", None)
+    budgets = getattr(view_class, "query_budgets", None)
+    if not budgets:
+        return None
+
+    actions = getattr(view_func, "actions", None)
+    name = actions.get(method.lower()) if actions else method.lower()
+    if name not in budgets:
+        return None
+    return f"{view_class.__name__}.{name}", budgets[name]
+
+
+class QueryBudgetMiddleware:
+    """
+    Development middleware counting the queries of each request.
+
+    The count is sent in the ``X-Query-Count`` header. Requests over the
+    ``query_budgets`` of their view are logged with their repeated SQL shapes,
+    or raise ``QueryBudgetExceeded`` when ``QUERY_BUDGET_RAISE`` is set.
+    Queries run while a streaming response is consumed are not counted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        recorder = QueryRecorder()
+        with recorder.record():
+            response = self.get_response(request)
+        return self.check(request, response, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        with recorder.record():
+            response = await self.get_response(request)
+        return self.check(request, response, recorder)
+
+    def check(self, request, response, recorder):
+        response[QUERY_COUNT_HEADER] = str(recorder.count)
+
+        # Looked up from the resolved view rather than in process_view, which
+        # Django would run in a sync thread under ASGI
+        match = request.resolver_match
+        view_budget = get_view_budget(match.func, request.method) if match else None
+        if view_budget is not None and recorder.count > view_budget[1]:
+            message = recorder.describe(*view_budget)
+            if settings.QUERY_BUDGET_RAISE:
+                raise QueryBudgetExceeded(message)
+            logger.warning(message)
+        return response